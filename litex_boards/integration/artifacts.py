@@ -0,0 +1,226 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Artifact Stores.
+#
+# Build artifacts (bitstreams, reports, generated software) are published to/fetched from an artifact
+# store, shared between builds of a checkout or between the machines of a build farm. Stores are
+# flat key/value stores of files (names like "objects/ab/ab12...", "entries/<key>.json"):
+# - LocalArtifactStore : Local/NFS directory. Writes are atomic (temporary file + rename) so that
+#                        concurrent builders never see partial files; size can be bounded, least
+#                        recently used files being evicted first.
+# - HTTPArtifactStore  : HTTP server (GET/PUT), ex: ArtifactHTTPServer serving a LocalArtifactStore:
+#                        $ python3 -m litex_boards.tools.artifacts serve /srv/artifacts --max-size=100G
+#
+# Stores are selected by location: a directory or an http(s):// URL.
+
+import os
+import re
+import tempfile
+import threading
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Helpers ------------------------------------------------------------------------------------------
+
+_size_units = {"": 1, "K": 1e3, "M": 1e6, "G": 1e9, "T": 1e12}
+
+def parse_size(size):
+    """Parse a size in bytes (ex: 1000, "500M", "20G"), None for unbounded."""
+    if size is None or isinstance(size, int):
+        return size
+    m = re.match(r"^\s*([\d.]+)\s*([KMGT]?)B?\s*$", size.upper())
+    if m is None:
+        raise ValueError("Invalid size: {}".format(size))
+    return int(float(m.group(1))*_size_units[m.group(2)])
+
+def get_umask():
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+# Names are relative paths of lowercase letters/digits/dots/underscores/dashes components.
+_name_re = re.compile(r"^[a-z0-9_\-]+(\.[a-z0-9_\-]+)*(/[a-z0-9_\-]+(\.[a-z0-9_\-]+)*)*$")
+
+def check_name(name):
+    if not _name_re.match(name):
+        raise ValueError("Invalid artifact name: {}".format(name))
+    return name
+
+# Artifact Store -----------------------------------------------------------------------------------
+
+class ArtifactStore:
+    def get(self, name):
+        """Return the content (bytes) of an artifact, None if not in the store."""
+        raise NotImplementedError
+
+    def put(self, name, content):
+        """Publish an artifact (replacing the previous one, if any)."""
+        raise NotImplementedError
+
+    def evict(self):
+        """Evict artifacts to keep the store to its maximum size (when bounded)."""
+        pass
+
+# Local Artifact Store -----------------------------------------------------------------------------
+
+class LocalArtifactStore(ArtifactStore):
+    def __init__(self, directory, max_size=None):
+        self.directory = directory
+        self.max_size  = parse_size(max_size)
+
+    def get_filename(self, name):
+        return os.path.join(self.directory, *check_name(name).split("/"))
+
+    def get(self, name):
+        filename = self.get_filename(name)
+        try:
+            with open(filename, "rb") as f:
+                content = f.read()
+        except FileNotFoundError:
+            return None # Not published or evicted.
+        # Mark as recently used (mtime: atime is often not updated).
+        try:
+            os.utime(filename)
+        except OSError:
+            pass # Read-only store or artifact of another user.
+        return content
+
+    def put(self, name, content):
+        filename = self.get_filename(name)
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(filename), prefix=".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            # Readable by the other users of a shared store (mkstemp creates files with 0600 mode).
+            os.chmod(tmp, 0o666 & ~get_umask())
+            os.replace(tmp, filename)
+        except BaseException:
+            os.remove(tmp)
+            raise
+
+    def get_files(self):
+        """Return (mtime, size, filename) of the artifacts in the store."""
+        files = []
+        for root, dirs, filenames in os.walk(self.directory):
+            for filename in filenames:
+                if filename.startswith("."):
+                    continue # Temporary files of in-progress writes.
+                filename = os.path.join(root, filename)
+                try:
+                    s = os.stat(filename)
+                except FileNotFoundError:
+                    continue # Evicted concurrently.
+                files.append((s.st_mtime, s.st_size, filename))
+        return files
+
+    def get_size(self):
+        return sum(size for _, size, _ in self.get_files())
+
+    def evict(self):
+        if self.max_size is None:
+            return []
+        files   = sorted(self.get_files())
+        size    = sum(size for _, size, _ in files)
+        evicted = []
+        for mtime, file_size, filename in files:
+            if size <= self.max_size:
+                break
+            try:
+                os.remove(filename)
+                evicted.append(filename)
+            except FileNotFoundError:
+                pass # Evicted concurrently.
+            size -= file_size
+        return evicted
+
+# HTTP Artifact Store ------------------------------------------------------------------------------
+
+class HTTPArtifactStore(ArtifactStore):
+    def __init__(self, url, timeout=60):
+        self.url     = url.rstrip("/")
+        self.timeout = timeout
+
+    def get(self, name):
+        url = "{}/{}".format(self.url, check_name(name))
+        try:
+            with urllib.request.urlopen(url, timeout=self.timeout) as r:
+                return r.read()
+        except urllib.error.HTTPError as e:
+            if e.code == 404:
+                return None
+            raise
+
+    def put(self, name, content):
+        url = "{}/{}".format(self.url, check_name(name))
+        request = urllib.request.Request(url, data=content, method="PUT")
+        with urllib.request.urlopen(request, timeout=self.timeout):
+            pass
+
+# HTTP Server --------------------------------------------------------------------------------------
+
+class ArtifactHTTPRequestHandler(BaseHTTPRequestHandler):
+    # Serves self.server.store (GET/PUT).
+    def _get_name(self):
+        try:
+            return check_name(self.path.lstrip("/"))
+        except ValueError:
+            self.send_error(400, "Invalid artifact name")
+            return None
+
+    def do_GET(self):
+        name = self._get_name()
+        if name is None:
+            return
+        content = self.server.store.get(name)
+        if content is None:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type",   "application/octet-stream")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_PUT(self):
+        name = self._get_name()
+        if name is None:
+            return
+        content = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.server.store.put(name, content)
+        if name.startswith("entries/"):
+            # Entries are published last (after their objects): evict once per publication.
+            with self.server.evict_lock:
+                self.server.store.evict()
+        self.send_response(201)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            BaseHTTPRequestHandler.log_message(self, format, *args)
+
+
+class ArtifactHTTPServer(ThreadingHTTPServer):
+    def __init__(self, store, address=("", 8000), verbose=False):
+        self.store      = store
+        self.verbose    = verbose
+        self.evict_lock = threading.Lock()
+        ThreadingHTTPServer.__init__(self, address, ArtifactHTTPRequestHandler)
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return "http://{}:{}".format("localhost" if host in ["", "0.0.0.0"] else host, port)
+
+# Selection ----------------------------------------------------------------------------------------
+
+def get_artifact_store(location, max_size=None):
+    """Return the artifact store of a location (directory or http(s):// URL)."""
+    if re.match(r"^https?://", location):
+        return HTTPArtifactStore(location)
+    return LocalArtifactStore(location, max_size=max_size)
@@ -0,0 +1,257 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Bitstream Cache.
+#
+# Vendor toolchains are run (Toolchain.run_script) once the Verilog, constraints and build scripts
+# have been generated in the Gateware directory. The BitstreamCache hooks there and hashes:
+# - The platform sources (generated Verilog and cores' sources) and memory initialization files.
+# - The generated constraints/project files (.xdc/.lpf/.pcf/.qsf/.sdc/.tcl/etc..., that also contain
+#   the platform commands and toolchain options) and the build script.
+# - The version of the tools called by the build script.
+# Build dates (Verilog/scripts headers, SoC identifier) are not part of the hash: restored bitstreams
+# keep the identifier of the build that produced them. The BIOS build time (in ROM) is disabled by the
+# Builder when the Gateware is built with the cache (CONFIG_BIOS_NO_BUILD_TIME).
+# When the hash matches a previous build, the bitstream(s) and reports produced by this build (and the
+# generated software) are restored from the artifact store and the toolchain is not run.
+#
+# Artifact store (see litex_boards.integration.artifacts): ~/.cache/litex-boards/bitstreams by default,
+# LITEX_BOARDS_BITSTREAM_CACHE to change it (directory, NFS path or http(s):// URL, "0" or "" to
+# disable it) and LITEX_BOARDS_BITSTREAM_CACHE_SIZE to change its bound (20G by default). Layout:
+# - objects/<sha256[:2]>/<sha256> : Output files, addressed by their content.
+# - entries/<key>.json            : Output files (path relative to the output directory -> sha256) of
+#                                   a build, published after its objects.
+
+import os
+import re
+import json
+import glob
+import time
+import fnmatch
+import shutil
+import hashlib
+import logging
+import subprocess
+import http.client
+
+from litex_boards.integration.artifacts import get_artifact_store
+
+# Keys ---------------------------------------------------------------------------------------------
+
+# Generated constraints/project files (<build_name><suffix>) that are inputs of the toolchains.
+bitstream_cache_inputs = [
+    ".xdc", ".ucf", ".lpf", ".pcf", ".qsf", ".qpf", ".sdc", ".cst", ".pdc", ".ccf",
+    ".tcl", ".ys", ".prj", ".xst", ".ut", ".peri.xml", ".xml",
+]
+
+# Toolchains outputs that are stored: bitstreams and reports.
+bitstream_cache_outputs = [
+    ".bit", ".bin", ".svf", ".mcs", ".sof", ".pof", ".rbf", ".jic", ".jed", ".fs", ".asc",
+    ".config", ".hex", ".rpt", ".log",
+]
+
+# Generated software that is published with the toolchains outputs (relative to the output directory),
+# only restored on fetch: builds keep the software they generated (with their paths).
+bitstream_cache_software = [
+    "software/include/generated/*",
+    "software/bios/bios.bin",
+    "software/bios/bios.elf",
+]
+
+# Arguments returning the version of the tools (other tools are identified by their executable).
+toolchain_version_args = {
+    "vivado"        : ["-version"],
+    "yosys"         : ["-V"],
+    "nextpnr-ecp5"  : ["--version"],
+    "nextpnr-ice40" : ["--version"],
+    "nextpnr-nexus" : ["--version"],
+    "nextpnr-gowin" : ["--version"],
+    "quartus_sh"    : ["--version"],
+}
+
+_tool_versions = {}
+
+def get_tool_version(tool):
+    """Return the version of a tool (or the identity of its executable), None if not found."""
+    if tool not in _tool_versions:
+        executable = shutil.which(tool)
+        version    = None
+        if executable is not None:
+            if tool in toolchain_version_args:
+                try:
+                    version = subprocess.run([executable] + toolchain_version_args[tool],
+                        stdout=subprocess.PIPE, stderr=subprocess.STDOUT, timeout=120).stdout.decode(errors="replace")
+                except (OSError, subprocess.SubprocessError):
+                    pass
+            if version is None:
+                s = os.stat(os.path.realpath(executable))
+                version = "{} {} {}".format(os.path.realpath(executable), s.st_size, int(s.st_mtime))
+        _tool_versions[tool] = version
+    return _tool_versions[tool]
+
+def get_script_tools(script):
+    """Return the tools called by a build script."""
+    tools = []
+    with open(script, errors="replace") as f:
+        for line in f:
+            words = line.split()
+            if not words or words[0].startswith("#") or words[0] in ["REM", "set", "source", "export", "cd"]:
+                continue
+            tool = os.path.basename(words[0])
+            if tool not in tools:
+                tools.append(tool)
+    return tools
+
+_date_re      = re.compile(rb"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}")
+_byte_init_re = re.compile(rb"^([0-9a-fA-F]{2}\n)+$")
+
+def _hash_file(h, filename, build_dir):
+    # Absolute paths of the build directory and dates are normalized so that the key only depends
+    # on the design.
+    with open(filename, "rb") as f:
+        content = f.read()
+    if filename.endswith(".init") and _byte_init_re.match(content):
+        # Byte memories (ex: SoC identifier): normalize dates in their ASCII content.
+        content = bytes(int(byte, 16) for byte in content.split())
+    content = content.replace(os.path.abspath(build_dir).encode("utf-8"), b"<build-dir>")
+    content = _date_re.sub(b"<date>", content)
+    h.update(os.path.basename(filename).encode("utf-8") + b"\0")
+    h.update(hashlib.sha256(content).digest())
+
+def get_build_key(toolchain, script, build_dir=".", extra=""):
+    """Return a hash of all the inputs of a toolchain build, to be called before toolchain.run_script."""
+    h = hashlib.sha256()
+    h.update(type(toolchain).__name__.encode("utf-8") + b"\0")
+    h.update(extra.encode("utf-8") + b"\0")
+    # Sources (Verilog/VHDL/etc...) in compilation order.
+    for filename, language, library, *_ in toolchain.platform.sources:
+        h.update("{}\0{}\0".format(language, library).encode("utf-8"))
+        _hash_file(h, os.path.join(build_dir, filename), build_dir)
+    # Memory initialization files.
+    for filename in sorted(glob.glob(os.path.join(build_dir, "*.init"))):
+        _hash_file(h, filename, build_dir)
+    # Constraints/Project files.
+    for suffix in bitstream_cache_inputs:
+        filename = os.path.join(build_dir, toolchain._build_name + suffix)
+        if os.path.exists(filename):
+            _hash_file(h, filename, build_dir)
+    # Build script and Tools.
+    _hash_file(h, os.path.join(build_dir, script), build_dir)
+    for tool in get_script_tools(os.path.join(build_dir, script)):
+        h.update("{}={}\0".format(tool, get_tool_version(tool)).encode("utf-8"))
+    return h.hexdigest()
+
+def get_build_outputs(output_dir, since=0):
+    """Return the outputs (bitstreams/reports written since a time, generated software) of a build."""
+    outputs = []
+    for root, dirs, files in os.walk(output_dir):
+        dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+        for file in sorted(files):
+            filename = os.path.join(root, file)
+            if os.path.splitext(file)[1] in bitstream_cache_outputs and os.path.getmtime(filename) >= since:
+                outputs.append(os.path.relpath(filename, output_dir))
+    for pattern in bitstream_cache_software:
+        for filename in sorted(glob.glob(os.path.join(output_dir, pattern))):
+            if os.path.isfile(filename) and os.path.relpath(filename, output_dir) not in outputs:
+                outputs.append(os.path.relpath(filename, output_dir))
+    return outputs
+
+# Bitstream Cache ----------------------------------------------------------------------------------
+
+# Artifact store errors (unreachable server, timeout, unwritable/full directory) that do not fail the
+# builds: restoration is a miss and publication is skipped.
+_store_errors = (OSError, http.client.HTTPException)
+
+class BitstreamCache:
+    def __init__(self, store):
+        self.store  = store
+        self.logger = logging.getLogger("BitstreamCache")
+
+    def fetch(self, key):
+        """Return the outputs {filename: content} of a build, None on miss."""
+        try:
+            entry = json.loads(self.store.get("entries/{}.json".format(key)) or "null")
+        except ValueError:
+            entry = None # Corrupted entry.
+        if entry is None:
+            return None
+        outputs = {}
+        for filename, sha256 in entry["files"].items():
+            content = self.store.get("objects/{}/{}".format(sha256[:2], sha256))
+            if content is None or hashlib.sha256(content).hexdigest() != sha256:
+                return None # Evicted or corrupted object.
+            outputs[filename] = content
+        return outputs
+
+    def restore(self, key, output_dir, software=True):
+        """Restore the outputs of a build to the output directory, return the restored files (None on miss)."""
+        outputs = self.fetch(key)
+        if outputs is None:
+            return None
+        if not software:
+            outputs = {filename: content for filename, content in outputs.items()
+                if not any(fnmatch.fnmatch(filename, pattern) for pattern in bitstream_cache_software)}
+        for filename, content in outputs.items():
+            filename = os.path.join(output_dir, filename)
+            os.makedirs(os.path.dirname(filename), exist_ok=True)
+            with open(filename, "wb") as f:
+                f.write(content)
+        return sorted(outputs.keys())
+
+    def publish(self, key, outputs, output_dir):
+        """Publish the outputs of a build (files relative to the output directory)."""
+        files = {}
+        for filename in outputs:
+            with open(os.path.join(output_dir, filename), "rb") as f:
+                content = f.read()
+            sha256 = hashlib.sha256(content).hexdigest()
+            self.store.put("objects/{}/{}".format(sha256[:2], sha256), content)
+            files[filename] = sha256
+        # Entry is published last: it only references complete objects.
+        entry = {"files": files, "created": time.time()}
+        self.store.put("entries/{}.json".format(key), json.dumps(entry, indent=1, sort_keys=True).encode("utf-8"))
+        self.store.evict()
+
+    def run_script(self, toolchain, run_script, script, output_dir, extra_key=""):
+        """Run the toolchain's build script, or restore its outputs from the cache."""
+        key = get_build_key(toolchain, script, extra=extra_key)
+        try:
+            restored = self.restore(key, output_dir, software=False)
+        except _store_errors as e:
+            self.logger.warning("Bitstream cache restoration failed ({}), running {}.".format(
+                e, type(toolchain).__name__))
+            restored = None
+        if restored is not None:
+            print("Bitstream cache hit ({}): {} restored, skipping {}.".format(
+                key[:16], ", ".join(restored), type(toolchain).__name__))
+            return
+        start = time.time()
+        run_script(script)
+        try:
+            self.publish(key, get_build_outputs(output_dir, since=start - 1), output_dir)
+        except _store_errors as e:
+            self.logger.warning("Bitstream cache publication failed ({}), skipped.".format(e))
+
+    def wrap(self, toolchain, output_dir, extra_key=""):
+        """Hook the cache on the toolchain's build script execution (extra_key: build options not
+        in the build script)."""
+        run_script = toolchain.run_script
+        output_dir = os.path.abspath(output_dir) # Toolchains run from the Gateware directory.
+        def cached_run_script(script):
+            return self.run_script(toolchain, run_script, script, output_dir, extra_key)
+        toolchain.run_script = cached_run_script
+
+
+bitstream_cache_max_size = "20G"
+
+def get_bitstream_cache_dir():
+    return os.path.join(os.path.expanduser("~"), ".cache", "litex-boards", "bitstreams")
+
+def default_bitstream_cache(location=None, max_size=None):
+    location = location or os.environ.get("LITEX_BOARDS_BITSTREAM_CACHE", get_bitstream_cache_dir())
+    max_size = max_size or os.environ.get("LITEX_BOARDS_BITSTREAM_CACHE_SIZE", bitstream_cache_max_size)
+    if location in ["", "0"]:
+        return None
+    return BitstreamCache(get_artifact_store(location, max_size=max_size))
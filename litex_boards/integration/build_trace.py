@@ -0,0 +1,267 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Build Trace: Wall-clock time/peak memory per build stage and toolchain metrics, as JSON.
+#
+# The trace (<output-dir>/build_trace.json) has:
+# - stages : Stages of the build with their start (s, from process start), duration (s) and peak
+#            memory (bytes, null when unknown: Windows). Nested stages are named <parent>/<stage> and
+#            included in their parent. The peak memory of the Python stages is the one of the process
+#            (and its children): only known when reached during the stage (null when below the peak
+#            of a previous stage), "peak_so_far" being the peak since the process start:
+#            - elaboration                    : Python elaboration (imports, SoC creation).
+#            - finalize                       : SoC finalization.
+#            - software-headers               : Software headers/CSR map generation.
+#            - software                       : BIOS/libraries compilation.
+#            - gateware                       : Verilog/constraints/scripts generation and toolchain.
+#            - gateware/toolchain             : Toolchain's build script (or bitstream cache restore,
+#                                               "cached": true).
+#            - gateware/toolchain/<command>   : Each command of the build script (yosys, nextpnr...),
+#                                               peak memory of the command (and its children).
+#            - gateware/toolchain/vivado/<step>: Vivado's steps (synth_design, place_design...),
+#                                               from Vivado's log.
+# - metrics: Toolchain metrics: utilization ({resource: [used, available]}) and fmax per clock
+#            ({clock: [achieved, constrained]} MHz).
+#
+# The toolchain's build script commands are traced by running them through this module:
+# $ python3 build_trace.py <trace-file> <log-file> <command> [<args>...]
+
+import os
+import re
+import sys
+import json
+import time
+import glob
+import subprocess
+
+try:
+    import resource
+except ImportError:
+    resource = None # Windows: No peak memory.
+
+# Helpers ------------------------------------------------------------------------------------------
+
+def get_process_start_time():
+    """Return the start time (epoch) of the current process (Linux), None if unknown."""
+    try:
+        with open("/proc/self/stat") as f:
+            start_ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+        return time.time() - uptime + start_ticks/os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError):
+        return None
+
+def get_peak_memory(children=False):
+    """Return the peak memory (bytes) of the process (or of its waited children), None if unknown."""
+    if resource is None:
+        return None
+    rusage = resource.getrusage(resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF)
+    # ru_maxrss is in KiB on Linux, in bytes on macOS.
+    return rusage.ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+
+def _max_peak(*peaks):
+    peaks = [peak for peak in peaks if peak is not None]
+    return max(peaks) if peaks else None
+
+# Build script commands.
+
+_untraced_commands = ["set", "cd", "export", "source", ".", "call", "rem", "@echo"]
+
+# Shell keywords/compound commands: not traced (the commands they contain on their own lines are).
+_shell_keywords = ["if", "then", "else", "elif", "fi", "for", "while", "until", "do", "done", "case",
+    "esac", "select", "function", "{", "}", "[", "[[", "!", "(", ")"]
+
+def _is_traced_command(words):
+    if not words or words[0].startswith("#"):
+        return False
+    if words[0] in _untraced_commands or words[0] in _shell_keywords:
+        return False
+    # Assignments, subshells/functions definitions and case patterns.
+    return not any(c in words[0] for c in "=()")
+
+def write_traced_script(script, trace_file):
+    """Write a copy of a (bash) build script with its commands traced, return its name."""
+    tracer = [sys.executable, os.path.abspath(__file__), trace_file]
+    with open(script) as f:
+        lines = f.read().splitlines(keepends=True)
+    traced    = []
+    continued = False
+    for line in lines:
+        words = line.split()
+        if not continued and _is_traced_command(words):
+            log  = "{}_stdout.log".format(os.path.basename(words[0]))
+            line = " ".join('"{}"'.format(arg) for arg in tracer + [log]) + " " + line.lstrip()
+        continued = line.rstrip().endswith("\\")
+        traced.append(line)
+    traced_script = "trace_" + script
+    with open(traced_script, "w") as f:
+        f.write("".join(traced))
+    return traced_script
+
+def trace_command(trace_file, log_file, args):
+    """Run a command (output copied to a log file), append its time/peak memory to the trace file."""
+    start = time.time()
+    with open(log_file, "wb") as log:
+        p = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        for line in iter(p.stdout.readline, b""):
+            sys.stdout.buffer.write(line)
+            sys.stdout.flush()
+            log.write(line)
+        p.stdout.close()
+        _, status, rusage = os.wait4(p.pid, 0)
+    returncode = -os.WTERMSIG(status) if os.WIFSIGNALED(status) else os.WEXITSTATUS(status)
+    with open(trace_file, "a") as f:
+        f.write(json.dumps({
+            "command"    : os.path.basename(args[0]),
+            "log"        : log_file,
+            "start"      : start,
+            "duration"   : time.time() - start,
+            "peak"       : rusage.ru_maxrss * (1 if sys.platform == "darwin" else 1024),
+            "returncode" : returncode,
+        }) + "\n")
+    return returncode
+
+# Toolchain reports.
+
+_vivado_step_re = re.compile(r"^(\w+): Time \(s\): cpu = [\d:]+ ; elapsed = (\d+):(\d+):(\d+) \. Memory \(MB\): peak = ([\d.]+)", re.MULTILINE)
+
+def parse_vivado_steps(log):
+    """Return [(step, elapsed (s), peak memory (bytes))] from a Vivado log."""
+    return [(step, int(h)*3600 + int(m)*60 + int(s), int(float(peak)*2**20))
+        for step, h, m, s, peak in _vivado_step_re.findall(log)]
+
+def get_toolchain_metrics(gateware_dir):
+    """Return utilization/fmax metrics from the toolchain's reports/logs of a Gateware directory."""
+    # Imported here: this module also runs standalone (as the build script commands tracer).
+    from litex_boards.integration.pnr_seeds import parse_nextpnr_fmax, parse_nextpnr_utilization
+    from litex_boards.integration.vivado_strategies import parse_vivado_clocks, parse_vivado_utilization
+    utilization, fmax = {}, {}
+    # Vivado.
+    for report in glob.glob(os.path.join(gateware_dir, "*_utilization_place.rpt")):
+        with open(report, errors="replace") as f:
+            utilization = parse_vivado_utilization(f.read())
+    for report in glob.glob(os.path.join(gateware_dir, "*_timing.rpt")):
+        with open(report, errors="replace") as f:
+            fmax = parse_vivado_clocks(f.read())
+    # nextpnr (selected seed with multi-seed place and route).
+    logs = glob.glob(os.path.join(gateware_dir, "nextpnr*_stdout.log"))
+    seeds = os.path.join(gateware_dir, "seeds", "seeds.json")
+    if os.path.exists(seeds):
+        with open(seeds) as f:
+            logs = [os.path.join(gateware_dir, "seeds", str(json.load(f)["selected"]), "nextpnr.log")]
+    for log in logs:
+        if os.path.exists(log):
+            with open(log, errors="replace") as f:
+                content = f.read()
+            utilization = utilization or parse_nextpnr_utilization(content)
+            fmax        = fmax        or parse_nextpnr_fmax(content)
+    return {"utilization": utilization, "fmax": fmax}
+
+# Build Trace --------------------------------------------------------------------------------------
+
+class BuildTrace:
+    def __init__(self, start=None):
+        self.start   = start or get_process_start_time() or time.time()
+        self.stages  = []
+        self.metrics = {}
+        self.stack   = []
+        self.scripts = 0 # Build scripts run (traced).
+
+    def add_stage(self, name, start, duration, peak, **kwargs):
+        name = "/".join(self.stack + [name])
+        # Stages entered several times are accumulated.
+        for stage in self.stages:
+            if stage["name"] == name:
+                stage["duration"] += duration
+                stage["peak"]      = _max_peak(stage["peak"], peak)
+                stage.update(kwargs)
+                return stage
+        stage = {
+            "name"     : name,
+            "start"    : start - self.start,
+            "duration" : duration,
+            "peak"     : peak,
+        }
+        stage.update(kwargs)
+        self.stages.append(stage)
+        return stage
+
+    def run(self, name, func, *args, **kwargs):
+        """Run func as a stage (peak memory: peak of the process/its children when reached during the
+        stage)."""
+        start       = time.time()
+        peak_before = _max_peak(get_peak_memory(), get_peak_memory(children=True))
+        self.stack.append(name)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self.stack.pop()
+            peak_after = _max_peak(get_peak_memory(), get_peak_memory(children=True))
+            peak       = peak_after if (peak_after is not None) and (peak_after != peak_before) else None
+            self.add_stage(name, start, time.time() - start, peak, peak_so_far=peak_after)
+
+    def run_script(self, toolchain, run_script, script):
+        """Run the toolchain's build script with its commands traced."""
+        if not script.endswith(".sh"):
+            return run_script(script)
+        self.scripts += 1
+        trace_file = script + ".trace.jsonl"
+        if os.path.exists(trace_file):
+            os.remove(trace_file)
+        try:
+            return run_script(write_traced_script(script, trace_file))
+        finally:
+            if os.path.exists(trace_file):
+                with open(trace_file) as f:
+                    for line in f:
+                        command = json.loads(line)
+                        self.add_stage(command["command"], command["start"], command["duration"], command["peak"],
+                            returncode = command["returncode"])
+                        # Vivado's steps.
+                        if command["command"] == "vivado" and os.path.exists("vivado.log"):
+                            with open("vivado.log", errors="replace") as f:
+                                start = command["start"]
+                                self.stack.append("vivado")
+                                for step, elapsed, peak in parse_vivado_steps(f.read()):
+                                    self.add_stage(step, start, elapsed, peak)
+                                    start += elapsed
+                                self.stack.pop()
+
+    def wrap_toolchain(self, toolchain, inner):
+        """Hook the trace on the toolchain's build script execution: inner wrapper traces the
+        commands of the build scripts, outer stage the whole toolchain execution (call wrap_toolchain
+        (inner=True) first, then the other wrappers, then wrap_toolchain(inner=False))."""
+        run_script = toolchain.run_script
+        if inner:
+            def traced_run_script(script):
+                return self.run_script(toolchain, run_script, script)
+        else:
+            def traced_run_script(script):
+                scripts = self.scripts
+                try:
+                    return self.run("toolchain", run_script, script)
+                finally:
+                    # No build script run: Outputs restored from the bitstream cache.
+                    name = "/".join(self.stack + ["toolchain"])
+                    for stage in self.stages:
+                        if stage["name"] == name:
+                            stage["cached"] = (self.scripts == scripts)
+        toolchain.run_script = traced_run_script
+
+    def write(self, filename, **kwargs):
+        content = {"version": 1}
+        content.update(kwargs)
+        content["stages"]  = sorted(self.stages, key=lambda stage: stage["start"])
+        content["metrics"] = self.metrics
+        tmp = filename + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(content, f, indent=1)
+        os.replace(tmp, filename)
+
+# Run ----------------------------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    sys.exit(trace_command(sys.argv[1], sys.argv[2], sys.argv[3:]))
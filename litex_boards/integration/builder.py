@@ -0,0 +1,318 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# LiteX's Builder extended with the options shared by all LiteX-Boards targets.
+#
+# Targets import it in place of litex.soc.integration.builder: all LiteX's Builder exports are
+# re-exported, Builder/builder_args/builder_argdict are extended.
+
+import os
+import sys
+import time
+import hashlib
+import argparse
+import subprocess
+
+from litex.soc.integration.builder import *
+from litex.soc.integration import builder as _litex_builder
+
+from litex_boards.integration.profiler import ElaborationProfiler
+from litex_boards.integration.build_trace import BuildTrace, get_toolchain_metrics, get_peak_memory
+from litex_boards.integration.bitstream_cache import default_bitstream_cache
+from litex_boards.integration.pnr_seeds import PnRSeedSweep
+from litex_boards.integration.vivado_strategies import VivadoStrategySweep
+from litex_boards.integration.artifacts import parse_size, LocalArtifactStore
+from litex_boards.integration.software_cache import default_software_cache_dir, default_software_cache_size, write_launcher
+from litex_boards.integration.fast_boot import add_fast_boot, get_fast_boot_liblitedram_dir
+
+# Configuration ID ---------------------------------------------------------------------------------
+
+# Arguments that only select actions, caches or parallelism and do not change the generated outputs
+# (name, with a value).
+_config_id_ignored_args = [
+    ("--build",                False),
+    ("--load",                 False),
+    ("--flash",                False),
+    ("--unique-output-dir",    False),
+    ("--profile-elaboration",  False),
+    ("--no-build-trace",       False),
+    ("--no-bitstream-cache",   False),
+    ("--bitstream-cache",      True),
+    ("--bitstream-cache-size", True),
+    ("--pnr-jobs",             True),
+    ("--vivado-strategy-jobs", True),
+    ("--vivado-strategy-mem",  True),
+    ("--no-software-cache",    False),
+    ("--software-jobs",        True),
+]
+
+def get_config_id(argv=None):
+    """Return an ID that uniquely identifies a target and its configuration from the command line."""
+    argv   = sys.argv if argv is None else argv
+    target = os.path.splitext(os.path.basename(argv[0]))[0]
+    # Remove ignored arguments (and their values, --arg value or --arg=value).
+    parser = argparse.ArgumentParser(add_help=False, allow_abbrev=False)
+    for name, with_value in _config_id_ignored_args:
+        parser.add_argument(name, action="store" if with_value else "store_true")
+    _, config = parser.parse_known_args(argv[1:])
+    digest = hashlib.sha1("\0".join([target] + config).encode("utf-8")).hexdigest()
+    return "{}-{}".format(target, digest[:8])
+
+# Elaboration Profiling ----------------------------------------------------------------------------
+
+# Elaboration is profiled in phases:
+# - soc      : SoC creation, from the command line parsing to the Builder creation.
+# - finalize : SoC finalization and remaining Builder steps.
+# - software : Software headers/CSR map generation and Software compilation.
+# - gateware : Verilog/constraints generation and Gateware compilation.
+# Profiles are written to <output-dir>/profile.
+
+_profiler = None
+
+def get_profiler():
+    global _profiler
+    if _profiler is None:
+        _profiler = ElaborationProfiler()
+    return _profiler
+
+class _ProfileElaborationAction(argparse.Action):
+    # Start profiling of the SoC creation as soon as the option is parsed.
+    def __init__(self, option_strings, dest, **kwargs):
+        argparse.Action.__init__(self, option_strings, dest, nargs=0, default=False, **kwargs)
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        setattr(namespace, self.dest, True)
+        profiler = get_profiler()
+        if not profiler.stack:
+            profiler.push("soc")
+
+# Builder ------------------------------------------------------------------------------------------
+
+class Builder(_litex_builder.Builder):
+    def __init__(self, soc, unique_output_dir=False, profile_elaboration=False, build_trace=True,
+        bitstream_cache       = True,
+        bitstream_cache_store = None,
+        bitstream_cache_size  = None,
+        pnr_seeds             = 1,
+        pnr_jobs              = None,
+        vivado_strategies     = None,
+        vivado_strategy_jobs  = None,
+        vivado_strategy_mem   = None,
+        software_cache        = True,
+        software_cache_size   = None,
+        software_jobs         = None,
+        fast_boot             = False,
+        **kwargs):
+        # Unique Output directory: build/<platform>/<config-id>, so that several targets and/or
+        # configurations can be elaborated concurrently without sharing their outputs.
+        if unique_output_dir and kwargs.get("output_dir", None) is None:
+            kwargs["output_dir"] = os.path.join("build", soc.platform.name, get_config_id())
+        _litex_builder.Builder.__init__(self, soc, **kwargs)
+
+        # Fast Boot: SDRAM calibration replay, BIOS memtest skipped, Boot timeline.
+        if fast_boot and add_fast_boot(soc):
+            self.software_packages = [(name, get_fast_boot_liblitedram_dir() if name == "liblitedram" else src_dir)
+                for name, src_dir in self.software_packages]
+
+        # Elaboration Profiling: End of SoC creation.
+        self.profiler = None
+        if profile_elaboration:
+            self.profiler = get_profiler()
+            if self.profiler.stack == ["soc"]:
+                self.profiler.pop()
+                self.profiler.write(self.get_profile_dir())
+
+        # Build Trace: Time/Peak memory per build stage and toolchain metrics (end of elaboration).
+        self.build_trace = None
+        if build_trace:
+            self.build_trace = BuildTrace()
+            self.build_trace.add_stage("elaboration", self.build_trace.start,
+                time.time() - self.build_trace.start, get_peak_memory())
+
+        # Bitstream Cache: Reuse bitstreams/reports of identical Gateware builds.
+        self.bitstream_cache = None
+        if bitstream_cache:
+            self.bitstream_cache = default_bitstream_cache(bitstream_cache_store, bitstream_cache_size)
+
+        # Multi-Seed Place and Route.
+        self.pnr_seed_sweep = None
+        if pnr_seeds > 1:
+            self.pnr_seed_sweep = PnRSeedSweep(seeds=pnr_seeds, jobs=pnr_jobs)
+
+        # Vivado Implementation Strategies.
+        self.vivado_strategy_sweep = None
+        if vivado_strategies:
+            self.vivado_strategy_sweep = VivadoStrategySweep(
+                strategies = vivado_strategies,
+                jobs       = vivado_strategy_jobs,
+                job_memory = parse_size(vivado_strategy_mem))
+
+        # Software Cache: Share compiled objects of the software packages between builds.
+        self.software_cache      = default_software_cache_dir() if software_cache else None
+        self.software_cache_size = default_software_cache_size(software_cache_size)
+        self.software_jobs       = software_jobs or os.cpu_count() or 1
+
+    def get_profile_dir(self):
+        return os.path.join(self.output_dir, "profile")
+
+    def get_build_trace_filename(self):
+        return os.path.join(self.output_dir, "build_trace.json")
+
+    def _profile(self, phase, method, *args, **kwargs):
+        if self.profiler is None:
+            return method(*args, **kwargs)
+        return self.profiler.run(phase, method, *args, **kwargs)
+
+    def _step(self, phase, stage, method, *args, **kwargs):
+        # Profile (elaboration phase) and trace (build stage) a build step.
+        if self.build_trace is None:
+            return self._profile(phase, method, *args, **kwargs)
+        return self.build_trace.run(stage, self._profile, phase, method, *args, **kwargs)
+
+    def _generate_includes(self, *args, **kwargs):
+        return self._step("software", "software-headers", _litex_builder.Builder._generate_includes, self, *args, **kwargs)
+
+    def _generate_csr_map(self, *args, **kwargs):
+        return self._step("software", "software-headers", _litex_builder.Builder._generate_csr_map, self, *args, **kwargs)
+
+    def _prepare_rom_software(self, *args, **kwargs):
+        return self._step("software", "software", _litex_builder.Builder._prepare_rom_software, self, *args, **kwargs)
+
+    def _generate_rom_software(self, compile_bios=True):
+        return self._step("software", "software", self._compile_software_packages, compile_bios)
+
+    def _compile_software_packages(self, compile_bios=True):
+        # Same as LiteX's Builder, with parallel make and the Software Cache as compiler launcher.
+        if not self.compile_software:
+            return
+        make_args = ["-j{}".format(self.software_jobs)]
+        log       = os.path.join(self.software_dir, "software_cache.log")
+        if self.software_cache is not None:
+            launcher = write_launcher(os.path.join(self.software_dir, "litex-boards-cc"), self.software_cache, log)
+            make_args.append("CCACHE={}".format(launcher))
+            if os.path.exists(log):
+                os.remove(log)
+        for name, src_dir in self.software_packages:
+            # Skip BIOS compilation when disabled.
+            if name == "bios" and not compile_bios:
+                continue
+            dst_dir  = os.path.join(self.software_dir, name)
+            makefile = os.path.join(src_dir, "Makefile")
+            subprocess.check_call(["make", "-C", dst_dir, "-f", makefile] + make_args)
+        if self.software_cache is not None and os.path.exists(log):
+            with open(log) as f:
+                status = [line.split()[0] for line in f]
+            print("Software cache: {} hits, {} misses.".format(status.count("hit"), status.count("miss")))
+            try:
+                LocalArtifactStore(self.software_cache, self.software_cache_size).evict()
+            except OSError:
+                pass # Cache not writable: not evicted.
+
+    def _initialize_rom_software(self, *args, **kwargs):
+        return self._step("software", "software", _litex_builder.Builder._initialize_rom_software, self, *args, **kwargs)
+
+    def build(self, **kwargs):
+        # Hook Build Trace (commands), Multi-Seed Place and Route/Vivado Implementation Strategies,
+        # Bitstream Cache and Build Trace (toolchain stage, outermost) on the toolchain's build
+        # script execution.
+        toolchain = getattr(self.soc.platform, "toolchain", None)
+        if not hasattr(toolchain, "run_script"):
+            return self._build(**kwargs)
+        if self.build_trace is not None:
+            self.build_trace.wrap_toolchain(toolchain, inner=True)
+        extra_key = ""
+        if self.pnr_seed_sweep is not None:
+            self.pnr_seed_sweep.wrap(toolchain)
+            extra_key += "pnr-seeds={}\0".format(self.pnr_seed_sweep.seeds)
+        if self.vivado_strategy_sweep is not None:
+            self.vivado_strategy_sweep.wrap(toolchain)
+            extra_key += "vivado-strategies={}\0".format(self.vivado_strategy_sweep.strategies)
+        if self.bitstream_cache is not None and kwargs.get("run", self.compile_gateware):
+            # BIOS build time (in ROM) would change the Gateware inputs on each build.
+            self.soc.add_config("BIOS_NO_BUILD_TIME", check_duplicate=False)
+            self.bitstream_cache.wrap(toolchain, self.output_dir, extra_key)
+        if self.build_trace is not None:
+            self.build_trace.wrap_toolchain(toolchain, inner=False)
+        try:
+            return self._build(**kwargs)
+        finally:
+            toolchain.__dict__.pop("run_script", None)
+
+    def _build(self, **kwargs):
+        # Gateware phase/stage: Wrap SoC's build (Verilog/constraints generation and Gateware compilation).
+        soc_build = self.soc.build
+        def soc_build_step(*args, **kwargs):
+            return self._step("gateware", "gateware", soc_build, *args, **kwargs)
+        self.soc.build = soc_build_step
+        # Finalize stage: Wrap SoC's finalization (once, also called from SoC's build).
+        if self.build_trace is not None:
+            soc_finalize = self.soc.finalize
+            def soc_finalize_stage(*args, **kwargs):
+                del self.soc.finalize
+                return self.build_trace.run("finalize", soc_finalize, *args, **kwargs)
+            self.soc.finalize = soc_finalize_stage
+        success = False
+        try:
+            vns = self._profile("finalize", _litex_builder.Builder.build, self, **kwargs)
+            success = True
+            return vns
+        finally:
+            del self.soc.build
+            self.soc.__dict__.pop("finalize", None)
+            if self.profiler is not None:
+                self.profiler.write(self.get_profile_dir())
+            if self.build_trace is not None:
+                self._write_build_trace(success)
+
+    def _write_build_trace(self, success):
+        toolchain = getattr(self.soc.platform, "toolchain", None)
+        if self.compile_gateware:
+            self.build_trace.metrics = get_toolchain_metrics(self.gateware_dir)
+        self.build_trace.write(self.get_build_trace_filename(),
+            target    = os.path.splitext(os.path.basename(sys.argv[0]))[0],
+            argv      = sys.argv[1:],
+            platform  = self.soc.platform.name,
+            toolchain = type(toolchain).__name__,
+            success   = success)
+
+# Builder Arguments --------------------------------------------------------------------------------
+
+def builder_args(parser):
+    _litex_builder.builder_args(parser)
+    boards_group = parser.add_argument_group(title="LiteX-Boards Builder options")
+    boards_group.add_argument("--unique-output-dir",    action="store_true",              help="Use a unique Output directory per target/configuration (build/<platform>/<config-id>).")
+    boards_group.add_argument("--profile-elaboration",  action=_ProfileElaborationAction, help="Profile elaboration phases (CPU/allocations) to <output-dir>/profile.")
+    boards_group.add_argument("--no-build-trace",       action="store_true",              help="Do not write the build trace (time/memory per build stage, toolchain metrics) to <output-dir>/build_trace.json.")
+    boards_group.add_argument("--no-bitstream-cache",   action="store_true",              help="Always run the toolchain (do not reuse bitstreams of identical Gateware builds).")
+    boards_group.add_argument("--bitstream-cache",      default=None,                     help="Bitstream cache artifact store: directory or http(s):// URL (default: LITEX_BOARDS_BITSTREAM_CACHE or ~/.cache/litex-boards/bitstreams).")
+    boards_group.add_argument("--bitstream-cache-size", default=None,                     help="Bitstream cache maximum size, least recently used artifacts are evicted (ex: 50G, default: LITEX_BOARDS_BITSTREAM_CACHE_SIZE or 20G).")
+    boards_group.add_argument("--pnr-seeds",            default=1, type=int,              help="Run nextpnr with N seeds in parallel and keep the best Fmax (Yosys/nextpnr toolchains).")
+    boards_group.add_argument("--pnr-jobs",             default=None, type=int,           help="Number of parallel nextpnr runs with --pnr-seeds (default: number of cores).")
+    boards_group.add_argument("--vivado-strategies",    default=None,                     help="Run Vivado implementation strategies in parallel from a synthesis checkpoint and keep the best WNS (ex: default,explore or all).")
+    boards_group.add_argument("--vivado-strategy-jobs", default=None, type=int,           help="Maximum number of parallel Vivado implementations with --vivado-strategies (default: number of cores).")
+    boards_group.add_argument("--vivado-strategy-mem",  default=None,                     help="Memory per Vivado implementation (ex: 8G, default: estimated from synthesis), limits parallel implementations.")
+    boards_group.add_argument("--no-software-cache",    action="store_true",              help="Always compile the software packages (do not reuse objects compiled by other builds, see LITEX_BOARDS_SOFTWARE_CACHE).")
+    boards_group.add_argument("--software-jobs",        default=None, type=int,           help="Number of parallel jobs of the software packages compilation (default: number of cores).")
+    boards_group.add_argument("--fast-boot",            action="store_true",              help="Fast Boot profile: Replay the SDRAM calibration of first boot, skip BIOS memtest and record the boot timeline (boot_timeline CSRs).")
+
+def builder_argdict(args):
+    argdict = _litex_builder.builder_argdict(args)
+    argdict.update({
+        "unique_output_dir"     : args.unique_output_dir,
+        "profile_elaboration"   : args.profile_elaboration,
+        "build_trace"           : not args.no_build_trace,
+        "bitstream_cache"       : not args.no_bitstream_cache,
+        "bitstream_cache_store" : args.bitstream_cache,
+        "bitstream_cache_size"  : args.bitstream_cache_size,
+        "pnr_seeds"             : args.pnr_seeds,
+        "pnr_jobs"              : args.pnr_jobs,
+        "vivado_strategies"     : args.vivado_strategies,
+        "vivado_strategy_jobs"  : args.vivado_strategy_jobs,
+        "vivado_strategy_mem"   : args.vivado_strategy_mem,
+        "software_cache"        : not args.no_software_cache,
+        "software_jobs"         : args.software_jobs,
+        "fast_boot"             : args.fast_boot,
+    })
+    return argdict
@@ -0,0 +1,242 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Indexed Constraints.
+#
+# LiteX's ConstraintManager stores the available IO resources in a list that is scanned linearly on
+# each request()/lookup_request(), which becomes noticeable on platforms with hundreds of IOs and
+# extensions (FMCs, PMODs, etc...). Platforms replace it (just after their vendor Platform
+# initialization) with an IndexedConstraintManager that indexes resources on their name/number once:
+#
+#     XilinxPlatform.__init__(self, device, _io, _connectors, toolchain=toolchain)
+#     index_constraints(self)
+#
+# Behaviour is the one of LiteX's ConstraintManager: resources are returned in declaration order.
+#
+# Connectors are also flattened once to a "connector:pin" -> package pin map (ConnectorMap), used to
+# resolve connector pins in O(1) and to check, on each request, that the pins of the requested
+# resource are not already used by a previously requested one: pin conflicts are reported when the
+# SoC is created instead of by the vendor toolchain. Pins can be shared on purpose (ex: MDIO bus of
+# dual-PHY boards), so conflicts are warnings, unless strict (LITEX_BOARDS_STRICT_PINS=1) where they
+# raise a PinConflictError (not a ConstraintError so that it is not taken as the end of the resources
+# by request_all/request_remaining; still a warning with loose requests).
+
+import os
+import logging
+
+from litex.build.generic_platform import ConstraintManager, ConnectorManager, ConstraintError
+from litex.build.generic_platform import Pins, Subsignal
+
+# Pin Conflict Error -------------------------------------------------------------------------------
+
+class PinConflictError(Exception):
+    pass
+
+# Connector Map ------------------------------------------------------------------------------------
+
+class ConnectorMap(ConnectorManager):
+    """ConnectorManager with a precomputed "connector:pin" -> package pin map."""
+    def __init__(self, connectors):
+        self._map = None
+        ConnectorManager.__init__(self, connectors)
+
+    def add_connector(self, connectors):
+        ConnectorManager.add_connector(self, connectors)
+        self._map = None # Rebuilt on next use.
+
+    def _resolve(self, identifier, connectors):
+        conn, pn = identifier.split(":")
+        if conn in connectors:
+            raise ConstraintError("Circular connector reference: {}".format(identifier))
+        pins = self.connector_table.get(conn, None)
+        if pins is None:
+            raise ConstraintError("Unknown connector {} in {}".format(conn, identifier))
+        if pn.isdigit():
+            pn = int(pn)
+        if isinstance(pins, dict):
+            pin = pins.get(pn, None)
+        else:
+            pin = pins[pn] if isinstance(pn, int) and pn < len(pins) else None
+        if (pin is not None) and (":" in pin):
+            pin = self._resolve(pin, connectors + [conn])
+        return pin
+
+    def get_map(self):
+        """Return the "connector:pin" -> package pin map (None for unconnected pins)."""
+        if self._map is None:
+            self._map = {}
+            for conn, pins in self.connector_table.items():
+                pns = pins.keys() if isinstance(pins, dict) else range(len(pins))
+                for pn in pns:
+                    identifier = "{}:{}".format(conn, pn)
+                    self._map[identifier] = self._resolve(identifier, [])
+        return self._map
+
+    def resolve_identifiers(self, identifiers):
+        pin_map = self.get_map()
+        r = []
+        for identifier in identifiers:
+            if ":" in identifier:
+                try:
+                    r.append(pin_map[identifier])
+                except KeyError:
+                    # Not in map (ex: "pmoda:01"), let LiteX resolve it or report the error.
+                    r.extend(ConnectorManager.resolve_identifiers(self, [identifier]))
+            else:
+                r.append(identifier)
+        return r
+
+# Resource Index -----------------------------------------------------------------------------------
+
+class ResourceIndex:
+    """Available IO resources, in declaration order, indexed on name and (name, number).
+
+    Provides the list operations used on ConstraintManager.available (iteration, append, extend,
+    remove) with O(1) append/remove and lookup().
+    """
+    def __init__(self, resources=[]):
+        self._count     = 0
+        self._resources = {} # Key -> Resource (in declaration order).
+        self._names     = {} # Name -> {Key: Resource}.
+        self._numbers   = {} # (Name, Number) -> {Key: Resource}.
+        self._keys      = {} # id(Resource) -> [Keys].
+        self.extend(resources)
+
+    def append(self, resource):
+        key = self._count
+        self._count += 1
+        self._resources[key] = resource
+        self._names.setdefault(resource[0], {})[key] = resource
+        self._numbers.setdefault((resource[0], resource[1]), {})[key] = resource
+        self._keys.setdefault(id(resource), []).append(key)
+
+    def extend(self, resources):
+        for resource in resources:
+            self.append(resource)
+
+    def remove(self, resource):
+        keys = self._keys.get(id(resource), [])
+        if not keys:
+            # Equal but not identical resource: same behaviour than list.remove.
+            for key, r in self._resources.items():
+                if r == resource:
+                    keys = self._keys[id(r)]
+                    resource = r
+                    break
+            else:
+                raise ValueError("ResourceIndex.remove(x): x not in index")
+        key = keys.pop(0)
+        if not keys:
+            del self._keys[id(resource)]
+        del self._resources[key]
+        for table, index in [(self._names, resource[0]), (self._numbers, (resource[0], resource[1]))]:
+            del table[index][key]
+            if not table[index]:
+                del table[index]
+
+    def lookup(self, name, number=None):
+        """Return the first available resource matching name (and number), None if not found."""
+        if number is None:
+            resources = self._names.get(name, None)
+        else:
+            resources = self._numbers.get((name, number), None)
+        if not resources:
+            return None
+        return next(iter(resources.values()))
+
+    def __iter__(self):
+        return iter(list(self._resources.values()))
+
+    def __len__(self):
+        return len(self._resources)
+
+    def __contains__(self, resource):
+        return id(resource) in self._keys or resource in self._resources.values()
+
+    def __getitem__(self, i):
+        return list(self._resources.values())[i]
+
+    def __reduce__(self):
+        # Keys are based on resources identities: rebuild the index on copy/pickle.
+        return (ResourceIndex, (list(self),))
+
+# Indexed Constraint Manager -----------------------------------------------------------------------
+
+class IndexedConstraintManager(ConstraintManager):
+    def __init__(self, io, connectors, strict=False):
+        ConstraintManager.__init__(self, io, [])
+        self.strict            = strict
+        self.available         = ResourceIndex(self.available)
+        self.connector_manager = ConnectorMap(connectors)
+        self._matched          = {} # Name -> [(Resource, Obj)], in request order.
+        self._used_pins        = {} # Package pin -> (Name, Number) of the resource using it.
+
+    def get_resource_pins(self, resource):
+        """Return the package pins of a resource (connector pins resolved)."""
+        identifiers = []
+        for element in resource[2:]:
+            constraints = element.constraints if isinstance(element, Subsignal) else [element]
+            for constraint in constraints:
+                if isinstance(constraint, Pins):
+                    identifiers += constraint.identifiers
+        return [pin for pin in self.connector_manager.resolve_identifiers(identifiers) if pin is not None]
+
+    def _use_pins(self, resource, loose=False):
+        pins = self.get_resource_pins(resource)
+        for pin in pins:
+            if pin in self._used_pins:
+                msg = "Pin {} of {}:{} already used by {}:{}".format(
+                    pin, resource[0], resource[1], *self._used_pins[pin])
+                if self.strict and not loose:
+                    raise PinConflictError(msg)
+                logging.getLogger("IndexedConstraintManager").warning(msg)
+        for pin in pins:
+            self._used_pins[pin] = (resource[0], resource[1])
+
+    def request(self, name, number=None, loose=False):
+        resource = self.available.lookup(name, number)
+        if resource is None:
+            if loose:
+                return None
+            raise ConstraintError("Resource not found: {}:{}".format(name, number))
+        self._use_pins(resource, loose)
+        # Let LiteX's ConstraintManager create the Signal/Record, from the looked up resource only.
+        available = self.available
+        self.available = [resource]
+        try:
+            obj = ConstraintManager.request(self, name, number, loose)
+        finally:
+            self.available = available
+        self.available.remove(resource)
+        self._matched.setdefault(name, []).append((resource, obj))
+        return obj
+
+    def lookup_request(self, name, number=None, loose=False):
+        subname = None
+        if ":" in name:
+            name, subname = name.split(":")
+        for resource, obj in self._matched.get(name, []):
+            if number is None or resource[1] == number:
+                return obj if subname is None else getattr(obj, subname)
+        if loose:
+            return None
+        raise ConstraintError("Resource not found: {}:{}".format(name, number))
+
+
+def default_strict_pins():
+    return os.environ.get("LITEX_BOARDS_STRICT_PINS", "0") not in ["", "0"]
+
+def index_constraints(platform, strict=None):
+    """Replace the ConstraintManager of a platform with an IndexedConstraintManager (keeping its state)."""
+    cm  = platform.constraint_manager
+    icm = IndexedConstraintManager(cm.available, [], strict=default_strict_pins() if strict is None else strict)
+    icm.connector_manager.connector_table.update(cm.connector_manager.connector_table)
+    icm.connector_manager.get_map() # Build/Validate Connector Map.
+    icm.platform_commands = cm.platform_commands
+    for resource, obj in cm.matched:
+        icm._use_pins(resource, loose=True)
+        icm.matched.append((resource, obj))
+        icm._matched.setdefault(resource[0], []).append((resource, obj))
+    platform.constraint_manager = icm
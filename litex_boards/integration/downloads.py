@@ -0,0 +1,229 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Downloads: Cached/checksummed fetch of the external assets (IPs, presets, sources) of targets.
+#
+# Assets are downloaded once to a persistent cache (~/.cache/litex-boards/downloads or
+# LITEX_BOARDS_DOWNLOAD_CACHE) and copied (files) or hard-linked (git repositories) from it:
+# - Files are pinned on their SHA-256: on the asset's sha256 when set, else on the SHA-256 of the
+#   first download (recorded in <cache>/pins.json), and verified on each use.
+# - Git repositories are pinned on their commit: on the asset's rev when set, else on the commit
+#   of the first clone.
+# With LITEX_BOARDS_OFFLINE=1, assets are only taken from the cache (prefetched with
+# litex_boards.tools.fetch) and a missing asset is an error.
+
+import os
+import json
+import shutil
+import hashlib
+import tempfile
+import threading
+import subprocess
+import urllib.request
+
+# Assets -------------------------------------------------------------------------------------------
+
+class FileAsset:
+    def __init__(self, url, sha256=None):
+        self.url    = url
+        self.sha256 = sha256
+
+
+class GitAsset:
+    def __init__(self, url, rev=None):
+        self.url = url
+        self.rev = rev
+
+
+assets = {
+    "alveo_u280_hbm_0.xci"  : FileAsset("https://github.com/litex-hub/litex-boards/files/6893157/hbm_0.xci.txt"),
+    "fk33_hbm_0.xci"        : FileAsset("https://github.com/litex-hub/litex-boards/files/8178874/hbm_0.xci.txt"),
+    "zybo_z7_ps7.xci"       : FileAsset("https://github.com/litex-hub/litex-boards/files/8339591/zybo_z7_ps7.txt"),
+    "redpitaya_ps7.xci"     : FileAsset("https://kmf2.trabucayre.com/redpitaya_ps7.txt"),
+    "arty_z7_10.tcl"        : FileAsset("http://kmf2.trabucayre.com/arty_z7_10.tcl"),
+    "arty_z7_20.tcl"        : FileAsset("http://kmf2.trabucayre.com/arty_z7_20.tcl"),
+    "snickerdoodle_ps7.xci" : FileAsset("https://technicaltoys-support.s3.amazonaws.com/xci/snickerdoodle_ps7.xci"),
+    "libeos.zip"            : FileAsset("https://github.com/litex-hub/litex-boards/files/7880350/libeos.zip"),
+    "embeddedsw"            : GitAsset("https://github.com/Xilinx/embeddedsw"),
+}
+
+# Assets fetched by the targets (prefetch).
+target_assets = {
+    "alinx_axu2cga"           : ["embeddedsw"],
+    "digilent_arty_z7"        : ["arty_z7_10.tcl", "arty_z7_20.tcl"],
+    "digilent_pynq_z1"        : ["zybo_z7_ps7.xci"],
+    "digilent_zedboard"       : ["embeddedsw"],
+    "krtkl_snickerdoodle"     : ["snickerdoodle_ps7.xci"],
+    "quicklogic_quickfeather" : ["libeos.zip"],
+    "redpitaya"               : ["redpitaya_ps7.xci"],
+    "sqrl_fk33"               : ["fk33_hbm_0.xci"],
+    "xilinx_alveo_u280"       : ["alveo_u280_hbm_0.xci"],
+    "xilinx_kv260"            : ["embeddedsw"],
+    "xilinx_zcu216"           : ["embeddedsw"],
+    "xilinx_zybo_z7"          : ["zybo_z7_ps7.xci"],
+}
+
+# Helpers ------------------------------------------------------------------------------------------
+
+def get_download_cache_dir():
+    return os.environ.get("LITEX_BOARDS_DOWNLOAD_CACHE",
+        os.path.join(os.path.expanduser("~"), ".cache", "litex-boards", "downloads"))
+
+def is_offline():
+    return os.environ.get("LITEX_BOARDS_OFFLINE", "0") not in ["", "0"]
+
+def hash_file(filename):
+    h = hashlib.sha256()
+    with open(filename, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+def _link_tree(src, dst):
+    # Hard-link files (copy across filesystems).
+    def link(src, dst):
+        try:
+            os.link(src, dst)
+        except OSError:
+            shutil.copy2(src, dst)
+    shutil.copytree(src, dst, symlinks=True, copy_function=link)
+
+# Download Cache -----------------------------------------------------------------------------------
+
+class DownloadCache:
+    def __init__(self, directory=None, offline=None):
+        self.directory = directory or get_download_cache_dir()
+        self.offline   = is_offline() if offline is None else offline
+        self.lock      = threading.Lock()
+
+    def get_path(self, name):
+        return os.path.join(self.directory, "git" if isinstance(assets[name], GitAsset) else "files", name)
+
+    # Pins.
+
+    def get_pins_filename(self):
+        return os.path.join(self.directory, "pins.json")
+
+    def get_pin(self, name):
+        filename = self.get_pins_filename()
+        if not os.path.exists(filename):
+            return None
+        with open(filename) as f:
+            return json.load(f).get(name, None)
+
+    def set_pin(self, name, pin):
+        with self.lock:
+            filename = self.get_pins_filename()
+            pins     = {}
+            if os.path.exists(filename):
+                with open(filename) as f:
+                    pins = json.load(f)
+            pins[name] = pin
+            tmp = filename + ".tmp"
+            with open(tmp, "w") as f:
+                json.dump(pins, f, indent=1, sort_keys=True)
+            os.replace(tmp, filename)
+
+    # Files.
+
+    def _verify_file(self, name, filename):
+        asset = assets[name]
+        pin   = asset.sha256 or self.get_pin(name)
+        h     = hash_file(filename)
+        if pin is not None and h != pin:
+            raise OSError("SHA-256 mismatch for {} ({}): got {}, expected {}.".format(name, asset.url, h, pin))
+        return h
+
+    def _download_file(self, name):
+        path = self.get_path(name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".")
+        try:
+            with os.fdopen(fd, "wb") as f, urllib.request.urlopen(assets[name].url, timeout=60) as r:
+                shutil.copyfileobj(r, f)
+            h = self._verify_file(name, tmp)
+            os.replace(tmp, path)
+        except BaseException:
+            os.remove(tmp)
+            raise
+        if assets[name].sha256 is None and self.get_pin(name) is None:
+            self.set_pin(name, h)
+
+    # Git repositories.
+
+    def _get_git_rev(self, path):
+        return subprocess.check_output(["git", "-C", path, "rev-parse", "HEAD"], text=True).strip()
+
+    def _verify_git(self, name, path):
+        pin = assets[name].rev or self.get_pin(name)
+        rev = self._get_git_rev(path)
+        if pin is not None and rev != pin:
+            raise OSError("Commit mismatch for {} ({}): got {}, expected {}.".format(name, assets[name].url, rev, pin))
+        return rev
+
+    def _download_git(self, name):
+        path = self.get_path(name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = tempfile.mkdtemp(dir=os.path.dirname(path), prefix=".")
+        try:
+            asset = assets[name]
+            pin   = asset.rev or self.get_pin(name)
+            if pin is None:
+                subprocess.check_call(["git", "clone", "--depth", "1", asset.url, tmp])
+            else:
+                subprocess.check_call(["git", "-C", tmp, "init", "-q"])
+                subprocess.check_call(["git", "-C", tmp, "fetch", "--depth", "1", asset.url, pin])
+                subprocess.check_call(["git", "-C", tmp, "checkout", "-q", "FETCH_HEAD"])
+            rev = self._verify_git(name, tmp)
+            try:
+                os.replace(tmp, path)
+            except OSError:
+                if not os.path.isdir(path):
+                    raise
+                # Cloned concurrently (by another process): keep and verify its clone.
+                shutil.rmtree(tmp, ignore_errors=True)
+                self._verify_git(name, path)
+                return
+        except BaseException:
+            shutil.rmtree(tmp, ignore_errors=True)
+            raise
+        if asset.rev is None and self.get_pin(name) is None:
+            self.set_pin(name, rev)
+
+    # Fetch.
+
+    def prefetch(self, name):
+        """Download an asset to the cache (if not already cached), return its cache path."""
+        path = self.get_path(name)
+        if not os.path.exists(path):
+            if self.offline:
+                raise OSError("{} ({}) not in download cache {} (offline mode).".format(name, assets[name].url, self.directory))
+            print("Downloading {} ({})...".format(name, assets[name].url))
+            if isinstance(assets[name], GitAsset):
+                self._download_git(name)
+            else:
+                self._download_file(name)
+        return path
+
+    def fetch(self, name, dst):
+        """Fetch an asset to dst (file or directory)."""
+        path = self.prefetch(name)
+        dst_dir = os.path.dirname(os.path.abspath(dst))
+        os.makedirs(dst_dir, exist_ok=True)
+        if isinstance(assets[name], GitAsset):
+            self._verify_git(name, path)
+            _link_tree(path, dst)
+        else:
+            self._verify_file(name, path)
+            fd, tmp = tempfile.mkstemp(dir=dst_dir, prefix=".")
+            os.close(fd)
+            shutil.copyfile(path, tmp)
+            os.replace(tmp, dst)
+        return dst
+
+
+def fetch(name, dst):
+    """Fetch an asset (see assets) to dst through the download cache."""
+    return DownloadCache().fetch(name, dst)
@@ -0,0 +1,155 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Fast Boot: Boot profile of the DRAM-equipped targets reducing the bitstream load to payload time.
+#
+# - SDRAM calibration (read/write leveling) is only done on first boot: the DDR PHY delays/bitslips
+#   found are persisted (in SPI Flash, last 4KiB sector, when the target has a SPI Flash with master
+#   access, else in a small on-chip RAM that survives soft resets) and replayed on next boots, with a
+#   quick memory check (full calibration on failure). Replay is not supported on UltraScale(+) PHYs
+#   (delays can't be reset), they are calibrated on each boot.
+# - BIOS memtest/memspeed (after calibration replay), CRC check and banner are skipped.
+# - Boot timeline: cycles since reset of the boot marks, recorded in the boot_timeline CSRs (read
+#   with litex_boards.tools.boot_timeline). Marks are written by the BIOS (SDRAM initialization
+#   steps), by hardware (first instruction fetched from Main RAM: payload) and can also be written
+#   by payloads (boot_timeline_mark_write(id), IDs 0x10-0x7f).
+
+import os
+import zlib
+from functools import reduce
+from operator import or_
+
+from migen import *
+
+from litex.soc.interconnect import wishbone
+from litex.soc.interconnect.csr import *
+
+# Boot Timeline ------------------------------------------------------------------------------------
+
+boot_timeline_marks = {
+    # Software (BIOS).
+    0x01 : "sdram-init",       # SDRAM initialization start.
+    0x02 : "sdram-calibrated", # SDRAM calibration done (full leveling).
+    0x03 : "sdram-replayed",   # SDRAM calibration replayed.
+    0x04 : "sdram-ready",      # SDRAM initialization done.
+    # Hardware.
+    0x80 : "payload",          # First instruction fetched from Main RAM.
+}
+
+def get_boot_timeline_mark_id(name):
+    return {v: k for k, v in boot_timeline_marks.items()}[name]
+
+class BootTimeline(Module, AutoCSR):
+    """Records the cycles since reset of software marks (mark CSR) and hardware events (first cycle
+    their signal is asserted) in a timeline, read back by entry (sel CSR)."""
+    def __init__(self, events={}, depth=32):
+        self.mark         = CSRStorage(8,  description="Mark ID, write records the current cycle in the timeline.")
+        self.count        = CSRStatus(bits_for(depth), description="Number of entries in the timeline.")
+        self.sel          = CSRStorage(bits_for(depth - 1), description="Entry selection.")
+        self.entry_id     = CSRStatus(8,  description="Mark ID of the selected entry.")
+        self.entry_cycles = CSRStatus(64, description="Cycles since reset of the selected entry.")
+
+        # # #
+
+        # Cycles since reset.
+        cycles = Signal(64)
+        self.sync += cycles.eq(cycles + 1)
+
+        # Sources (Software mark, Hardware events), by priority: (valid, id, cycles, pending).
+        sources = [(self.mark.re, self.mark.storage, cycles, None)]
+        for event_id, signal in events.items():
+            done    = Signal()
+            pending = Signal()
+            latched = Signal(64)
+            self.sync += If(signal & ~done,
+                done.eq(1),
+                pending.eq(1),
+                latched.eq(cycles),
+            )
+            sources.append((pending, Constant(event_id, 8), latched, pending))
+
+        # Timeline Memory (entries: cycles/id).
+        mem   = Memory(64 + 8, depth)
+        wport = mem.get_port(write_capable=True)
+        rport = mem.get_port(async_read=True)
+        self.specials += mem, wport, rport
+
+        count  = Signal(bits_for(depth))
+        grants = [Signal() for source in sources]
+        arbitration = None
+        for grant, (valid, _, _, _) in zip(grants, sources):
+            if arbitration is None:
+                arbitration = If(valid, grant.eq(1))
+            else:
+                arbitration = arbitration.Elif(valid, grant.eq(1))
+        self.comb += arbitration
+        for grant, (_, mark_id, mark_cycles, pending) in zip(grants, sources):
+            self.comb += If(grant, wport.dat_w.eq(Cat(mark_cycles, mark_id)))
+            if pending is not None:
+                self.sync += If(grant, pending.eq(0))
+        self.comb += [
+            wport.adr.eq(count),
+            wport.we.eq(reduce(or_, grants) & (count != depth)),
+        ]
+        self.sync += If(wport.we, count.eq(count + 1))
+
+        # Read-back.
+        self.comb += [
+            self.count.status.eq(count),
+            rport.adr.eq(self.sel.storage),
+            self.entry_cycles.status.eq(rport.dat_r[:64]),
+            self.entry_id.status.eq(rport.dat_r[64:]),
+        ]
+
+# Fast Boot ----------------------------------------------------------------------------------------
+
+def get_fast_boot_liblitedram_dir():
+    return os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "software", "liblitedram")
+
+def get_sdram_signature(soc):
+    # Configuration the calibration depends on (persisted calibrations of other configurations are
+    # not replayed).
+    settings = soc.ddrphy.settings
+    values   = [soc.platform.device, int(soc.sys_clk_freq), type(soc.ddrphy).__name__]
+    for name in ["memtype", "databits", "dfi_databits", "nranks", "nphases", "rdphase", "wrphase",
+        "cl", "cwl", "read_latency", "write_latency"]:
+        value = getattr(settings, name, None)
+        values.append(value if isinstance(value, (int, str)) else None)
+    return zlib.crc32(repr(values).encode("utf-8"))
+
+def add_fast_boot(soc, flash_offset=None, timeline_depth=32):
+    """Add the Fast Boot profile to a SoC (before its finalization), return True when the SDRAM
+    initialization is replaced (liblitedram package to use: get_fast_boot_liblitedram_dir())."""
+    # BIOS: Skip memtest/memspeed, CRC check and banner.
+    soc.add_constant("SDRAM_TEST_DISABLE")
+    soc.add_config("BIOS_NO_PROMPT")
+    soc.add_config("BIOS_NO_CRC")
+
+    # Boot Timeline.
+    events   = {}
+    ibus     = getattr(soc.cpu, "ibus", None)
+    main_ram = soc.bus.regions.get("main_ram", None)
+    if isinstance(ibus, wishbone.Interface) and main_ram is not None:
+        shift = log2_int(len(ibus.dat_r)//8)
+        events[get_boot_timeline_mark_id("payload")] = (ibus.cyc & ibus.stb &
+            (ibus.adr >= (main_ram.origin >> shift)) &
+            (ibus.adr <  ((main_ram.origin + main_ram.size) >> shift)))
+    soc.submodules.boot_timeline = BootTimeline(events, depth=timeline_depth)
+    for mark_id, name in boot_timeline_marks.items():
+        soc.add_constant("BOOT_TIMELINE_" + name.upper().replace("-", "_"), mark_id)
+
+    # SDRAM Calibration persistence.
+    if not hasattr(soc, "sdram"):
+        return False
+    soc.add_constant("FAST_BOOT_SIGNATURE", get_sdram_signature(soc))
+    spiflash_core = getattr(soc, "spiflash_core", None)
+    if "spiflash" in soc.bus.regions and hasattr(spiflash_core, "master"):
+        if flash_offset is None:
+            # Last 4KiB sector (of the first 16MiB: 3-byte addressing).
+            flash_offset = min(soc.bus.regions["spiflash"].size, 2**24) - 2**12
+        soc.add_constant("FAST_BOOT_FLASH_OFFSET", flash_offset)
+    else:
+        soc.add_ram("fast_boot_ram", origin=None, size=0x100, mode="rw")
+    return True
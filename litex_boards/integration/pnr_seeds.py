@@ -0,0 +1,150 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Multi-Seed Place and Route.
+#
+# nextpnr results (and timing closure) vary a lot with the placer seed. With Yosys/nextpnr toolchains
+# (ECP5, iCE40, Nexus, etc...), PnRSeedSweep hooks on the toolchain's build script execution and:
+# - Synthesizes once (Yosys call of the build script).
+# - Runs nextpnr with N seeds in parallel (M jobs), to <gateware-dir>/seeds/<seed>/.
+# - Selects the run with the best Fmax on the critical clock: the clock with the lowest achieved/
+#   constrained frequency ratio over all runs, runs failing to route are discarded.
+# - Packs the selected run (remaining steps of the build script) and reports the seed distribution
+#   (also written to <gateware-dir>/seeds/seeds.json).
+
+import os
+import re
+import json
+import shutil
+import statistics
+import subprocess
+from multiprocessing.pool import ThreadPool
+
+from litex.build.yosys_nextpnr_toolchain import YosysNextPNRToolchain
+
+# Helpers ------------------------------------------------------------------------------------------
+
+_fmax_re = re.compile(r"Max frequency for clock\s+'([^']+)':\s+([\d.]+) MHz \((?:PASS|FAIL) at ([\d.]+) MHz\)")
+
+def parse_nextpnr_fmax(log):
+    """Return {clock: (achieved, constrained)} (MHz) from a nextpnr log (last report: after routing)."""
+    fmax = {}
+    for clock, achieved, constrained in _fmax_re.findall(log):
+        fmax[clock] = (float(achieved), float(constrained))
+    return fmax
+
+_utilization_re = re.compile(r"Info:\s+(\w+):\s+(\d+)/\s*(\d+)\s+\d+%")
+
+def parse_nextpnr_utilization(log):
+    """Return {bel type: (used, available)} from a nextpnr log (last report)."""
+    utilization = {}
+    for bel, used, available in _utilization_re.findall(log):
+        utilization[bel] = (int(used), int(available))
+    return utilization
+
+def get_critical_clock(results):
+    """Return the clock with the lowest achieved/constrained frequency ratio over the results."""
+    ratios = {}
+    for result in results:
+        for clock, (achieved, constrained) in result["fmax"].items():
+            ratios[clock] = min(ratios.get(clock, achieved/constrained), achieved/constrained)
+    if not ratios:
+        return None
+    return min(ratios, key=ratios.get)
+
+# Multi-Seed Place and Route -----------------------------------------------------------------------
+
+class PnRSeedSweep:
+    def __init__(self, seeds=1, jobs=None, first_seed=1):
+        self.seeds = list(range(first_seed, first_seed + seeds))
+        self.jobs  = jobs or os.cpu_count()
+
+    def get_seed_dir(self, seed):
+        return os.path.join("seeds", str(seed))
+
+    def get_nextpnr_call(self, toolchain, seed):
+        # nextpnr call of the build script, with the seed's seed/output/log.
+        output = "{}.{}".format(toolchain._build_name, toolchain.pnr_fmt)
+        words  = toolchain._nextpnr.get_call("script").split()
+        if "--seed" in words:
+            del words[words.index("--seed"):words.index("--seed") + 2]
+        words = [os.path.join(self.get_seed_dir(seed), output) if word == output else word for word in words]
+        words += ["--seed", str(seed), "--log", os.path.join(self.get_seed_dir(seed), "nextpnr.log")]
+        return " ".join(words)
+
+    def run_seed(self, toolchain, seed):
+        seed_dir = self.get_seed_dir(seed)
+        if os.path.exists(seed_dir):
+            shutil.rmtree(seed_dir)
+        os.makedirs(seed_dir)
+        with open(os.path.join(seed_dir, "stdout.log"), "w") as f:
+            returncode = subprocess.call(self.get_nextpnr_call(toolchain, seed), shell=True, stdout=f, stderr=subprocess.STDOUT)
+        fmax = {}
+        if os.path.exists(os.path.join(seed_dir, "nextpnr.log")):
+            with open(os.path.join(seed_dir, "nextpnr.log"), errors="replace") as f:
+                fmax = parse_nextpnr_fmax(f.read())
+        return {"seed": seed, "returncode": returncode, "fmax": fmax}
+
+    def select(self, results):
+        """Return the critical clock and the best result (highest Fmax on it), None if all failed."""
+        passed = [result for result in results if result["returncode"] == 0]
+        if not passed:
+            return None, None
+        clock = get_critical_clock(passed)
+        return clock, max(passed, key=lambda result: result["fmax"].get(clock, (0, 0))[0])
+
+    def report(self, results, clock, best):
+        lines = ["Place and Route seeds (critical clock: {}):".format(clock)]
+        for result in results:
+            status = "failed"
+            if result["returncode"] == 0:
+                status = "no timing report"
+                if clock in result["fmax"]:
+                    status = "{:.2f} MHz (constrained at {:.2f} MHz)".format(*result["fmax"][clock])
+            lines.append("{} seed {:>4}: {}".format("*" if result is best else " ", result["seed"], status))
+        fmaxs = [result["fmax"][clock] for result in results if result["returncode"] == 0 and clock in result["fmax"]]
+        if fmaxs:
+            lines.append("Fmax: min {:.2f} MHz, median {:.2f} MHz, max {:.2f} MHz, {}/{} seeds meeting timings.".format(
+                min(a for a, c in fmaxs), statistics.median(a for a, c in fmaxs), max(a for a, c in fmaxs),
+                sum(a >= c for a, c in fmaxs), len(results)))
+        return "\n".join(lines)
+
+    def run_script(self, toolchain, run_script, script):
+        """Run the build script with a multi-seed place and route."""
+        yosys_call   = toolchain._yosys.get_yosys_call("script").strip()
+        nextpnr_call = toolchain._nextpnr.get_call("script").strip()
+
+        # Synthesis (once).
+        if subprocess.call(yosys_call, shell=True) != 0:
+            raise OSError("Error occured during Yosys's synthesis.")
+
+        # Place and Route (one run per seed, in parallel).
+        with ThreadPool(min(self.jobs, len(self.seeds))) as pool:
+            results = pool.map(lambda seed: self.run_seed(toolchain, seed), self.seeds)
+        clock, best = self.select(results)
+        if best is None:
+            raise OSError("Error occured during nextpnr's place and route (all seeds failed).")
+        print(self.report(results, clock, best))
+        with open(os.path.join("seeds", "seeds.json"), "w") as f:
+            json.dump({"critical_clock": clock, "selected": best["seed"], "results": results}, f, indent=1)
+        output = "{}.{}".format(toolchain._build_name, toolchain.pnr_fmt)
+        shutil.copyfile(os.path.join(self.get_seed_dir(best["seed"]), output), output)
+
+        # Packing: remaining steps of the build script.
+        with open(script) as f:
+            lines = f.read().splitlines(keepends=True)
+        pack_script = "pack_" + script
+        with open(pack_script, "w") as f:
+            f.write("".join(line for line in lines if not line.strip().startswith((yosys_call, nextpnr_call))))
+        run_script(pack_script)
+
+    def wrap(self, toolchain):
+        """Hook the multi-seed place and route on the toolchain's build script execution."""
+        if not isinstance(toolchain, YosysNextPNRToolchain):
+            raise ValueError("Multi-seed place and route is only supported with Yosys/nextpnr toolchains.")
+        run_script = toolchain.run_script
+        def seeds_run_script(script):
+            return self.run_script(toolchain, run_script, script)
+        toolchain.run_script = seeds_run_script
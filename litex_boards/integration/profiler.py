@@ -0,0 +1,147 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Elaboration Profiler: CPU profile (cProfile) and allocations (tracemalloc) per elaboration phase.
+#
+# For each phase, the following files are generated:
+# - <phase>.prof       : cProfile/pstats profile (snakeviz, flameprof, gprof2dot, etc...).
+# - <phase>.folded     : Collapsed stacks, in µs (flamegraph.pl, speedscope, inferno, etc...).
+# - <phase>.tracemalloc: tracemalloc Snapshot at the end of the phase (tracemalloc.Snapshot.load).
+# - <phase>.alloc.txt  : Top allocations of the phase (by line).
+# And a summary.json with time and memory figures of all phases.
+
+import os
+import json
+import time
+import pstats
+import cProfile
+import tracemalloc
+
+# Helpers ------------------------------------------------------------------------------------------
+
+def _func_name(func):
+    filename, line, name = func
+    if filename != "~": # Not a built-in.
+        name = "{}:{}:{}".format(os.path.basename(filename), line, name)
+    return name.replace(";", ",").replace(" ", "_")
+
+def pstats_to_folded(stats, max_depth=128, min_time=1e-6):
+    """Convert pstats to collapsed stacks (time of each caller->callee edge is split proportionally)."""
+    # Build callees table from callers one.
+    callees = {}
+    for func, (cc, nc, tt, ct, callers) in stats.stats.items():
+        for caller, edge in callers.items():
+            edge_ct = edge[3] if isinstance(edge, tuple) else 0
+            callees.setdefault(caller, []).append((func, edge_ct))
+
+    folded = {}
+    def walk(func, stack, budget):
+        cc, nc, tt, ct, callers = stats.stats[func]
+        ratio = budget/ct if ct > 0 else 0
+        stack = stack + [_func_name(func)]
+        key   = ";".join(stack)
+        folded[key] = folded.get(key, 0) + tt*ratio
+        if len(stack) >= max_depth:
+            return
+        for callee, edge_ct in callees.get(func, []):
+            if _func_name(callee) in stack:
+                continue # Recursion.
+            callee_budget = edge_ct*ratio
+            if callee_budget >= min_time:
+                walk(callee, stack, callee_budget)
+
+    for func, (cc, nc, tt, ct, callers) in stats.stats.items():
+        if not callers:
+            walk(func, [], ct)
+
+    return ["{} {}".format(stack, int(t*1e6)) for stack, t in sorted(folded.items()) if int(t*1e6) > 0]
+
+# Elaboration Profiler -----------------------------------------------------------------------------
+
+class _ProfilePhase:
+    def __init__(self):
+        self.profile   = cProfile.Profile()
+        self.start     = None # tracemalloc Snapshot at the start of the phase.
+        self.end       = None # tracemalloc Snapshot at the end of the phase.
+        self.wall_time = 0
+        self.peak      = 0
+        self.summary   = None
+        self._t0       = 0
+
+
+class ElaborationProfiler:
+    def __init__(self, nframes=16):
+        self.nframes = nframes
+        self.phases  = {} # Phase name -> _ProfilePhase (phases can be entered several times).
+        self.stack   = []
+        self.written = []
+
+    def _enable(self, name):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.nframes)
+        phase = self.phases.setdefault(name, _ProfilePhase())
+        if phase.start is None:
+            phase.start = tracemalloc.take_snapshot()
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+        phase._t0 = time.time()
+        phase.profile.enable()
+
+    def _disable(self, name, end=True):
+        phase = self.phases[name]
+        phase.profile.disable()
+        phase.wall_time += time.time() - phase._t0
+        phase.peak       = max(phase.peak, tracemalloc.get_traced_memory()[1])
+        if end:
+            phase.end = tracemalloc.take_snapshot()
+
+    def push(self, name):
+        if self.stack:
+            self._disable(self.stack[-1], end=False) # Suspended, not ended.
+        self.stack.append(name)
+        self._enable(name)
+
+    def pop(self):
+        self._disable(self.stack.pop())
+        if self.stack:
+            self._enable(self.stack[-1])
+
+    def run(self, name, func, *args, **kwargs):
+        self.push(name)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self.pop()
+
+    def write(self, directory, top=50):
+        """Write the profiles of the completed phases (not yet written) to directory."""
+        os.makedirs(directory, exist_ok=True)
+        for name, phase in self.phases.items():
+            if (name in self.stack) or (name in self.written):
+                continue
+            base  = os.path.join(directory, name)
+            stats = pstats.Stats(phase.profile)
+            stats.dump_stats(base + ".prof")
+            with open(base + ".folded", "w") as f:
+                f.write("\n".join(pstats_to_folded(stats)) + "\n")
+            phase.end.dump(base + ".tracemalloc")
+            allocs = phase.end.compare_to(phase.start, "lineno")
+            with open(base + ".alloc.txt", "w") as f:
+                for stat in allocs[:top]:
+                    f.write("{}\n".format(stat))
+            phase.summary = {
+                "wall_time"     : phase.wall_time,
+                "profiled_time" : stats.total_tt,
+                "allocated"     : sum(stat.size_diff for stat in allocs),
+                "peak_traced"   : phase.peak,
+            }
+            # Release Snapshots.
+            phase.start = phase.end = None
+            self.written.append(name)
+
+        # Summary of all written phases.
+        summary = {name: self.phases[name].summary for name in self.written}
+        with open(os.path.join(directory, "summary.json"), "w") as f:
+            json.dump(summary, f, indent=1)
@@ -0,0 +1,177 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Software Cache: Compiled objects (BIOS, libbase, libcompiler_rt, liblitedram...) shared by builds.
+#
+# The software packages are compiled with this module as compiler launcher (LiteX's CCACHE): each
+# compilation (-c) is keyed on the compiler (path/size/date), the compilation flags (without paths)
+# and the preprocessed source (without line markers), so on the headers that actually affect the
+# object, and its object is reused from the cache (~/.cache/litex-boards/software or
+# LITEX_BOARDS_SOFTWARE_CACHE) when another build (of any target with the same CPU configuration)
+# already compiled it. Dependency files are always generated for the build (by the preprocessing).
+# The cache is bounded (LITEX_BOARDS_SOFTWARE_CACHE_SIZE, 2G by default), least recently used objects
+# being evicted after the builds.
+#
+# Note: Debug information of reused objects refers to the directories of the build that compiled them.
+
+import os
+import re
+import sys
+import stat
+import shutil
+import hashlib
+import tempfile
+import subprocess
+
+# Helpers ------------------------------------------------------------------------------------------
+
+def get_software_cache_dir():
+    return os.path.join(os.path.expanduser("~"), ".cache", "litex-boards", "software")
+
+software_cache_max_size = "2G"
+
+def default_software_cache_size(max_size=None):
+    return max_size or os.environ.get("LITEX_BOARDS_SOFTWARE_CACHE_SIZE", software_cache_max_size)
+
+def default_software_cache_dir(location=None):
+    """Return the Software Cache directory, None when disabled (LITEX_BOARDS_SOFTWARE_CACHE=0)."""
+    location = location or os.environ.get("LITEX_BOARDS_SOFTWARE_CACHE", get_software_cache_dir())
+    if location in ["", "0"] or sys.platform == "win32": # Launcher is a shell script.
+        return None
+    return location
+
+def write_launcher(filename, cache_dir, log=None):
+    """Write a compiler launcher (single executable, as required by LiteX's CCACHE) to filename."""
+    with open(filename, "w") as f:
+        f.write("#!/bin/sh\n")
+        f.write("LITEX_BOARDS_SOFTWARE_CACHE='{}' ".format(cache_dir))
+        if log is not None:
+            f.write("LITEX_BOARDS_SOFTWARE_CACHE_LOG='{}' ".format(log))
+        f.write("exec '{}' '{}' \"$@\"\n".format(sys.executable, os.path.abspath(__file__)))
+    os.chmod(filename, os.stat(filename).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    return filename
+
+def get_compiler_fingerprint(compiler):
+    path = shutil.which(compiler) or compiler
+    s    = os.stat(path)
+    return "{}:{}:{}".format(os.path.realpath(path), s.st_size, int(s.st_mtime))
+
+# Arguments with a value that do not change the object (paths) or that are handled by the cache.
+_path_args = ["-o", "-MF", "-MT", "-MQ", "-I", "-iquote", "-isystem", "-idirafter"]
+_flag_args = ["-c", "-MD", "-MMD", "-MP"]
+
+_source_exts = [".c", ".cc", ".cpp", ".cxx", ".S"] # Preprocessed sources.
+
+def parse_compilation(args):
+    """Return (output, source, flags) of a compilation (-c) command, None otherwise."""
+    if "-c" not in args:
+        return None
+    output, source, flags = None, None, []
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg in _path_args:
+            if arg == "-o":
+                output = args[i + 1]
+            i += 2
+            continue
+        if arg.startswith(("-I", "-o")) or arg in _flag_args:
+            if arg.startswith("-o"):
+                output = arg[2:]
+            i += 1
+            continue
+        if not arg.startswith("-") and os.path.splitext(arg)[1] in _source_exts:
+            if source is not None:
+                return None # Several sources.
+            source = arg
+        else:
+            flags.append(arg)
+        i += 1
+    if output is None or source is None or output == "-":
+        return None
+    return output, source, flags
+
+_linemarker_re = re.compile(rb"^#\s*\d+\s+\".*$\n?", re.MULTILINE)
+
+def get_preprocess_args(args, output, preprocessed):
+    # Preprocess (-E) with the compilation flags (and generate the dependency file when requested).
+    pargs = []
+    i = 0
+    while i < len(args):
+        if args[i] == "-c":
+            pargs.append("-E")
+        elif args[i] == "-o":
+            pargs += ["-o", preprocessed]
+            i += 1
+        elif args[i].startswith("-o"):
+            pargs += ["-o", preprocessed]
+        else:
+            pargs.append(args[i])
+        i += 1
+    if ("-MD" in args or "-MMD" in args):
+        if "-MF" not in args:
+            pargs += ["-MF", os.path.splitext(output)[0] + ".d"]
+        if "-MT" not in args and "-MQ" not in args:
+            pargs += ["-MT", output]
+    return pargs
+
+# Software Cache -----------------------------------------------------------------------------------
+
+def _atomic_copy(src, dst):
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(dst)), prefix=".")
+    os.close(fd)
+    try:
+        shutil.copyfile(src, tmp)
+        os.replace(tmp, dst)
+    except BaseException:
+        os.remove(tmp)
+        raise
+
+def run_compiler(args, cache_dir, log=None):
+    """Run a compiler command (args[0]: compiler), through the cache for compilations."""
+    compilation = parse_compilation(args[1:])
+    if compilation is None:
+        return subprocess.call(args)
+    output, source, flags = compilation
+    # Key.
+    fd, preprocessed = tempfile.mkstemp(suffix=".i" if not source.endswith(".S") else ".s")
+    os.close(fd)
+    try:
+        if subprocess.call(get_preprocess_args(args, output, preprocessed)) != 0:
+            return subprocess.call(args) # Let the compiler report the error.
+        h = hashlib.sha256()
+        h.update(get_compiler_fingerprint(args[0]).encode() + b"\0")
+        h.update("\0".join(flags + [os.path.splitext(source)[1]]).encode() + b"\0")
+        with open(preprocessed, "rb") as f:
+            h.update(_linemarker_re.sub(b"", f.read()))
+    finally:
+        os.remove(preprocessed)
+    key    = h.hexdigest()
+    cached = os.path.join(cache_dir, key[:2], key + ".o")
+    try:
+        # Hit.
+        _atomic_copy(cached, output)
+        os.utime(cached) # LRU eviction.
+        status, returncode = "hit", 0
+    except OSError:
+        # Miss.
+        status, returncode = "miss", subprocess.call(args)
+        if returncode == 0:
+            try:
+                os.makedirs(os.path.dirname(cached), exist_ok=True)
+                _atomic_copy(output, cached)
+            except OSError:
+                pass # Cache not writable/full: object only kept in the build.
+    if log is not None:
+        with open(log, "a") as f:
+            f.write("{} {}\n".format(status, output))
+    return returncode
+
+# Run ----------------------------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    sys.exit(run_compiler(sys.argv[1:],
+        cache_dir = os.environ.get("LITEX_BOARDS_SOFTWARE_CACHE", get_software_cache_dir()),
+        log       = os.environ.get("LITEX_BOARDS_SOFTWARE_CACHE_LOG", None)))
@@ -0,0 +1,285 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Vivado Implementation Strategies.
+#
+# Timing closure with Vivado often requires trying several implementation directives. With Vivado
+# toolchain, VivadoStrategySweep hooks on the toolchain's build script execution and:
+# - Runs the project/synthesis part of the build (up to opt_design) once and checkpoints it
+#   (<build_name>_synth.dcp).
+# - Runs the implementation (opt/place/phys_opt/route/bitstream) of each strategy from the checkpoint
+#   in parallel processes, to <gateware-dir>/strategies/<strategy>/. Concurrency is limited by the
+#   number of jobs and by the available memory (estimated per job from the synthesis peak memory).
+# - Keeps the outputs (bitstream, reports, checkpoints) of the strategy with the best WNS (then TNS)
+#   and reports all strategies (also written to <gateware-dir>/strategies/strategies.json).
+
+import os
+import sys
+import json
+import shutil
+import subprocess
+from multiprocessing.pool import ThreadPool
+
+from litex.build.xilinx.vivado import XilinxVivadoToolchain
+
+# Strategies ---------------------------------------------------------------------------------------
+
+# Directives of opt_design, place_design, post-place phys_opt_design, route_design and post-route
+# phys_opt_design (same names than Vivado's Performance_* strategies when similar).
+vivado_strategies = {
+    "default"           : ("default",          "default",             None,                        "default",             "default"),
+    "explore"           : ("Explore",          "Explore",             "Explore",                   "Explore",             "Explore"),
+    "extra_timing_opt"  : ("ExploreWithRemap", "ExtraTimingOpt",      "AggressiveExplore",         "NoTimingRelaxation",  "AggressiveExplore"),
+    "net_delay_high"    : ("Explore",          "ExtraNetDelay_high",  "AggressiveFanoutOpt",       "AggressiveExplore",   "AggressiveExplore"),
+    "spread_logic_high" : ("Explore",          "AltSpreadLogic_high", "AggressiveExplore",         "AlternateCLBRouting", "Explore"),
+    "early_block"       : ("Explore",          "EarlyBlockPlacement", "Explore",                   "Explore",             "Explore"),
+    "retiming"          : ("Explore",          "Explore",             "AlternateFlowWithRetiming", "Explore",             "AggressiveExplore"),
+}
+
+_strategy_directives = [
+    "opt_directive",
+    "vivado_place_directive",
+    "vivado_post_place_phys_opt_directive",
+    "vivado_route_directive",
+    "vivado_post_route_phys_opt_directive",
+]
+
+def parse_strategies(strategies):
+    """Parse a comma separated list of strategies ("all" for all strategies)."""
+    if strategies == "all":
+        return list(vivado_strategies.keys())
+    names = [name.strip() for name in strategies.split(",") if name.strip()]
+    for name in names:
+        if name not in vivado_strategies:
+            raise ValueError("Unknown Vivado strategy {} (available: {}).".format(name, ", ".join(vivado_strategies)))
+    return names
+
+# Helpers ------------------------------------------------------------------------------------------
+
+def get_available_memory():
+    """Return the available memory (bytes), None if unknown."""
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1])*1024
+    except OSError:
+        pass
+    try:
+        return os.sysconf("SC_PAGE_SIZE")*os.sysconf("SC_AVPHYS_PAGES")
+    except (ValueError, OSError, AttributeError):
+        return None
+
+def run_command(args, **kwargs):
+    """Run a command, return its return code and its peak memory (bytes, of the command and its
+    children only), None if unknown."""
+    p = subprocess.Popen(args, **kwargs)
+    if not hasattr(os, "wait4"):
+        return p.wait(), None # Windows: No peak memory.
+    _, status, rusage = os.wait4(p.pid, 0)
+    p.returncode = -os.WTERMSIG(status) if os.WIFSIGNALED(status) else os.WEXITSTATUS(status)
+    # ru_maxrss is in KiB on Linux, in bytes on macOS.
+    return p.returncode, rusage.ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+
+def parse_vivado_timing(report):
+    """Return (WNS, TNS, WHS) (ns) from a report_timing_summary report, None if not found."""
+    lines = report.splitlines()
+    for i, line in enumerate(lines):
+        if line.split()[:2] == ["WNS(ns)", "TNS(ns)"]:
+            for values in lines[i + 2:i + 4]:
+                values = values.split()
+                try:
+                    return float(values[0]), float(values[1]), float(values[4])
+                except (IndexError, ValueError):
+                    continue
+    return None
+
+def parse_vivado_clocks(report):
+    """Return {clock: (achieved, constrained)} (MHz) from a report_timing_summary report (clocks
+    with setup paths)."""
+    periods, clocks, table = {}, {}, None
+    for line in report.splitlines():
+        if line.startswith("| "):
+            if not line[2:].startswith("-"):
+                table = line[2:].strip()
+            continue
+        values = line.split()
+        try:
+            if table == "Clock Summary" and len(values) >= 5:
+                periods[values[0]] = float(values[-2])
+            elif table == "Intra Clock Table" and len(values) >= 9 and values[0] in periods:
+                # Clock, WNS, TNS, ... (WNS/TNS columns are empty for clocks without setup paths).
+                wns = float(values[1])
+                clocks[values[0]] = (1e3/(periods[values[0]] - wns), 1e3/periods[values[0]])
+        except ValueError:
+            continue
+    return clocks
+
+def parse_vivado_utilization(report):
+    """Return {site type: (used, available)} from a report_utilization report."""
+    utilization = {}
+    for line in report.splitlines():
+        columns = [column.strip() for column in line.strip().strip("|").split("|")]
+        if len(columns) < 5 or not line.startswith("|"):
+            continue
+        # | Site Type | Used | Fixed | (Prohibited |) Available | Util% |
+        try:
+            used, available = float(columns[1]), float(columns[-2])
+        except ValueError:
+            continue
+        used, available = [int(n) if n.is_integer() else n for n in (used, available)] # RAMB18: 0.5.
+        utilization.setdefault(columns[0].rstrip("*").strip(), (used, available))
+    return utilization
+
+# Vivado Strategy Sweep ----------------------------------------------------------------------------
+
+_implementation_marker = "\n# Optimize design\n"
+
+class VivadoStrategySweep:
+    def __init__(self, strategies=["default", "explore"], jobs=None, job_memory=None):
+        self.strategies = parse_strategies(strategies) if isinstance(strategies, str) else strategies
+        self.jobs       = jobs or os.cpu_count()
+        self.job_memory = job_memory
+
+    def get_strategy_dir(self, strategy):
+        return os.path.join("strategies", strategy)
+
+    def get_jobs(self, job_memory):
+        # Limit concurrency to the number of jobs and to the available memory.
+        jobs      = min(self.jobs, len(self.strategies))
+        available = get_available_memory()
+        if available is not None and job_memory:
+            jobs = max(1, min(jobs, available//job_memory))
+        return jobs
+
+    def write_synthesis(self, toolchain, script):
+        # Project/Synthesis part of the build (up to opt_design) and checkpoint.
+        build_name = toolchain._build_name
+        with open(build_name + ".tcl") as f:
+            tcl = f.read()
+        if _implementation_marker not in tcl:
+            raise OSError("Unable to split Vivado's build in synthesis/implementation.")
+        tcl  = tcl[:tcl.index(_implementation_marker)]
+        tcl += "\n# Synthesis checkpoint\n\nwrite_checkpoint -force {}_synth.dcp\nquit\n".format(build_name)
+        with open(build_name + "_synth.tcl", "w") as f:
+            f.write(tcl)
+        with open(script) as f:
+            script_contents = f.read()
+        synth_script = "synth_" + script
+        with open(synth_script, "w") as f:
+            f.write(script_contents.replace("-source {}.tcl".format(build_name), "-source {}_synth.tcl".format(build_name)))
+        return synth_script
+
+    def write_strategy(self, toolchain, script, strategy, threads):
+        # Implementation part of the build with the strategy's directives, from the checkpoint.
+        build_name   = toolchain._build_name
+        strategy_dir = self.get_strategy_dir(strategy)
+        if os.path.exists(strategy_dir):
+            shutil.rmtree(strategy_dir)
+        os.makedirs(strategy_dir)
+        cwd = os.getcwd()
+        os.chdir(strategy_dir)
+        directives = {name: getattr(toolchain, name) for name in _strategy_directives}
+        try:
+            for name, directive in zip(_strategy_directives, vivado_strategies[strategy]):
+                setattr(toolchain, name, directive)
+            toolchain.build_project()
+            with open(build_name + ".tcl") as f:
+                tcl = f.read()
+            tcl = tcl[tcl.index(_implementation_marker):]
+            header  = "\n# Open Synthesis checkpoint\n\n"
+            header += "open_checkpoint {}\n".format(os.path.join("..", "..", build_name + "_synth.dcp"))
+            header += "set_param general.maxThreads {}\n".format(toolchain.vivado_max_threads or threads)
+            with open(build_name + ".tcl", "w") as f:
+                f.write(header + tcl)
+            # Build script without Yosys synthesis (if any), Vivado call only.
+            with open(os.path.join(cwd, script)) as f:
+                lines = f.read().splitlines(keepends=True)
+            with open(script, "w") as f:
+                f.write("".join(line for line in lines if not line.startswith("yosys")))
+        finally:
+            for name, directive in directives.items():
+                setattr(toolchain, name, directive)
+            os.chdir(cwd)
+
+    def run_synthesis(self, script):
+        """Run the synthesis script, return its peak memory (bytes), None if unknown."""
+        shell = ["cmd", "/c"] if sys.platform in ["win32", "cygwin"] else ["bash"]
+        returncode, peak = run_command(shell + [script])
+        if returncode != 0:
+            raise OSError("Error occured during Vivado's synthesis.")
+        return peak
+
+    def run_strategy(self, strategy, script):
+        strategy_dir = self.get_strategy_dir(strategy)
+        shell = ["cmd", "/c"] if sys.platform in ["win32", "cygwin"] else ["bash"]
+        with open(os.path.join(strategy_dir, "vivado_stdout.log"), "w") as f:
+            returncode, _ = run_command(shell + [script], cwd=strategy_dir, stdout=f, stderr=subprocess.STDOUT)
+        return returncode
+
+    def get_timing(self, toolchain, strategy):
+        report = os.path.join(self.get_strategy_dir(strategy), toolchain._build_name + "_timing.rpt")
+        if not os.path.exists(report):
+            return None
+        with open(report, errors="replace") as f:
+            return parse_vivado_timing(f.read())
+
+    def select(self, results):
+        """Return the best result (highest WNS, then TNS), None if all failed."""
+        passed = [result for result in results if result["returncode"] == 0 and result["timing"] is not None]
+        if not passed:
+            return None
+        return max(passed, key=lambda result: (result["timing"][0], result["timing"][1]))
+
+    def report(self, results, best, jobs, job_memory):
+        lines = ["Vivado strategies ({} jobs{}):".format(jobs,
+            "" if not job_memory else ", {:.1f}GB/job".format(job_memory/1e9))]
+        for result in results:
+            status = "failed"
+            if result["returncode"] == 0:
+                status = "no timing report"
+                if result["timing"] is not None:
+                    status = "WNS {:7.3f}ns, TNS {:9.3f}ns, WHS {:7.3f}ns".format(*result["timing"])
+            lines.append("{} {:<20}: {}".format("*" if result is best else " ", result["strategy"], status))
+        return "\n".join(lines)
+
+    def run_script(self, toolchain, run_script, script):
+        """Run the build script with an implementation strategy sweep."""
+        # Synthesis (once). Run directly (not through the toolchain's run_script) to get the peak
+        # memory of this run only, used to estimate the memory per job.
+        peak       = self.run_synthesis(self.write_synthesis(toolchain, script))
+        job_memory = self.job_memory or (peak and int(1.5*peak))
+
+        # Implementation (one run per strategy, in parallel).
+        jobs    = self.get_jobs(job_memory)
+        threads = max(1, min(8, os.cpu_count()//jobs))
+        for strategy in self.strategies:
+            self.write_strategy(toolchain, script, strategy, threads)
+        def run(strategy):
+            returncode = self.run_strategy(strategy, script)
+            return {"strategy": strategy, "returncode": returncode, "timing": self.get_timing(toolchain, strategy)}
+        with ThreadPool(jobs) as pool:
+            results = pool.map(run, self.strategies)
+        best = self.select(results)
+        print(self.report(results, best, jobs, job_memory))
+        with open(os.path.join("strategies", "strategies.json"), "w") as f:
+            json.dump({"selected": None if best is None else best["strategy"], "results": results}, f, indent=1)
+        if best is None:
+            raise OSError("Error occured during Vivado's implementation (all strategies failed).")
+
+        # Keep outputs of the best strategy.
+        strategy_dir = self.get_strategy_dir(best["strategy"])
+        for file in os.listdir(strategy_dir):
+            if os.path.isfile(os.path.join(strategy_dir, file)) and file not in [script, toolchain._build_name + ".tcl"]:
+                shutil.copyfile(os.path.join(strategy_dir, file), file)
+
+    def wrap(self, toolchain):
+        """Hook the strategy sweep on the toolchain's build script execution."""
+        if not isinstance(toolchain, XilinxVivadoToolchain):
+            raise ValueError("Implementation strategies sweep is only supported with Vivado toolchain.")
+        run_script = toolchain.run_script
+        def strategies_run_script(script):
+            return self.run_script(toolchain, run_script, script)
+        toolchain.run_script = strategies_run_script
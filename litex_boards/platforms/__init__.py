@@ -0,0 +1,46 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# LiteX-Boards Platforms Registry.
+#
+# Platforms are listed from the package directory (without importing them) and imported on first
+# access only:
+#
+# >>> from litex_boards import platforms
+# >>> platforms.available()
+# >>> platforms.get("digilent_arty")
+# >>> platforms.digilent_arty
+
+import os
+import importlib
+
+_platforms_dir = os.path.dirname(__file__)
+_platforms     = None
+
+def available():
+    """Return the names of the available platforms (no platform is imported)."""
+    global _platforms
+    if _platforms is None:
+        _platforms = []
+        for file in sorted(os.listdir(_platforms_dir)):
+            name, ext = os.path.splitext(file)
+            if (ext == ".py") and (not name.startswith("_")):
+                _platforms.append(name)
+    return list(_platforms)
+
+def get(name):
+    """Import and return the module of a platform."""
+    if name not in available():
+        raise ValueError("Unknown platform {}, available: {}.".format(name, ", ".join(available())))
+    return importlib.import_module("{}.{}".format(__name__, name))
+
+def __getattr__(name):
+    # Lazy loading of the platforms on attribute access.
+    if name in available():
+        return get(name)
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+def __dir__():
+    return sorted(set(globals()) | set(available()))
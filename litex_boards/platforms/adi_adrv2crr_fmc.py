@@ -8,6 +8,8 @@ from litex.build.generic_platform import *
 from litex.build.xilinx import XilinxPlatform
 from litex.build.openocd import OpenOCD
 
+from litex_boards.integration.constraints import index_constraints
+
 _io = [
     # Clk
     ("clk122m88", 0,
@@ -488,6 +490,7 @@ class Platform(XilinxPlatform):
 
     def __init__(self):
         XilinxPlatform.__init__(self, "xczu11eg-ffvf1517-2-i", _io, _connectors, toolchain="vivado")
+        index_constraints(self)
 
     def do_finalize(self, fragment):
         XilinxPlatform.do_finalize(self, fragment)
@@ -7,6 +7,8 @@
 from litex.build.generic_platform import *
 from litex.build.xilinx import XilinxPlatform, VivadoProgrammer
 
+from litex_boards.integration.constraints import index_constraints
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -25,6 +27,7 @@ _connectors = []
 class Platform(XilinxPlatform):
     def __init__(self, toolchain="vivado"):
         XilinxPlatform.__init__(self, "xc7z010clg225-1", _io,  _connectors, toolchain=toolchain)
+        index_constraints(self)
 
     def create_programmer(self):
         return VivadoProgrammer()
@@ -13,6 +13,8 @@ from litex.build.generic_platform import *
 from litex.build.xilinx import XilinxPlatform
 from litex.build.openocd import OpenOCD
 
+from litex_boards.integration.constraints import index_constraints
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -106,6 +108,7 @@ class Platform(XilinxPlatform):
         }[variant]
 
         XilinxPlatform.__init__(self, device, _io, toolchain=toolchain)
+        index_constraints(self)
         self.add_platform_command("set_property INTERNAL_VREF 0.675 [get_iobanks 15]")
 
         self.toolchain.bitstream_commands = [
@@ -7,6 +7,8 @@
 from litex.build.generic_platform import *
 from litex.build.xilinx import XilinxPlatform
 
+from litex_boards.integration.constraints import index_constraints
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -116,6 +118,7 @@ class Platform(XilinxPlatform):
 
     def __init__(self, toolchain="ise"):
         XilinxPlatform.__init__(self, "xc6slx9-2-tqg144", _io, toolchain=toolchain)
+        index_constraints(self)
         self.toolchain.additional_commands = ["write_bitstream -force -bin_file {build_name}"]
 
     def do_finalize(self, fragment):
@@ -8,6 +8,8 @@ from litex.build.generic_platform import *
 from litex.build.xilinx import XilinxPlatform, VivadoProgrammer
 from litex.build.openocd import OpenOCD
 
+from litex_boards.integration.constraints import index_constraints
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -89,6 +91,7 @@ class Platform(XilinxPlatform):
 
     def __init__(self, toolchain="vivado"):
         XilinxPlatform.__init__(self, "xc7k420tl-ffg901", _io, toolchain=toolchain)
+        index_constraints(self)
 
     def create_programmer(self):
         return OpenOCD("openocd_xc7_ft2232.cfg", "bscan_spi_xc7a420t.bit")
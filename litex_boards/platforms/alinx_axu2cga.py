@@ -8,6 +8,8 @@ from litex.build.generic_platform import *
 from litex.build.xilinx import XilinxPlatform
 from litex.build.openfpgaloader import OpenFPGALoader
 
+from litex_boards.integration.constraints import index_constraints
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -167,6 +169,7 @@ class Platform(XilinxPlatform):
 
     def __init__(self, toolchain="vivado"):
         XilinxPlatform.__init__(self, "xczu2cg-sfvc784-1-e", _io, _connectors, toolchain=toolchain)
+        index_constraints(self)
 
     def create_programmer(self, cable):
         return OpenFPGALoader("axu2cga", cable)
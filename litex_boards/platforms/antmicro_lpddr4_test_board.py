@@ -8,6 +8,8 @@ from litex.build.generic_platform import *
 from litex.build.xilinx import XilinxPlatform
 from litex.build.openocd import OpenOCD
 
+from litex_boards.integration.constraints import index_constraints
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -100,6 +102,7 @@ class Platform(XilinxPlatform):
 
     def __init__(self, device="xc7k70tfbg484-1", toolchain="vivado"):
         XilinxPlatform.__init__(self, device, _io, toolchain=toolchain)
+        index_constraints(self)
         self.toolchain.bitstream_commands = \
             ["set_property BITSTREAM.CONFIG.SPI_BUSWIDTH 4 [current_design]"]
         self.toolchain.additional_commands = \
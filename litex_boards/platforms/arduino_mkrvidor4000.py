@@ -8,6 +8,8 @@ from litex.build.generic_platform import *
 from litex.build.altera import AlteraPlatform
 from litex.build.altera.programmer import USBBlaster
 
+from litex_boards.integration.constraints import index_constraints
+
 # IOs ----------------------------------------------------------------------------------------------
 
 
@@ -230,6 +232,7 @@ class Platform(AlteraPlatform):
 
     def __init__(self):
         AlteraPlatform.__init__(self, "10CL016YU256C8G", _io)
+        index_constraints(self)
 
     def create_programmer(self):
         return USBBlaster(cable_name="Arduino MKR Vidor 4000") #  [3-2]
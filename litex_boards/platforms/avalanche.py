@@ -7,6 +7,8 @@
 from litex.build.generic_platform import *
 from litex.build.microsemi import MicrosemiPlatform
 
+from litex_boards.integration.constraints import index_constraints
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -101,6 +103,7 @@ class Platform(MicrosemiPlatform):
 
     def __init__(self, toolchain="libero_soc_polarfire"):
         MicrosemiPlatform.__init__(self, "MPF300TS_ES-FCG484-1", _io, toolchain=toolchain)
+        index_constraints(self)
 
     def do_finalize(self, fragment):
         MicrosemiPlatform.do_finalize(self, fragment)
@@ -13,6 +13,8 @@
 from litex.build.generic_platform import *
 from litex.build.lattice import LatticePlatform
 
+from litex_boards.integration.constraints import index_constraints
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -67,6 +69,7 @@ class Platform(LatticePlatform):
 
     def __init__(self, toolchain="trellis", **kwargs):
         LatticePlatform.__init__(self, "LFE5U-25F-8BG381C", _io, toolchain=toolchain, **kwargs)
+        index_constraints(self)
 
     def do_finalize(self, fragment):
         LatticePlatform.do_finalize(self, fragment)
@@ -12,6 +12,8 @@ from litex.build.generic_platform import *
 from litex.build.lattice import LatticePlatform
 from litex.build.lattice.programmer import OpenOCDJTAGProgrammer
 
+from litex_boards.integration.constraints import index_constraints
+
 # IOs ----------------------------------------------------------------------------------------------
 
 # Documented by @derekmulcahy
@@ -229,6 +231,7 @@ class Platform(LatticePlatform):
         io = {"6.0": _io_v6_0, "7.1": _io_v7_1}[revision]
         connectors = {"6.0": _connectors_v6_0, "7.1": _connectors_v7_1}[revision]
         LatticePlatform.__init__(self, device, io, connectors=connectors, toolchain=toolchain)
+        index_constraints(self)
 
     def create_programmer(self):
         return OpenOCDJTAGProgrammer("openocd_colorlight_5a_75b.cfg")
@@ -13,6 +13,8 @@ from litex.build.generic_platform import *
 from litex.build.lattice import LatticePlatform
 from litex.build.lattice.programmer import EcpDapProgrammer
 
+from litex_boards.integration.constraints import index_constraints
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io_v7_0 = [ # Documented by @smunaut
@@ -203,6 +205,7 @@ class Platform(LatticePlatform):
             connectors = {"7.2": _connectors_v7_2}[revision]
 
         LatticePlatform.__init__(self, device, io, connectors=connectors, toolchain=toolchain)
+        index_constraints(self)
 
     def create_programmer(self):
         return EcpDapProgrammer()
@@ -9,6 +9,8 @@ from litex.build.generic_platform import *
 from litex.build.xilinx import XilinxPlatform
 from litex.build.openocd import OpenOCD
 
+from litex_boards.integration.constraints import index_constraints
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -344,6 +346,7 @@ class Platform(XilinxPlatform):
             "a7-100": "xc7a100tcsg324-1"
         }[variant]
         XilinxPlatform.__init__(self, device, _io, _connectors, toolchain=toolchain)
+        index_constraints(self)
         self.toolchain.bitstream_commands = \
             ["set_property BITSTREAM.CONFIG.SPI_BUSWIDTH 4 [current_design]"]
         self.toolchain.additional_commands = \
@@ -4,6 +4,8 @@
 from litex.build.generic_platform import Pins, IOStandard, Subsignal
 from litex.build.xilinx import XilinxPlatform, VivadoProgrammer
 
+from litex_boards.integration.constraints import index_constraints
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -226,6 +228,7 @@ class Platform(XilinxPlatform):
         }[variant]
 
         XilinxPlatform.__init__(self, device, _io, _connectors, toolchain=toolchain)
+        index_constraints(self)
 
     def create_programmer(self):
         return VivadoProgrammer()
@@ -7,6 +7,8 @@
 from litex.build.generic_platform import *
 from litex.build.xilinx import XilinxPlatform
 
+from litex_boards.integration.constraints import index_constraints
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -221,6 +223,7 @@ class Platform(XilinxPlatform):
 
     def __init__(self, toolchain="ise"):
         XilinxPlatform.__init__(self,  "xc6slx45-csg324-3", _io, _connectors, toolchain=toolchain)
+        index_constraints(self)
         self.add_platform_command("""CONFIG VCCAUX="3.3";""")
 
     def create_programmer(self):
@@ -10,6 +10,8 @@ from litex.build.generic_platform import Pins, Subsignal, IOStandard, Misc
 from litex.build.xilinx import XilinxPlatform
 from litex.build.openocd import OpenOCD
 
+from litex_boards.integration.constraints import index_constraints
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -86,6 +88,7 @@ class Platform(XilinxPlatform):
             "a7-35": "xc7a35tcpg236-1"
         }[variant]
         XilinxPlatform.__init__(self, device, _io, _connectors, toolchain=toolchain)
+        index_constraints(self)
 
     def create_programmer(self):
         bscan_spi = "bscan_spi_xc7a15t.bit" if "xc7a15t" in self.device else "bscan_spi_xc7a35t.bit"
@@ -7,6 +7,8 @@
 from litex.build.generic_platform import *
 from litex.build.xilinx import XilinxPlatform, VivadoProgrammer
 
+from litex_boards.integration.constraints import index_constraints
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -168,6 +170,7 @@ class Platform(XilinxPlatform):
 
     def __init__(self, toolchain="vivado"):
         XilinxPlatform.__init__(self, "xc7z020-clg400-1", _io,  _connectors, toolchain=toolchain)
+        index_constraints(self)
         self.add_extension(_ps7_io)
         self.add_extension(_hdmi_rx_io)
         self.add_extension(_hdmi_tx_io)
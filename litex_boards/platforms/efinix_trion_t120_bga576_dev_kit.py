@@ -9,6 +9,8 @@ from litex.build.generic_platform import *
 from litex.build.efinix.platform import EfinixPlatform
 from litex.build.efinix import EfinixProgrammer
 
+from litex_boards.integration.constraints import index_constraints
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -157,6 +159,7 @@ class Platform(EfinixPlatform):
 
     def __init__(self, toolchain="efinity"):
         EfinixPlatform.__init__(self, "T120F576I4", _io, _connectors, iobank_info=_bank_info, toolchain=toolchain)
+        index_constraints(self)
 
     def create_programmer(self):
         return EfinixProgrammer()
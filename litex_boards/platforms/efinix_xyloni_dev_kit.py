@@ -8,6 +8,8 @@ from litex.build.generic_platform import *
 from litex.build.efinix.platform import EfinixPlatform
 from litex.build.openfpgaloader import OpenFPGALoader
 
+from litex_boards.integration.constraints import index_constraints
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -75,6 +77,7 @@ class Platform(EfinixPlatform):
 
     def __init__(self, toolchain="efinity"):
         EfinixPlatform.__init__(self, "T8F81C2", _io, _connectors, toolchain=toolchain)
+        index_constraints(self)
 
     def create_programmer(self):
         return OpenFPGALoader("xyloni_spi")
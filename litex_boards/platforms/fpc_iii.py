@@ -8,6 +8,8 @@ from litex.build.generic_platform import *
 from litex.build.lattice import LatticePlatform
 from litex.build.lattice.programmer import OpenOCDJTAGProgrammer
 
+from litex_boards.integration.constraints import index_constraints
+
 import os
 
 # IOs ----------------------------------------------------------------------------------------------
@@ -155,6 +157,7 @@ class Platform(LatticePlatform):
 
     def __init__(self, toolchain="trellis", **kwargs):
         LatticePlatform.__init__(self, "LFE5U-85F-8BG381", _io, _connectors, toolchain=toolchain, **kwargs)
+        index_constraints(self)
 
     def request(self, *args, **kwargs):
         return LatticePlatform.request(self, *args, **kwargs)
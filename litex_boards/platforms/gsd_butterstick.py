@@ -9,6 +9,8 @@ from litex.build.generic_platform import *
 from litex.build.lattice import LatticePlatform
 from litex.build.lattice.programmer import OpenOCDJTAGProgrammer
 
+from litex_boards.integration.constraints import index_constraints
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io_r1_0 = [
@@ -193,6 +195,7 @@ class Platform(LatticePlatform):
         io         = {"1.0": _io_r1_0}[revision]
         connectors = {"1.0": _connectors_r1_0}[revision]
         LatticePlatform.__init__(self, f"LFE5UM5G-{device}-8BG381C", io, connectors, toolchain=toolchain, **kwargs)
+        index_constraints(self)
 
     def create_programmer(self):
         return OpenOCDJTAGProgrammer("openocd_butterstick.cfg")
@@ -10,6 +10,8 @@
 from litex.build.generic_platform import *
 from litex.build.lattice import LatticePlatform
 
+from litex_boards.integration.constraints import index_constraints
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -228,6 +230,7 @@ class Platform(LatticePlatform):
     def __init__(self, toolchain="trellis", **kwargs):
         LatticePlatform.__init__(self, "LFE5U-45F-8CABGA381", io=_io, connectors=_connectors,
             toolchain=toolchain, **kwargs)
+        index_constraints(self)
 
     def create_programmer(self):
         raise ValueError("{} programmer is not supported"
@@ -8,6 +8,8 @@ from litex.build.generic_platform import *
 from litex.build.xilinx import XilinxPlatform
 from litex.build.openocd import OpenOCD
 
+from litex_boards.integration.constraints import index_constraints
+
 # Board support for this chinese Kintex 420T board by "HPC FPGA Board Store"
 # https://www.aliexpress.com/item/1005001631827738.html
 
@@ -321,6 +323,7 @@ class Platform(XilinxPlatform):
         _io = _get_io(io_standard)
 
         XilinxPlatform.__init__(self, "xc7k420t-ffg901-2", _io, _connectors, toolchain="vivado")
+        index_constraints(self)
         self.add_platform_command("""
         set_property CONFIG_VOLTAGE 3.3 [current_design]
         set_property CFGBVS VCCO [current_design]""")
@@ -10,6 +10,8 @@ from litex.build.generic_platform import *
 from litex.build.xilinx import XilinxPlatform, VivadoProgrammer
 from litex.build.openocd import OpenOCD
 
+from litex_boards.integration.constraints import index_constraints
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -211,6 +213,7 @@ class Platform(XilinxPlatform):
 
     def __init__(self) -> None:
         XilinxPlatform.__init__(self, "xc7a200t-fbg484-1", _io, _connectors, toolchain="vivado")
+        index_constraints(self)
         self.add_platform_command("set_property INTERNAL_VREF 0.750 [get_iobanks 34]")
         self.add_platform_command("set_property INTERNAL_VREF 0.750 [get_iobanks 35]")
 
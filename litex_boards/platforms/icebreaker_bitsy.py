@@ -13,6 +13,8 @@ from litex.build.dfu import DFUProg
 from litex.build.generic_platform import *
 from litex.build.lattice import LatticePlatform
 
+from litex_boards.integration.constraints import index_constraints
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io_v0 = [
@@ -131,6 +133,7 @@ class Platform(LatticePlatform):
             "v1": (_io_v1, _connectors_v1),
         }[revision]
         LatticePlatform.__init__(self, "ice40-up5k-sg48", io, connectors, toolchain=toolchain)
+        index_constraints(self)
 
     def create_programmer(self):
         return DFUProg(vid="1d50", pid="6146")
@@ -8,6 +8,8 @@ from litex.build.generic_platform import *
 from litex.build.xilinx import XilinxPlatform
 from litex.build.openocd import OpenOCD
 
+from litex_boards.integration.constraints import index_constraints
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -197,6 +199,7 @@ class Platform(XilinxPlatform):
             "a7-100": "xc7a100t-fgg484-2"
         }[variant]
         XilinxPlatform.__init__(self, device, _io, toolchain=toolchain)
+        index_constraints(self)
 
     def create_programmer(self):
         bscan_spi = "bscan_spi_xc7a100t.bit" if "xc7a100t" in self.device else "bscan_spi_xc7a35t.bit"
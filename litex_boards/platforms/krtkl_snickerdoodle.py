@@ -8,6 +8,8 @@
 from litex.build.generic_platform import *
 from litex.build.xilinx import XilinxPlatform, VivadoProgrammer
 
+from litex_boards.integration.constraints import index_constraints
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -76,6 +78,7 @@ class Platform(XilinxPlatform):
             "z7-20": "xc7z020-clg400-3"
         }[variant]
         XilinxPlatform.__init__(self, device, _io,  _connectors, toolchain=toolchain)
+        index_constraints(self)
         self.default_clk_period = 1e9 / self.default_clk_freq
         self.toolchain.bitstream_commands = [
             "set_property BITSTREAM.GENERAL.COMPRESS TRUE [current_design]"
@@ -8,6 +8,8 @@ from litex.build.generic_platform import *
 from litex.build.lattice import LatticePlatform
 from litex.build.openfpgaloader import OpenFPGALoader
 
+from litex_boards.integration.constraints import index_constraints
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -175,6 +177,7 @@ class Platform(LatticePlatform):
     def __init__(self, device="85F", toolchain="trellis", **kwargs):
         assert device in ["45F", "85F"]
         LatticePlatform.__init__(self, f"LFE5UM5G-{device}-8BG554I", _io, _connectors, toolchain=toolchain, **kwargs)
+        index_constraints(self)
 
     def create_programmer(self):
         return OpenFPGALoader("ecpix5")
@@ -9,6 +9,8 @@ from litex.build.generic_platform import *
 from litex.build.lattice import LatticePlatform
 from litex.build.lattice.programmer import LatticeProgrammer
 
+from litex_boards.integration.constraints import index_constraints
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -257,6 +259,7 @@ class Platform(LatticePlatform):
             device == "LIFCL-40-9BG400C"
         assert device in ["LIFCL-40-9BG400C", "LIFCL-40-8BG400CES"]
         LatticePlatform.__init__(self, device, _io, _connectors, toolchain=toolchain, **kwargs)
+        index_constraints(self)
 
     def create_programmer(self, mode = "direct"):
         assert mode in ["direct","flash"]
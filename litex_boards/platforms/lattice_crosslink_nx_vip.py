@@ -10,6 +10,8 @@ from litex.build.generic_platform import *
 from litex.build.lattice import LatticePlatform
 from litex.build.lattice.programmer import LatticeProgrammer
 
+from litex_boards.integration.constraints import index_constraints
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -207,6 +209,7 @@ class Platform(LatticePlatform):
     def __init__(self, device="LIFCL", toolchain="radiant", **kwargs):
         assert device in ["LIFCL"]
         LatticePlatform.__init__(self, device + "-40-9BG400C", _io, _connectors, toolchain=toolchain, **kwargs)
+        index_constraints(self)
 
     def create_programmer(self, mode = "direct"):
         assert mode in ["direct","flash"]
@@ -8,6 +8,8 @@ from litex.build.generic_platform import *
 from litex.build.lattice import LatticePlatform
 from litex.build.lattice.programmer import OpenOCDJTAGProgrammer
 
+from litex_boards.integration.constraints import index_constraints
+
 import os
 
 # IOs ----------------------------------------------------------------------------------------------
@@ -138,6 +140,7 @@ class Platform(LatticePlatform):
 
     def __init__(self, toolchain="trellis", **kwargs):
         LatticePlatform.__init__(self, "LFE5UM5G-85F-8BG381", _io, _connectors, toolchain=toolchain, **kwargs)
+        index_constraints(self)
 
     def request(self, *args, **kwargs):
         import time
@@ -2,6 +2,8 @@ from litex.build.generic_platform import *
 from litex.build.lattice import LatticePlatform
 from litex.build.lattice.programmer import IceStormProgrammer
 
+from litex_boards.integration.constraints import index_constraints
+
 
 _io = [
     # Clk
@@ -118,6 +120,7 @@ class Platform(LatticePlatform):
 
     def __init__(self, toolchain="icestorm"):
         LatticePlatform.__init__(self, "ice40-up5k-sg48", _io, _connectors, toolchain=toolchain)
+        index_constraints(self)
         self.add_extension(serial)
         self.add_extension(spiflash)
 
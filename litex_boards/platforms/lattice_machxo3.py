@@ -8,6 +8,8 @@ from litex.build.generic_platform import *
 from litex.build.lattice import LatticePlatform
 from litex.build.lattice.programmer import LatticeProgrammer
 
+from litex_boards.integration.constraints import index_constraints
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -46,6 +48,7 @@ class Platform(LatticePlatform):
 
     def __init__(self, toolchain="diamond"):
         LatticePlatform.__init__(self, "LCMXO3L-6900C-5BG256C", _io, toolchain=toolchain)
+        index_constraints(self)
 
     def create_programmer(self):
         _xcf_template = """
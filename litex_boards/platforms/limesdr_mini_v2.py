@@ -8,6 +8,8 @@ from litex.build.generic_platform import *
 from litex.build.lattice import LatticePlatform
 from litex.build.lattice.programmer import OpenOCDJTAGProgrammer
 
+from litex_boards.integration.constraints import index_constraints
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -116,6 +118,7 @@ class Platform(LatticePlatform):
     def __init__(self, device="LFE5U", toolchain="trellis", **kwargs):
         assert device in ["LFE5U"]
         LatticePlatform.__init__(self, device + "-45F-8MG285C", _io, toolchain=toolchain, **kwargs)
+        index_constraints(self)
 
     def create_programmer(self):
         return OpenOCDJTAGProgrammer("openocd_limesdr_mini_v2.cfg")
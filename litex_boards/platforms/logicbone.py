@@ -13,6 +13,8 @@ from litex.build.generic_platform import *
 from litex.build.lattice import LatticePlatform
 from litex.build.dfu import DFUProg
 
+from litex_boards.integration.constraints import index_constraints
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io_rev0 = [
@@ -198,6 +200,7 @@ class Platform(LatticePlatform):
         io         = {"rev0": _io_rev0          }[revision]
         connectors = {"rev0": _connectors_rev0  }[revision]
         LatticePlatform.__init__(self, f"LFE5UM5G-{device}-8BG381C", io, connectors, toolchain=toolchain, **kwargs)
+        index_constraints(self)
 
     def create_programmer(self):
         return DFUProg(vid="1d50", pid="6130")
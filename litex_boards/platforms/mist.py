@@ -8,6 +8,8 @@ from litex.build.generic_platform import *
 from litex.build.altera import AlteraPlatform
 from litex.build.altera.programmer import USBBlaster
 
+from litex_boards.integration.constraints import index_constraints
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -83,6 +85,7 @@ class Platform(AlteraPlatform):
 
     def __init__(self, toolchain="quartus"):
         AlteraPlatform.__init__(self, "EP3C25E144C8", _io, toolchain="quartus")
+        index_constraints(self)
         self.add_platform_command("set_global_assignment -name FAMILY \"Cyclone III\"")
         self.add_platform_command("set_global_assignment -name DEVICE_FILTER_PIN_COUNT 144")
         self.add_platform_command("set_global_assignment -name CYCLONEII_OPTIMIZATION_TECHNIQUE BALANCED")
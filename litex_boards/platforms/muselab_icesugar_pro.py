@@ -11,6 +11,8 @@ from litex.build.generic_platform import *
 from litex.build.lattice import LatticePlatform
 from litex.build.lattice.programmer import EcpDapProgrammer
 
+from litex_boards.integration.constraints import index_constraints
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -117,6 +119,7 @@ class Platform(LatticePlatform):
         io         = _io
         connectors = _connectors
         LatticePlatform.__init__(self, device, io, connectors=connectors, toolchain=toolchain)
+        index_constraints(self)
 
     def create_programmer(self):
         return EcpDapProgrammer()
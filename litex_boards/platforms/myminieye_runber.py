@@ -10,6 +10,8 @@ from litex.build.generic_platform import *
 from litex.build.gowin.platform import GowinPlatform
 from litex.build.openfpgaloader import OpenFPGALoader
 
+from litex_boards.integration.constraints import index_constraints
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -105,6 +107,7 @@ class Platform(GowinPlatform):
 
     def __init__(self, toolchain="gowin"):
         GowinPlatform.__init__(self, "GW1N-UV4LQ144C6/I5", _io, _connectors, toolchain=toolchain, devicename="GW1N-4")
+        index_constraints(self)
         self.toolchain.options["use_mspi_as_gpio"] = 1
 
     def create_programmer(self):
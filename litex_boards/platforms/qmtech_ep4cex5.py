@@ -9,6 +9,8 @@ from litex.build.generic_platform import *
 from litex.build.altera import AlteraPlatform
 from litex.build.altera.programmer import USBBlaster
 
+from litex_boards.integration.constraints import index_constraints
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -147,6 +149,7 @@ class Platform(AlteraPlatform):
             io += self.core_resources
 
         AlteraPlatform.__init__(self, device, io, connectors, toolchain=toolchain)
+        index_constraints(self)
 
         if with_daughterboard:
             # an ethernet pin takes K22, so make it available
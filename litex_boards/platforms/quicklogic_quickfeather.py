@@ -7,6 +7,8 @@
 from litex.build.generic_platform import *
 from litex.build.quicklogic import QuickLogicPlatform
 
+from litex_boards.integration.constraints import index_constraints
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -24,4 +26,5 @@ _io = [
 class Platform(QuickLogicPlatform):
     def __init__(self, toolchain="symbiflow"):
         QuickLogicPlatform.__init__(self, "ql-eos-s3", _io, toolchain=toolchain)
+        index_constraints(self)
 
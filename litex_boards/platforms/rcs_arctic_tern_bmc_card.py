@@ -8,6 +8,8 @@ from litex.build.generic_platform import *
 from litex.build.lattice import LatticePlatform
 from litex.build.lattice.programmer import OpenOCDJTAGProgrammer
 
+from litex_boards.integration.constraints import index_constraints
+
 import os
 
 # IOs ----------------------------------------------------------------------------------------------
@@ -235,6 +237,7 @@ class Platform(LatticePlatform):
         if device == "LFE5UM5G":
             speed_grade = "8"
         LatticePlatform.__init__(self, device + "-85F-" + speed_grade + "CABGA381", _io, toolchain=toolchain, **kwargs)
+        index_constraints(self)
 
     def request(self, *args, **kwargs):
         return LatticePlatform.request(self, *args, **kwargs)
@@ -7,6 +7,8 @@
 from litex.build.generic_platform import *
 from litex.build.xilinx import XilinxPlatform, VivadoProgrammer
 
+from litex_boards.integration.constraints import index_constraints
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -154,6 +156,7 @@ class Platform(XilinxPlatform):
         self.default_clk_period = 1e9/self.default_clk_freq
 
         XilinxPlatform.__init__(self, device, _io,  _connectors, toolchain=toolchain)
+        index_constraints(self)
         self.add_extension(extension)
         self.add_extension(_ps7_io)
         self.add_extension(_uart_io)
@@ -8,6 +8,8 @@ from litex.build.generic_platform import *
 from litex.build.xilinx import XilinxPlatform
 from litex.build.xilinx.programmer import XC3SProg
 
+from litex_boards.integration.constraints import index_constraints
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -157,6 +159,7 @@ class Platform(XilinxPlatform):
     def __init__(self, device="xc6slx25", toolchain="ise"):
         assert device in ["xc6slx9", "xc6slx25"]
         XilinxPlatform.__init__(self, device+"-3-ftg256", _io, _connectors, toolchain=toolchain)
+        index_constraints(self)
 
     def create_programmer(self):
         return XC3SProg(cable="ftdi")
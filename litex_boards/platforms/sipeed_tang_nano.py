@@ -14,6 +14,8 @@ from litex.build.generic_platform import *
 from litex.build.gowin.platform import GowinPlatform
 from litex.build.openfpgaloader import OpenFPGALoader
 
+from litex_boards.integration.constraints import index_constraints
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -49,6 +51,7 @@ class Platform(GowinPlatform):
 
     def __init__(self, toolchain="gowin"):
         GowinPlatform.__init__(self, "GW1N-LV1QN48C6/I5", _io, _connectors, toolchain=toolchain, devicename="GW1N-1")
+        index_constraints(self)
         self.toolchain.options["use_done_as_gpio"]      = 1
         self.toolchain.options["use_reconfign_as_gpio"] = 1
 
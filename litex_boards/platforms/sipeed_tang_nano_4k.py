@@ -15,6 +15,8 @@ from litex.build.generic_platform import *
 from litex.build.gowin.platform import GowinPlatform
 from litex.build.openfpgaloader import OpenFPGALoader
 
+from litex_boards.integration.constraints import index_constraints
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -88,6 +90,7 @@ class Platform(GowinPlatform):
 
     def __init__(self, toolchain="gowin"):
         GowinPlatform.__init__(self, "GW1NSR-LV4CQN48PC7/I6", _io, _connectors, toolchain=toolchain, devicename="GW1NSR-4C")
+        index_constraints(self)
         self.toolchain.options["use_mode_as_gpio"] = 1
         self.toolchain.options["use_mspi_as_gpio"] = 1
         self.toolchain.options["use_done_as_gpio"] = 1
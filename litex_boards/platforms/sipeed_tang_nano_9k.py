@@ -11,6 +11,8 @@ from litex.build.gowin.platform import GowinPlatform
 from litex.build.gowin.programmer import GowinProgrammer
 from litex.build.openfpgaloader import OpenFPGALoader
 
+from litex_boards.integration.constraints import index_constraints
+
 
 # IOs ----------------------------------------------------------------------------------------------
 
@@ -91,6 +93,7 @@ class Platform(GowinPlatform):
 
     def __init__(self, toolchain="gowin"):
         GowinPlatform.__init__(self, "GW1NR-LV9QN88PC6/I5", _io, _connectors, toolchain=toolchain, devicename="GW1NR-9C")
+        index_constraints(self)
         self.toolchain.options["use_mspi_as_gpio"] = 1
 
     def create_programmer(self, kit="openfpgaloader"):
@@ -18,6 +18,8 @@ from litex.build.generic_platform import *
 from litex.build.anlogic.platform import AnlogicPlatform
 from litex.build.openfpgaloader import OpenFPGALoader
 
+from litex_boards.integration.constraints import index_constraints
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -52,6 +54,7 @@ class Platform(AnlogicPlatform):
 
     def __init__(self, toolchain="td"):
         AnlogicPlatform.__init__(self, "EG4S20BG256", _io, _connectors, toolchain=toolchain)
+        index_constraints(self)
 
     def create_programmer(self):
         return OpenFPGALoader("licheeTang")
@@ -9,6 +9,8 @@ from litex.build.altera            import AlteraPlatform
 from litex.build.altera.programmer import USBBlaster
 from litex.build.generic_platform  import Pins, IOStandard, Subsignal, Misc
 
+from litex_boards.integration.constraints import index_constraints
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -190,6 +192,7 @@ class Platform(AlteraPlatform):
         assert revision in _device_map.keys()
         self.revision = revision
         AlteraPlatform.__init__(self, _device_map[revision], _io, connectors=_connectors_hsmc_gpio_daughterboard, toolchain=toolchain)
+        index_constraints(self)
 
     def create_programmer(self):
         return USBBlaster(cable_name="CV SoCKit")
@@ -9,6 +9,8 @@ from litex.build.generic_platform import *
 from litex.build.altera import AlteraPlatform
 from litex.build.altera.programmer import USBBlaster
 
+from litex_boards.integration.constraints import index_constraints
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -128,6 +130,7 @@ class Platform(AlteraPlatform):
 
     def __init__(self, toolchain="quartus"):
         AlteraPlatform.__init__(self, "10CL055YU484A7G", _io, toolchain=toolchain)
+        index_constraints(self)
 
     def create_programmer(self):
         return USBBlaster(cable_name="Arrow-USB-Blaster")
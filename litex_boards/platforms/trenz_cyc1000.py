@@ -8,6 +8,8 @@ from litex.build.generic_platform import *
 from litex.build.altera import AlteraPlatform
 from litex.build.altera.programmer import USBBlaster
 
+from litex_boards.integration.constraints import index_constraints
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -69,6 +71,7 @@ class Platform(AlteraPlatform):
 
     def __init__(self, toolchain="quartus"):
         AlteraPlatform.__init__(self, "10CL025YU256C8G", _io, toolchain=toolchain)
+        index_constraints(self)
 
     def create_programmer(self):
         return USBBlaster(cable_name="Arrow-USB-Blaster")
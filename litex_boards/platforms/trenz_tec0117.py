@@ -11,6 +11,8 @@ from litex.build.generic_platform import *
 from litex.build.gowin.platform import GowinPlatform
 from litex.build.openfpgaloader import OpenFPGALoader
 
+from litex_boards.integration.constraints import index_constraints
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -110,6 +112,7 @@ class Platform(GowinPlatform):
 
     def __init__(self, toolchain="gowin"):
         GowinPlatform.__init__(self, "GW1NR-LV9QN88C6/I5", _io, _connectors, toolchain=toolchain, devicename="GW1NR-9")
+        index_constraints(self)
 
     def create_programmer(self):
         return OpenFPGALoader("littleBee")
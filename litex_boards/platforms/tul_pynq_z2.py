@@ -7,6 +7,8 @@
 from litex.build.generic_platform import *
 from litex.build.xilinx import XilinxPlatform, VivadoProgrammer
 
+from litex_boards.integration.constraints import index_constraints
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -89,6 +91,7 @@ class Platform(XilinxPlatform):
 
     def __init__(self, toolchain="vivado"):
         XilinxPlatform.__init__(self, "xc7z020clg400-1", _io,  _connectors, toolchain=toolchain)
+        index_constraints(self)
         self.add_extension(_ps7_io)
         self.add_extension(_usb_uart_pmod_io)
 
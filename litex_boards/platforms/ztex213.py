@@ -17,6 +17,8 @@ from litex.build.generic_platform import *
 from litex.build.xilinx import XilinxPlatform
 from litex.build.openocd import OpenOCD
 
+from litex_boards.integration.constraints import index_constraints
+
 # IOs ----------------------------------------------------------------------------------------------
 
 _io = [
@@ -149,6 +151,7 @@ class Platform(XilinxPlatform):
             #"ztex2.13d":  "xc7a100tcsg324-2", #untested
         }[variant]
         XilinxPlatform.__init__(self, device, _io, _connectors, toolchain=toolchain)
+        index_constraints(self)
         if (expansion == "debug"):
             self.add_extension(_debug_io)
         else:
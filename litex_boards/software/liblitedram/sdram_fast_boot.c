@@ -0,0 +1,419 @@
+// This file is part of LiteX-Boards.
+//
+// SPDX-License-Identifier: BSD-2-Clause
+
+// Fast Boot SDRAM initialization.
+//
+// LiteX's liblitedram sdram.c is included here with its DDR PHY delays/bitslips CSRs accesses
+// recorded and its sdram_init renamed to fast_boot_sdram_init_full: the calibration found on first
+// boot is validated (memtest) and persisted (SPI Flash or Fast Boot RAM), then replayed on next
+// boots in place of the leveling.
+
+#include <generated/csr.h>
+#include <generated/mem.h>
+#include <generated/soc.h>
+
+#include <stdio.h>
+#include <stdint.h>
+#include <stddef.h>
+#include <string.h>
+
+#include <system.h>
+
+#include <libbase/crc.h>
+#include <libbase/memtest.h>
+
+#ifdef CSR_SDRAM_BASE
+#include <generated/sdram_phy.h>
+#endif
+#include <liblitedram/sdram.h>
+
+/* Calibration replay: DDR PHYs with leveling and resettable delays, with a calibration storage. */
+#if defined(CSR_SDRAM_BASE) && defined(CSR_DDRPHY_BASE) && \
+	(defined(SDRAM_PHY_WRITE_LEVELING_CAPABLE) || defined(SDRAM_PHY_READ_LEVELING_CAPABLE)) && \
+	!defined(SDRAM_PHY_USDDRPHY) && !defined(SDRAM_PHY_USPDDRPHY) && \
+	(defined(FAST_BOOT_FLASH_OFFSET) || defined(FAST_BOOT_RAM_BASE))
+#define FAST_BOOT_REPLAY
+#endif
+
+#ifdef FAST_BOOT_REPLAY
+
+/*-----------------------------------------------------------------------*/
+/* Calibration Recording                                                 */
+/*-----------------------------------------------------------------------*/
+
+#define FAST_BOOT_MAGIC 0x4642434c /* FBCL */
+
+struct fast_boot_calibration {
+	uint32_t magic;
+	uint32_t signature;
+	uint16_t cdly;
+	uint16_t rdly_dq[SDRAM_PHY_MODULES];
+	uint16_t rdly_dq_bitslip[SDRAM_PHY_MODULES];
+	uint16_t wdly_dq[SDRAM_PHY_MODULES];
+	uint16_t wdly_dqs[SDRAM_PHY_MODULES];
+	uint16_t wdly_dq_bitslip[SDRAM_PHY_MODULES];
+	uint32_t crc;
+};
+
+/* DDR PHY delays/bitslips state, recorded from the CSRs accesses. */
+static struct fast_boot_calibration fast_boot_state;
+static uint32_t fast_boot_dly_sel;
+
+static void fast_boot_record(uint16_t *taps, int rst)
+{
+	int module;
+	for (module=0; module<SDRAM_PHY_MODULES; module++)
+		if (fast_boot_dly_sel & (1 << module))
+			taps[module] = rst ? 0 : taps[module] + 1;
+}
+
+static void fast_boot_dly_sel_write(uint32_t v)
+{
+	fast_boot_dly_sel = v;
+	ddrphy_dly_sel_write(v);
+}
+#define ddrphy_dly_sel_write fast_boot_dly_sel_write
+
+#define FAST_BOOT_RECORDED_WRITE(csr, taps, rst) \
+static void fast_boot_##csr##_write(uint32_t v)  \
+{                                                \
+	fast_boot_record(fast_boot_state.taps, rst); \
+	ddrphy_##csr##_write(v);                     \
+}
+
+#ifdef CSR_DDRPHY_RDLY_DQ_RST_ADDR
+FAST_BOOT_RECORDED_WRITE(rdly_dq_rst, rdly_dq, 1)
+#define ddrphy_rdly_dq_rst_write fast_boot_rdly_dq_rst_write
+#endif
+#ifdef CSR_DDRPHY_RDLY_DQ_INC_ADDR
+FAST_BOOT_RECORDED_WRITE(rdly_dq_inc, rdly_dq, 0)
+#define ddrphy_rdly_dq_inc_write fast_boot_rdly_dq_inc_write
+#endif
+#ifdef CSR_DDRPHY_RDLY_DQ_BITSLIP_RST_ADDR
+FAST_BOOT_RECORDED_WRITE(rdly_dq_bitslip_rst, rdly_dq_bitslip, 1)
+#define ddrphy_rdly_dq_bitslip_rst_write fast_boot_rdly_dq_bitslip_rst_write
+#endif
+#ifdef CSR_DDRPHY_RDLY_DQ_BITSLIP_ADDR
+FAST_BOOT_RECORDED_WRITE(rdly_dq_bitslip, rdly_dq_bitslip, 0)
+#define ddrphy_rdly_dq_bitslip_write fast_boot_rdly_dq_bitslip_write
+#endif
+#ifdef CSR_DDRPHY_WDLY_DQ_RST_ADDR
+FAST_BOOT_RECORDED_WRITE(wdly_dq_rst, wdly_dq, 1)
+#define ddrphy_wdly_dq_rst_write fast_boot_wdly_dq_rst_write
+#endif
+#ifdef CSR_DDRPHY_WDLY_DQ_INC_ADDR
+FAST_BOOT_RECORDED_WRITE(wdly_dq_inc, wdly_dq, 0)
+#define ddrphy_wdly_dq_inc_write fast_boot_wdly_dq_inc_write
+#endif
+#ifdef CSR_DDRPHY_WDLY_DQS_RST_ADDR
+FAST_BOOT_RECORDED_WRITE(wdly_dqs_rst, wdly_dqs, 1)
+#define ddrphy_wdly_dqs_rst_write fast_boot_wdly_dqs_rst_write
+#endif
+#ifdef CSR_DDRPHY_WDLY_DQS_INC_ADDR
+FAST_BOOT_RECORDED_WRITE(wdly_dqs_inc, wdly_dqs, 0)
+#define ddrphy_wdly_dqs_inc_write fast_boot_wdly_dqs_inc_write
+#endif
+#ifdef CSR_DDRPHY_WDLY_DQ_BITSLIP_RST_ADDR
+FAST_BOOT_RECORDED_WRITE(wdly_dq_bitslip_rst, wdly_dq_bitslip, 1)
+#define ddrphy_wdly_dq_bitslip_rst_write fast_boot_wdly_dq_bitslip_rst_write
+#endif
+#ifdef CSR_DDRPHY_WDLY_DQ_BITSLIP_ADDR
+FAST_BOOT_RECORDED_WRITE(wdly_dq_bitslip, wdly_dq_bitslip, 0)
+#define ddrphy_wdly_dq_bitslip_write fast_boot_wdly_dq_bitslip_write
+#endif
+
+/* Cmd delay (not per module). */
+#ifdef CSR_DDRPHY_CDLY_RST_ADDR
+static void fast_boot_cdly_rst_write(uint32_t v)
+{
+	fast_boot_state.cdly = 0;
+	ddrphy_cdly_rst_write(v);
+}
+#define ddrphy_cdly_rst_write fast_boot_cdly_rst_write
+#endif
+#ifdef CSR_DDRPHY_CDLY_INC_ADDR
+static void fast_boot_cdly_inc_write(uint32_t v)
+{
+	fast_boot_state.cdly++;
+	ddrphy_cdly_inc_write(v);
+}
+#define ddrphy_cdly_inc_write fast_boot_cdly_inc_write
+#endif
+
+#endif /* FAST_BOOT_REPLAY */
+
+/*-----------------------------------------------------------------------*/
+/* LiteX's SDRAM initialization                                          */
+/*-----------------------------------------------------------------------*/
+
+int fast_boot_sdram_init_full(void);
+
+#define sdram_init fast_boot_sdram_init_full
+#include <liblitedram/sdram.c>
+#undef sdram_init
+
+#ifdef CSR_SDRAM_BASE
+
+static void fast_boot_mark(int id)
+{
+#ifdef CSR_BOOT_TIMELINE_BASE
+	boot_timeline_mark_write(id);
+#endif
+}
+
+#ifdef FAST_BOOT_REPLAY
+
+/*-----------------------------------------------------------------------*/
+/* Calibration Storage                                                   */
+/*-----------------------------------------------------------------------*/
+
+#ifdef FAST_BOOT_FLASH_OFFSET
+#define FAST_BOOT_STORAGE (SPIFLASH_BASE + FAST_BOOT_FLASH_OFFSET)
+#else
+#define FAST_BOOT_STORAGE FAST_BOOT_RAM_BASE
+#endif
+
+static uint32_t fast_boot_crc(const struct fast_boot_calibration *cal)
+{
+	return crc32((const unsigned char *) cal, offsetof(struct fast_boot_calibration, crc));
+}
+
+static int fast_boot_load(struct fast_boot_calibration *cal)
+{
+	flush_cpu_dcache();
+	memcpy(cal, (const void *) FAST_BOOT_STORAGE, sizeof(*cal));
+	return (cal->magic == FAST_BOOT_MAGIC) &&
+		(cal->signature == FAST_BOOT_SIGNATURE) &&
+		(cal->crc == fast_boot_crc(cal));
+}
+
+#ifdef FAST_BOOT_FLASH_OFFSET
+
+/* Single line SPI Flash transfer (CS asserted for len bytes), returns the last received byte. */
+static uint8_t fast_boot_flash_xfer(const uint8_t *tx, int len)
+{
+	int i;
+	uint8_t rx = 0;
+
+	/* Be sure to empty RX queue before doing Xfer. */
+	while (spiflash_core_master_status_rx_ready_read())
+		spiflash_core_master_rxtx_read();
+
+	/* Configure Master */
+	spiflash_core_master_phyconfig_len_write(8);
+	spiflash_core_master_phyconfig_mask_write(1);
+	spiflash_core_master_phyconfig_width_write(1);
+
+	spiflash_core_master_cs_write(1);
+	for (i=0; i<len; i++) {
+		spiflash_core_master_rxtx_write(tx[i]);
+		while (!spiflash_core_master_status_rx_ready_read());
+		rx = spiflash_core_master_rxtx_read();
+	}
+	spiflash_core_master_cs_write(0);
+
+	return rx;
+}
+
+static void fast_boot_flash_write_cmd(uint8_t *buf, int len)
+{
+	uint8_t wren[1]  = {0x06}; /* Write Enable */
+	uint8_t rdsr[2]  = {0x05, 0x00}; /* Read Status Register */
+
+	fast_boot_flash_xfer(wren, 1);
+	fast_boot_flash_xfer(buf, len);
+	/* Wait while Write In Progress */
+	while (fast_boot_flash_xfer(rdsr, 2) & 0x01);
+}
+
+static void fast_boot_store(const struct fast_boot_calibration *cal)
+{
+	uint8_t buf[4 + SPIFLASH_MODULE_PAGE_SIZE];
+	uint32_t addr;
+	unsigned int offset, len;
+
+	/* Sector Erase (4KiB) */
+	addr   = FAST_BOOT_FLASH_OFFSET;
+	buf[0] = 0x20;
+	buf[1] = (addr >> 16) & 0xff;
+	buf[2] = (addr >>  8) & 0xff;
+	buf[3] = (addr >>  0) & 0xff;
+	fast_boot_flash_write_cmd(buf, 4);
+
+	/* Page Program */
+	for (offset=0; offset<sizeof(*cal); offset+=len) {
+		len    = min(sizeof(*cal) - offset, SPIFLASH_MODULE_PAGE_SIZE);
+		addr   = FAST_BOOT_FLASH_OFFSET + offset;
+		buf[0] = 0x02;
+		buf[1] = (addr >> 16) & 0xff;
+		buf[2] = (addr >>  8) & 0xff;
+		buf[3] = (addr >>  0) & 0xff;
+		memcpy(&buf[4], (const uint8_t *) cal + offset, len);
+		fast_boot_flash_write_cmd(buf, 4 + len);
+	}
+}
+
+#else
+
+static void fast_boot_store(const struct fast_boot_calibration *cal)
+{
+	memcpy((void *) FAST_BOOT_RAM_BASE, cal, sizeof(*cal));
+	flush_cpu_dcache();
+}
+
+#endif
+
+static void fast_boot_save(struct fast_boot_calibration *cal)
+{
+	cal->magic     = FAST_BOOT_MAGIC;
+	cal->signature = FAST_BOOT_SIGNATURE;
+	cal->crc       = fast_boot_crc(cal);
+	flush_cpu_dcache();
+	if (memcmp((const void *) FAST_BOOT_STORAGE, cal, sizeof(*cal)) == 0)
+		return;
+	printf("Saving SDRAM calibration @0x%08lx...\n", (unsigned long) FAST_BOOT_STORAGE);
+	fast_boot_store(cal);
+}
+
+/*-----------------------------------------------------------------------*/
+/* Calibration Replay                                                    */
+/*-----------------------------------------------------------------------*/
+
+static void fast_boot_replay(const struct fast_boot_calibration *cal)
+{
+	int module, i;
+
+#ifdef CSR_DDRPHY_CDLY_RST_ADDR
+	/* Cmd delay */
+	ddrphy_cdly_rst_write(1);
+	cdelay(100);
+	for (i=0; i<cal->cdly; i++) {
+		ddrphy_cdly_inc_write(1);
+		cdelay(100);
+	}
+#endif
+
+	for (module=0; module<SDRAM_PHY_MODULES; module++) {
+		/* Read delay/bitslip */
+		sdram_read_leveling_rst_delay(module);
+		for (i=0; i<cal->rdly_dq[module]; i++)
+			sdram_read_leveling_inc_delay(module);
+		sdram_read_leveling_rst_bitslip(module);
+		for (i=0; i<cal->rdly_dq_bitslip[module]; i++)
+			sdram_read_leveling_inc_bitslip(module);
+
+		/* Write delays/bitslip */
+		ddrphy_dly_sel_write(1 << module);
+#ifdef CSR_DDRPHY_WDLY_DQ_RST_ADDR
+		ddrphy_wdly_dq_rst_write(1);
+		cdelay(100);
+		for (i=0; i<cal->wdly_dq[module]; i++)
+			ddrphy_wdly_dq_inc_write(1);
+#endif
+#ifdef CSR_DDRPHY_WDLY_DQS_RST_ADDR
+		ddrphy_wdly_dqs_rst_write(1);
+		cdelay(100);
+		for (i=0; i<cal->wdly_dqs[module]; i++)
+			ddrphy_wdly_dqs_inc_write(1);
+#endif
+#ifdef CSR_DDRPHY_WDLY_DQ_BITSLIP_RST_ADDR
+		ddrphy_wdly_dq_bitslip_rst_write(1);
+		for (i=0; i<cal->wdly_dq_bitslip[module]; i++)
+			ddrphy_wdly_dq_bitslip_write(1);
+#endif
+		ddrphy_dly_sel_write(0);
+	}
+}
+
+static int fast_boot_sdram_init_replay(const struct fast_boot_calibration *cal)
+{
+	struct memtest_config config = {0, 0, NULL, NULL};
+
+	/* LiteX's SDRAM initialization with the calibration replayed in place of the leveling. */
+#ifdef CSR_DDRPHY_RDPHASE_ADDR
+	ddrphy_rdphase_write(SDRAM_PHY_RDPHASE);
+#endif
+#ifdef CSR_DDRPHY_WRPHASE_ADDR
+	ddrphy_wrphase_write(SDRAM_PHY_WRPHASE);
+#endif
+	printf("Initializing SDRAM @0x%08lx (calibration replay)...\n", MAIN_RAM_BASE);
+	sdram_software_control_on();
+#if CSR_DDRPHY_RST_ADDR
+	ddrphy_rst_write(1);
+	cdelay(1000);
+	ddrphy_rst_write(0);
+	cdelay(1000);
+#endif
+
+#ifdef CSR_DDRCTRL_BASE
+	ddrctrl_init_done_write(0);
+	ddrctrl_init_error_write(0);
+#endif
+	init_sequence();
+	fast_boot_replay(cal);
+	sdram_software_control_off();
+	fast_boot_mark(BOOT_TIMELINE_SDRAM_REPLAYED);
+
+	/* Quick check of the replayed calibration */
+	if (memtest_bus((unsigned int *) MAIN_RAM_BASE, 1024) != 0)
+		return 0;
+	if (memtest_data((unsigned int *) MAIN_RAM_BASE, 4096, 1, &config) != 0)
+		return 0;
+#ifdef CSR_DDRCTRL_BASE
+	ddrctrl_init_done_write(1);
+#endif
+	return 1;
+}
+
+static int fast_boot_sdram_init_calibrate(void)
+{
+	/* LiteX's SDRAM initialization (recorded). */
+	memset(&fast_boot_state, 0, sizeof(fast_boot_state));
+	if (!fast_boot_sdram_init_full())
+		return 0;
+	fast_boot_mark(BOOT_TIMELINE_SDRAM_CALIBRATED);
+
+	/* Validate the calibration before persisting it. */
+	if (!memtest((unsigned int *) MAIN_RAM_BASE, min(MAIN_RAM_SIZE, MEMTEST_DATA_SIZE))) {
+#ifdef CSR_DDRCTRL_BASE
+		ddrctrl_init_error_write(1);
+#endif
+		return 0;
+	}
+	fast_boot_save(&fast_boot_state);
+	return 1;
+}
+
+#endif /* FAST_BOOT_REPLAY */
+
+/*-----------------------------------------------------------------------*/
+/* Initialization                                                        */
+/*-----------------------------------------------------------------------*/
+
+int sdram_init(void)
+{
+	int ok;
+#ifdef FAST_BOOT_REPLAY
+	struct fast_boot_calibration cal;
+#endif
+
+	fast_boot_mark(BOOT_TIMELINE_SDRAM_INIT);
+#ifdef FAST_BOOT_REPLAY
+	ok = 0;
+	if (fast_boot_load(&cal)) {
+		ok = fast_boot_sdram_init_replay(&cal);
+		if (!ok)
+			printf("SDRAM calibration replay failed, calibrating...\n");
+	}
+	if (!ok)
+		ok = fast_boot_sdram_init_calibrate();
+#else
+	ok = fast_boot_sdram_init_full();
+#endif
+	if (ok)
+		fast_boot_mark(BOOT_TIMELINE_SDRAM_READY);
+	return ok;
+}
+
+#endif /* CSR_SDRAM_BASE */
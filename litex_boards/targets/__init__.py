@@ -0,0 +1,46 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# LiteX-Boards Targets Registry.
+#
+# Targets are listed from the package directory (without importing them) and imported on first
+# access only:
+#
+# >>> from litex_boards import targets
+# >>> targets.available()
+# >>> targets.get("digilent_arty")
+# >>> targets.digilent_arty
+
+import os
+import importlib
+
+_targets_dir = os.path.dirname(__file__)
+_targets     = None
+
+def available():
+    """Return the names of the available targets (no target is imported)."""
+    global _targets
+    if _targets is None:
+        _targets = []
+        for file in sorted(os.listdir(_targets_dir)):
+            name, ext = os.path.splitext(file)
+            if (ext == ".py") and (not name.startswith("_")):
+                _targets.append(name)
+    return list(_targets)
+
+def get(name):
+    """Import and return the module of a target."""
+    if name not in available():
+        raise ValueError("Unknown target {}, available: {}.".format(name, ", ".join(available())))
+    return importlib.import_module("{}.{}".format(__name__, name))
+
+def __getattr__(name):
+    # Lazy loading of the targets on attribute access.
+    if name in available():
+        return get(name)
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+def __dir__():
+    return sorted(set(globals()) | set(available()))
@@ -14,19 +14,13 @@ from migen import *
 from litex_boards.platforms import adi_adrv2crr_fmc
 
 from litex.soc.integration.soc_core import *
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
 
 from litex.soc.cores.clock import *
 from litex.soc.cores.led import LedChaser
 from litex.soc.cores.pwm import PWM
 from litex.soc.cores.xadc import ZynqUSPSystemMonitor
 
-from litedram.modules import MT40A512M16
-from litedram.phy import usddrphy
-
-from litepcie.phy.usppciephy import USPPCIEPHY
-from litepcie.software import generate_litepcie_software
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class CRG(Module):
@@ -71,6 +65,8 @@ class BaseSoC(SoCCore):
 
         # DDR4 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import MT40A512M16
+            from litedram.phy import usddrphy
             self.submodules.ddrphy = usddrphy.USPDDRPHY(
                 pads             = platform.request("ddram", ddram_channel),
                 memtype          = "DDR4",
@@ -85,6 +81,7 @@ class BaseSoC(SoCCore):
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            from litepcie.phy.usppciephy import USPPCIEPHY
             assert self.csr_data_width == 32
 
             self.submodules.pcie_phy = USPPCIEPHY(platform, platform.request("pcie_x4"),
@@ -142,6 +139,7 @@ def main():
         builder.build()
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
 
     if args.load:
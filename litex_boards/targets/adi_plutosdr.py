@@ -17,7 +17,7 @@ from litex_boards.platforms import adi_plutosdr
 from litex.build.xilinx.vivado import vivado_build_args, vivado_build_argdict
 
 from litex.soc.integration.soc_core import *
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
 
 from litex.soc.cores.clock import *
 
@@ -46,15 +46,12 @@ from litex_boards.platforms import alchitry_mojo
 
 from litex.soc.interconnect.csr import *
 from litex.soc.integration.soc_core import *
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
 
 from litex.soc.cores.clock import *
 from litex.soc.cores.video import VideoS6HDMIPHY
 from litex.soc.cores.led import LedChaser
 
-from litedram.modules import MT48LC32M8, SDRModule
-from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class CRG(Module):
@@ -111,6 +108,8 @@ class BaseSoC(SoCCore):
 
         # Add SDRAM if a shield with RAM has been added
         if not self.integrated_main_ram_size and (with_hdmi_shield or with_sdram_shield):
+            from litedram.modules import MT48LC32M8
+            from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
             sdram_clk = ClockSignal("sys2x_ps" if sdram_rate == "1:2" else "sys_ps")
             self.crg.specials += DDROutput(1, 0, platform.request("sdram_clock"), sdram_clk)
 
@@ -11,7 +11,7 @@ from migen import *
 from litex_boards.platforms import aliexpress_xc7k420t
 
 from litex.soc.integration.soc_core import *
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
 
 from litex.soc.cores.clock import *
 from litex.soc.cores.led import LedChaser
@@ -16,7 +16,7 @@ from litex.soc.interconnect import wishbone
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
 from litex.soc.cores.led import LedChaser
 
 # CRG ----------------------------------------------------------------------------------------------
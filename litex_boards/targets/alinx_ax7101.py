@@ -9,12 +9,7 @@ from litex_boards.platforms import alinx_ax7101
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import SoCRegion
 from litex.soc.integration.soc_core import *
-from litex.soc.integration.builder import *
-
-from litedram.modules import MT41J256M16
-from litedram.phy import s7ddrphy
-
-from liteeth.phy import LiteEthPHYGMII
+from litex_boards.integration.builder import *
 
 class _CRG(Module):
     def __init__(self, platform, sys_clk_freq):
@@ -56,6 +51,8 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM ------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import MT41J256M16
+            from litedram.phy import s7ddrphy
             self.submodules.ddrphy = s7ddrphy.A7DDRPHY(platform.request("ddram"),
                 memtype = "DDR3",
                 nphases  = 4,
@@ -67,6 +64,7 @@ class BaseSoC(SoCCore):
             )
         
         # Ethernet -------------------------------------------------------
+        from liteeth.phy import LiteEthPHYGMII
         self.submodules.ethphy = LiteEthPHYGMII(
                 clock_pads = eth0_clock,
                 pads       = self.platform.request("eth", 0)
@@ -17,23 +17,11 @@ from litex.build.xilinx.vivado import vivado_build_args, vivado_build_argdict
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.soc import SoCRegion
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
 from litex.soc.cores.led import LedChaser
 from litex.soc.cores.bitbang import I2CMaster
 from litex.soc.cores.video import VideoS7HDMIPHY
 
-from litedram.modules import MTA18ASF2G72PZ
-from litedram.phy.s7ddrphy import A7DDRPHY
-from litedram.init import get_sdram_phy_py_header
-from litedram.core.controller import ControllerSettings
-from litedram.common import PhySettings, GeomSettings, TimingSettings
-
-from liteeth.phy import LiteEthS7PHYRGMII
-from litex.soc.cores.hyperbus import HyperRAM
-
-from litespi.modules import S25FL128S0
-from litespi.opcodes import SpiNorFlashOpCodes as Codes
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(Module):
@@ -88,6 +76,8 @@ class BaseSoC(SoCCore):
 
         # DDR4 SDRAM RDIMM -------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import MTA18ASF2G72PZ
+            from litedram.phy.s7ddrphy import A7DDRPHY
             self.submodules.ddrphy = A7DDRPHY(platform.request("ddr4"),
                 memtype         = "DDR4",
                 iodelay_clk_freq = iodelay_clk_freq,
@@ -104,6 +94,7 @@ class BaseSoC(SoCCore):
 
         # HyperRAM ---------------------------------------------------------------------------------
         if with_hyperram:
+            from litex.soc.cores.hyperbus import HyperRAM
             self.submodules.hyperram = HyperRAM(platform.request("hyperram"), sys_clk_freq=sys_clk_freq)
             self.bus.add_slave("hyperram", slave=self.hyperram.bus, region=SoCRegion(origin=0x20000000, size=8*1024*1024))
 
@@ -116,6 +107,7 @@ class BaseSoC(SoCCore):
             # Traces between PHY and FPGA introduce ignorable delays of ~0.165ns +/- 0.015ns.
             # PHY chip does not introduce delays on TX (FPGA->PHY), however it includes 1.2ns
             # delay for RX CLK so we only need 0.8ns to match the desired 2ns.
+            from liteeth.phy import LiteEthS7PHYRGMII
             self.submodules.ethphy = LiteEthS7PHYRGMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"),
@@ -147,6 +139,8 @@ class BaseSoC(SoCCore):
 
         # SPI Flash --------------------------------------------------------------------------------
         if with_spi_flash:
+            from litespi.modules import S25FL128S0
+            from litespi.opcodes import SpiNorFlashOpCodes as Codes
             self.add_spi_flash(mode="4x", module=S25FL128S0(Codes.READ_1_1_4), with_master=True)
 
         # System I2C (behing multiplexer) ----------------------------------------------------------
@@ -154,6 +148,7 @@ class BaseSoC(SoCCore):
         self.submodules.i2c = I2CMaster(i2c_pads)
 
     def generate_sdram_phy_py_header(self, output_file):
+        from litedram.init import get_sdram_phy_py_header
         os.makedirs(os.path.dirname(output_file), exist_ok=True)
         f = open(output_file, "w")
         f.write(get_sdram_phy_py_header(
@@ -166,6 +161,8 @@ class BaseSoC(SoCCore):
 
 class LiteDRAMSettingsEncoder(json.JSONEncoder):
     def default(self, o):
+        from litedram.core.controller import ControllerSettings
+        from litedram.common import PhySettings, GeomSettings, TimingSettings
         if isinstance(o, (ControllerSettings, GeomSettings, PhySettings, TimingSettings)):
             ignored = ["self", "refresh_cls"]
             return {k: v for k, v in vars(o).items() if k not in ignored}
@@ -13,13 +13,9 @@ from litex.build.xilinx.vivado import vivado_build_args, vivado_build_argdict
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.soc import SoCRegion
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
 from litex.soc.cores.led import LedChaser
 
-from litedram.modules import MT53E256M16D1
-from litedram.phy import lpddr4
-
-from liteeth.phy import LiteEthS7PHYRGMII
 from litex.soc.cores.hyperbus import HyperRAM
 
 # CRG ----------------------------------------------------------------------------------------------
@@ -59,6 +55,8 @@ class BaseSoC(SoCCore):
 
         # LDDR4 SDRAM ------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import MT53E256M16D1
+            from litedram.phy import lpddr4
             self.submodules.ddrphy = lpddr4.K7LPDDR4PHY(platform.request("lpddr4"),
                 iodelay_clk_freq = iodelay_clk_freq,
                 sys_clk_freq     = sys_clk_freq,
@@ -84,6 +82,7 @@ class BaseSoC(SoCCore):
             # Traces between PHY and FPGA introduce ignorable delays of ~0.165ns +/- 0.015ns.
             # PHY chip does not introduce delays on TX (FPGA->PHY), however it includes 1.2ns
             # delay for RX CLK so we only need 0.8ns to match the desired 2ns.
+            from liteeth.phy import LiteEthS7PHYRGMII
             self.submodules.ethphy = LiteEthS7PHYRGMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"),
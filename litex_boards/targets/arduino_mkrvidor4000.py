@@ -15,10 +15,7 @@ from litex_boards.platforms import arduino_mkrvidor4000
 
 from litex.soc.cores.clock import Cyclone10LPPLL
 from litex.soc.integration.soc_core import *
-from litex.soc.integration.builder import *
-
-from litedram.modules import AS4C4M16
-from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
+from litex_boards.integration.builder import *
 
 # CRG ----------------------------------------------------------------------------------------------
 
@@ -60,6 +57,8 @@ class BaseSoC(SoCCore):
 
         # SDR SDRAM --------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import AS4C4M16
+            from litedram.phy import GENSDRPHY
             self.submodules.sdrphy = GENSDRPHY(platform.request("sdram"), sys_clk_freq)
             self.add_sdram("sdram",
                 phy           = self.sdrphy,
@@ -30,15 +30,10 @@ from litex_boards.platforms import berkeleylab_marble
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
 from litex.soc.cores.led import LedChaser
 from litex.soc.cores.bitbang import I2CMaster
 
-from litedram.modules import MT8JTF12864, parse_spd_hexdump, SDRAMModule
-from litedram.phy import s7ddrphy
-
-from liteeth.phy.s7rgmii import LiteEthPHYRGMII
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(Module):
@@ -89,6 +84,7 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.phy import s7ddrphy
             self.submodules.ddrphy = s7ddrphy.K7DDRPHY(
                 platform.request("ddram"),
                 memtype      = "DDR3",
@@ -97,10 +93,12 @@ class BaseSoC(SoCCore):
             )
 
             if spd_dump is not None:
+                from litedram.modules import parse_spd_hexdump, SDRAMModule
                 ram_spd = parse_spd_hexdump(spd_dump)
                 ram_module = SDRAMModule.from_spd_data(ram_spd, sys_clk_freq)
                 print('DDR3: loaded config from', spd_dump)
             else:
+                from litedram.modules import MT8JTF12864
                 ram_module = MT8JTF12864(sys_clk_freq, "1:4")  # KC705 chip, 1 GB
                 print('DDR3: No spd data specified, falling back to MT8JTF12864')
 
@@ -114,6 +112,7 @@ class BaseSoC(SoCCore):
 
         # Ethernet ---------------------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy.s7rgmii import LiteEthPHYRGMII
             self.submodules.ethphy = LiteEthPHYRGMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"),
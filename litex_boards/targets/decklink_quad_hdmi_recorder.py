@@ -21,14 +21,7 @@ from litex_boards.platforms import decklink_quad_hdmi_recorder
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
-from litex.soc.integration.builder import *
-
-from litedram.common import PHYPadsReducer
-from litedram.modules import MT41J256M16
-from litedram.phy import usddrphy
-
-from litepcie.phy.uspciephy import USPCIEPHY
-from litepcie.software import generate_litepcie_software
+from litex_boards.integration.builder import *
 
 # CRG ----------------------------------------------------------------------------------------------
 
@@ -73,6 +66,9 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.common import PHYPadsReducer
+            from litedram.modules import MT41J256M16
+            from litedram.phy import usddrphy
             self.submodules.ddrphy = usddrphy.USDDRPHY(
                 pads             = PHYPadsReducer(platform.request("ddram"), [0, 1, 2, 3]),
                 memtype          = "DDR3",
@@ -88,6 +84,7 @@ class BaseSoC(SoCCore):
         # FIXME: Does not seem to be working when also enabling DRAM. Has been tested succesfully by
         # disabling DRAM with --integrated-main-ram-size=0x100.
         if with_pcie:
+            from litepcie.phy.uspciephy import USPCIEPHY
             data_width = {
                 4 : 128,
                 8 : 256,
@@ -126,6 +123,7 @@ def main():
         builder.build()
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
 
     if args.load:
@@ -19,7 +19,8 @@ from litex.soc.interconnect import wishbone
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.soc import SoCRegion
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
+from litex_boards.integration.downloads import fetch
 from litex.soc.cores.led import LedChaser
 
 # CRG ----------------------------------------------------------------------------------------------
@@ -74,7 +75,7 @@ class BaseSoC(SoCCore):
 
             preset_name = "arty_z7_20.tcl" if variant == "z7-20" else "arty_z7_10.tcl"
 
-            os.system("wget http://kmf2.trabucayre.com/" + preset_name)
+            fetch(preset_name, preset_name)
             self.cpu.set_ps7(preset=preset_name)
 
             # Connect AXI GP0 to the SoC
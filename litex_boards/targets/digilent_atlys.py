@@ -18,12 +18,9 @@ from migen.genlib.resetsync import AsyncResetSynchronizer
 from litex_boards.platforms import digilent_atlys
 
 from litex.soc.integration.soc_core import *
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
 from litex.soc.cores.led import LedChaser
 
-from litedram.modules import MT47H64M16
-from litedram.phy import s6ddrphy
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(Module):
@@ -159,6 +156,8 @@ class BaseSoC(SoCCore):
 
         # DDR2 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import MT47H64M16
+            from litedram.phy import s6ddrphy
             self.submodules.ddrphy = s6ddrphy.S6HalfRateDDRPHY(platform.request("ddram"),
                 memtype           = "DDR2",
                 rd_bitslip        = 0,
@@ -17,14 +17,12 @@ from litex_boards.platforms import digilent_nexys4
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.soc import SoCRegion
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
 from litex.soc.cores.led import LedChaser
 from litex.soc.interconnect import wishbone
 
 from litex.soc.integration.soc import colorer
 from litex.soc.cores.video import VideoVGAPHY
-from liteeth.phy.rmii import LiteEthPHYRMII
-
 
 # CRG ----------------------------------------------------------------------------------------------
 
@@ -178,6 +176,7 @@ class BaseSoC(SoCCore):
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy.rmii import LiteEthPHYRMII
             self.submodules.ethphy = LiteEthPHYRMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"))
@@ -15,7 +15,8 @@ from litex.soc.interconnect import axi
 from litex.soc.interconnect import wishbone
 
 from litex.soc.integration.soc_core import *
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
+from litex_boards.integration.downloads import fetch
 
 from litex.soc.cores.clock import *
 from litex.soc.cores.video import VideoS7HDMIPHY
@@ -70,9 +71,7 @@ class BaseSoC(SoCCore):
         # Zynq7000 Integration ---------------------------------------------------------------------
         if kwargs.get("cpu_type", None) == "zynq7000":
             # Get and set the pre-generated .xci FIXME: change location? add it to the repository?
-            os.system("wget https://github.com/litex-hub/litex-boards/files/8339591/zybo_z7_ps7.txt)")
-            os.makedirs("xci", exist_ok=True)
-            os.system("mv zybo_z7_ps7.txt xci/zybo_z7_ps7.xci")
+            fetch("zybo_z7_ps7.xci", "xci/zybo_z7_ps7.xci")
             self.cpu.set_ps7_xci("xci/zybo_z7_ps7.xci")
 
             # Connect AXI GP0 to the SoC with base address of 0x43c00000 (default one)
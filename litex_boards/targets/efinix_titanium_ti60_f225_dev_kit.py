@@ -15,7 +15,7 @@ from litex.build.generic_platform import *
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
 from litex.soc.integration.soc import SoCRegion
 
 from litex.soc.cores.hyperbus import HyperRAM
@@ -16,7 +16,7 @@ from litex_boards.platforms import efinix_xyloni_dev_kit
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.soc import SoCRegion
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
 from litex.soc.cores.led import LedChaser
 
 kB = 1024
@@ -20,11 +20,7 @@ from litex.build.lattice.trellis import trellis_args, trellis_argdict
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
-from litex.soc.integration.builder import *
-
-from litedram import modules as litedram_modules
-from litedram.phy import GENSDRPHY
-from litedram.modules import AS4C32M8
+from litex_boards.integration.builder import *
 
 # CRG ----------------------------------------------------------------------------------------------
 
@@ -64,6 +60,8 @@ class BaseSoC(SoCCore):
 
         # SDR SDRAM --------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.phy import GENSDRPHY
+            from litedram.modules import AS4C32M8
             self.submodules.sdrphy = GENSDRPHY(platform.request("sdram"), sys_clk_freq)
             self.add_sdram("sdram",
                 phy           = self.sdrphy,
@@ -21,17 +21,10 @@ from litex_boards.platforms import hpcstore_xc7k420t
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
 from litex.soc.cores.led import LedChaser
 from litex.soc.cores.bitbang import I2CMaster
 
-from litedram.phy import s7ddrphy
-from litedram.common import PHYPadsReducer
-from litedram.modules import K4B1G0446F
-
-from litepcie.phy.s7pciephy import S7PCIEPHY
-from litepcie.software import generate_litepcie_software
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(Module):
@@ -80,6 +73,9 @@ class BaseSoC(SoCCore):
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
             # we need to use A7DDRPHY instead of K7DDRPHY, because the 420T has no ODELAYE2
+            from litedram.phy import s7ddrphy
+            from litedram.common import PHYPadsReducer
+            from litedram.modules import K4B1G0446F
             self.submodules.ddrphy = s7ddrphy.A7DDRPHY(
                 pads         = PHYPadsReducer(platform.request("ddram", 0), [0, 1, 2, 3]),
                 #pads         = platform.request("ddram", 0),
@@ -96,6 +92,7 @@ class BaseSoC(SoCCore):
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            from litepcie.phy.s7pciephy import S7PCIEPHY
             self.submodules.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x4"),
                 data_width = 128,
                 bar0_size  = 0x20000)
@@ -162,6 +159,7 @@ def main():
         builder.build()
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
 
     if args.load:
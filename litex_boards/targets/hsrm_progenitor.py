@@ -14,19 +14,11 @@ from litex_boards.platforms import hsrm_progenitor
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import SoCRegion
 from litex.soc.integration.soc_core import *
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
 
-from litedram.modules import IS43TR16256B
-from litedram.phy import s7ddrphy
 from litex.soc.cores.led import LedChaser
 
-from liteeth.phy import LiteEthPHYGMII
-
 from litex.build.generic_platform import Subsignal, Pins
-from litesata.phy import LiteSATAPHY
-
-from litepcie.phy.s7pciephy import S7PCIEPHY
-from litepcie.software import generate_litepcie_software
 
 class _CRG(Module):
     def __init__(self, platform, sys_clk_freq):
@@ -48,7 +40,7 @@ class _CRG(Module):
         self.submodules.idelayctrl = S7IDELAYCTRL(self.cd_idelay)
 
 class BaseSoC(SoCCore):
-    def __init__(self, sys_clk_freq=int(50e6), **kwargs):
+    def __init__(self, sys_clk_freq=int(50e6), with_ethernet=True, with_sata=True, **kwargs):
         platform = hsrm_progenitor.Platform()
 
         # SoCCore ---------------------------------------------------------
@@ -67,6 +59,8 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM ------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import IS43TR16256B
+            from litedram.phy import s7ddrphy
             self.submodules.ddrphy = s7ddrphy.A7DDRPHY(platform.request("ddram"),
                 memtype = "DDR3",
                 nphases  = 4,
@@ -77,62 +71,66 @@ class BaseSoC(SoCCore):
                 l2_cache_size = kwargs.get("l2_size", 8192))
         
         # Ethernet -------------------------------------------------------
-        self.submodules.ethphy = LiteEthPHYGMII(
-                clock_pads = eth0_clock,
-                pads       = self.platform.request("eth", 0)
-                )
-        self.add_csr("ethphy")
-        self.add_ethernet(name="ethmac", phy=self.ethphy, phy_cd="ethphy_eth")
-
-        self.submodules.ethphy1 = LiteEthPHYGMII(
-                clock_pads = eth1_clock,
-                pads       = self.platform.request("eth", 1)
-                )
-        self.add_csr("ethphy1")
-        self.add_ethernet(name="ethmac1", phy=self.ethphy1, phy_cd="ethphy1_eth")
+        if with_ethernet:
+            from liteeth.phy import LiteEthPHYGMII
+            self.submodules.ethphy = LiteEthPHYGMII(
+                    clock_pads = eth0_clock,
+                    pads       = self.platform.request("eth", 0)
+                    )
+            self.add_csr("ethphy")
+            self.add_ethernet(name="ethmac", phy=self.ethphy, phy_cd="ethphy_eth")
+
+            self.submodules.ethphy1 = LiteEthPHYGMII(
+                    clock_pads = eth1_clock,
+                    pads       = self.platform.request("eth", 1)
+                    )
+            self.add_csr("ethphy1")
+            self.add_ethernet(name="ethmac1", phy=self.ethphy1, phy_cd="ethphy1_eth")
         
-        self.submodules.ethphy2 = LiteEthPHYGMII(
-                clock_pads = eth2_clock,
-                pads       = self.platform.request("eth", 2)
-                )
-        self.add_csr("ethphy2")
-        self.add_ethernet(name="ethmac2", phy=self.ethphy2, phy_cd="ethphy2_eth")
-
-        self.submodules.ethphy3 = LiteEthPHYGMII(
-                clock_pads = eth3_clock,
-                pads       = self.platform.request("eth", 3)
-                )
-        self.add_csr("ethphy3")
-        self.add_ethernet(name="ethmac3", phy=self.ethphy3, phy_cd="ethphy3_eth")
+            self.submodules.ethphy2 = LiteEthPHYGMII(
+                    clock_pads = eth2_clock,
+                    pads       = self.platform.request("eth", 2)
+                    )
+            self.add_csr("ethphy2")
+            self.add_ethernet(name="ethmac2", phy=self.ethphy2, phy_cd="ethphy2_eth")
+
+            self.submodules.ethphy3 = LiteEthPHYGMII(
+                    clock_pads = eth3_clock,
+                    pads       = self.platform.request("eth", 3)
+                    )
+            self.add_csr("ethphy3")
+            self.add_ethernet(name="ethmac3", phy=self.ethphy3, phy_cd="ethphy3_eth")
 
         # SATA -----------------------------------------------------------
-        _sata_io = [
-             # PCIe 2 SATA Custom Adapter (With PCIe Riser / SATA cable mod).
-            ("pcie2sata", 0,
-                Subsignal("tx_p",  Pins("B6")),
-                Subsignal("tx_n",  Pins("A6")),
-                Subsignal("rx_p",  Pins("B10")),
-                Subsignal("rx_n",  Pins("A10")),
-            ),
-        ]
-        platform.add_extension(_sata_io)
-
-        # RefClk, Generate 150MHz from PLL.
-        self.clock_domains.cd_sata_refclk = ClockDomain()
-        self.crg.pll.create_clkout(self.cd_sata_refclk, 150e6)
-        sata_refclk = ClockSignal("sata_refclk")
-        platform.add_platform_command("set_property SEVERITY {{Warning}} [get_drc_checks REQP-49]")
-
-        # PHY
-        self.submodules.sata_phy = LiteSATAPHY(platform.device,
-            refclk     = sata_refclk,
-            pads       = platform.request("pcie2sata"),
-            gen        = "gen1",
-            clk_freq   = sys_clk_freq,
-            data_width = 16)
-
-        # Core
-        self.add_sata(phy=self.sata_phy, mode="read+write")
+        if with_sata:
+            from litesata.phy import LiteSATAPHY
+            _sata_io = [
+                 # PCIe 2 SATA Custom Adapter (With PCIe Riser / SATA cable mod).
+                ("pcie2sata", 0,
+                    Subsignal("tx_p",  Pins("B6")),
+                    Subsignal("tx_n",  Pins("A6")),
+                    Subsignal("rx_p",  Pins("B10")),
+                    Subsignal("rx_n",  Pins("A10")),
+                ),
+            ]
+            platform.add_extension(_sata_io)
+
+            # RefClk, Generate 150MHz from PLL.
+            self.clock_domains.cd_sata_refclk = ClockDomain()
+            self.crg.pll.create_clkout(self.cd_sata_refclk, 150e6)
+            sata_refclk = ClockSignal("sata_refclk")
+            platform.add_platform_command("set_property SEVERITY {{Warning}} [get_drc_checks REQP-49]")
+
+            # PHY
+            self.submodules.sata_phy = LiteSATAPHY(platform.device,
+                refclk     = sata_refclk,
+                pads       = platform.request("pcie2sata"),
+                gen        = "gen1",
+                clk_freq   = sys_clk_freq,
+                data_width = 16)
+
+            # Core
+            self.add_sata(phy=self.sata_phy, mode="read+write")
 
         # PCIE -----------------------------------------------------------
         #self.submodules.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x1"),
@@ -153,6 +151,8 @@ def main():
     parser.add_argument("--build", action="store_true", help="Build Bitstream")
     parser.add_argument("--load", action="store_true", help="Load Bitstream")
     parser.add_argument("--sys-clk-freq", default=50e6, help="System clock frequency (default: 50MHz)")
+    parser.add_argument("--no-ethernet", action="store_true", help="Disable Ethernet")
+    parser.add_argument("--no-sata",     action="store_true", help="Disable SATA")
     
     builder_args(parser)
     soc_core_args(parser)
@@ -160,6 +160,8 @@ def main():
 
     soc = BaseSoC(
         sys_clk_freq=int(float(args.sys_clk_freq)),
+        with_ethernet=not args.no_ethernet,
+        with_sata=not args.no_sata,
         **soc_core_argdict(args)
     )
 
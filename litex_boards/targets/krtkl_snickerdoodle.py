@@ -19,7 +19,8 @@ from litex.soc.interconnect import wishbone
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
+from litex_boards.integration.downloads import fetch
 from litex.soc.cores.led import LedChaser
 
 # UTILS ---------------------------------------------------------------------------------------------
@@ -30,8 +31,7 @@ def load_ps7(soc, xci_file):
     file = "snickerdoodle_ps7.xci"
     dst = os.path.join(odir, file)
     if xci_file is None:
-        src = "https://technicaltoys-support.s3.amazonaws.com/xci/" + file
-        os.system("wget " + src + " -O " + dst)
+        fetch(file, dst)
     else:
         os.system("cp -p  " + xci_file + " " + dst)
     soc.cpu.set_ps7_xci(dst)
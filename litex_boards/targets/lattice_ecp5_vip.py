@@ -14,12 +14,10 @@ from litex_boards.platforms import lattice_ecp5_vip
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
 from litex.soc.integration.soc import SoCRegion
 from litex.soc.cores.led import LedChaser
 
-from litedram.modules import MT41K64M16
-from litedram.phy import ECP5DDRPHY
 from litex.soc.cores.video import VideoVGAPHY
 from litex.soc.cores.bitbang import I2CMaster
 
@@ -95,6 +93,8 @@ class BaseSoC(SoCCore):
         SoCCore.__init__(self, platform, sys_clk_freq, ident="LiteX SoC on ECP5 Evaluation Board", **kwargs)
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
+        from litedram.modules import MT41K64M16
+        from litedram.phy import ECP5DDRPHY
         self.submodules.ddrphy = ECP5DDRPHY(
             platform.request("ddram"),
             sys_clk_freq=sys_clk_freq)
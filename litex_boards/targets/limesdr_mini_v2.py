@@ -20,15 +20,13 @@ from litex.build.lattice.trellis import trellis_args, trellis_argdict
 from litex.soc.cores.clock import *
 from litex.soc.interconnect.csr import *
 from litex.soc.integration.soc_core import *
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
 from litex.soc.interconnect import stream
 
 from litex.soc.cores.led import LedChaser
 from litex.soc.cores.bitbang import I2CMaster
 from litex.soc.cores.usb_fifo import FT245PHYSynchronous
 
-from litescope import LiteScopeAnalyzer
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(Module):
@@ -94,6 +92,7 @@ class BaseSoC(SoCCore):
 
         # USB-FIFO ---------------------------------------------------------------------------------
         if with_usb_fifo:
+            from litescope import LiteScopeAnalyzer
             usb_pads = platform.request("usb_fifo")
             self.submodules.usb_phy = usb_phy = FT245PHYSynchronous(
                 pads       = usb_pads,
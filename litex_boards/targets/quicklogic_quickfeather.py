@@ -15,7 +15,8 @@ from litex_boards.platforms import quicklogic_quickfeather
 
 from litex.soc.integration.soc import SoCRegion
 from litex.soc.integration.soc_core import *
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
+from litex_boards.integration.downloads import fetch
 from litex.soc.cores.led import LedChaser
 from litex.soc.cores.gpio import *
 
@@ -100,7 +101,7 @@ def main():
     if args.cpu_type == "eos_s3":
         libeos_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "libeos")
         if not os.path.exists(libeos_path):
-            os.system("wget -nc https://github.com/litex-hub/litex-boards/files/7880350/libeos.zip")
+            fetch("libeos.zip", "libeos.zip")
             os.system(f"unzip libeos.zip -d {libeos_path}")
         builder.add_software_package("libeos", src_dir=libeos_path)
         builder.add_software_library("libeos")
@@ -17,12 +17,9 @@ from litex_boards.platforms import rcs_arctic_tern_bmc_card
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
 from litex.soc.integration.soc import SoCRegion
 
-from litedram.modules import MT41J256M16
-from litedram.phy import ECP5DDRPHY
-from liteeth.phy.ecp5rgmii import LiteEthPHYRGMII
 from litex.soc.cores.video import VideoGenericPHY
 
 # CRG ----------------------------------------------------------------------------------------------
@@ -113,6 +110,8 @@ class BaseSoC(SoCCore):
         )
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
+        from litedram.modules import MT41J256M16
+        from litedram.phy import ECP5DDRPHY
         self.submodules.ddrphy = ECP5DDRPHY(
             platform.request("ddram"),
             sys_clk_freq=sys_clk_freq)
@@ -126,6 +125,7 @@ class BaseSoC(SoCCore):
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy.ecp5rgmii import LiteEthPHYRGMII
             self.submodules.ethphy = LiteEthPHYRGMII(
                 clock_pads = self.platform.request("eth_clocks", 0),
                 pads       = self.platform.request("eth", 0),
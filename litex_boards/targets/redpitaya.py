@@ -6,8 +6,6 @@
 # Copyright (c) 2020 Gwenhael Goavec-Merou <gwenhael.goavec-merou@trabucayre.com>
 # SPDX-License-Identifier: BSD-2-Clause
 
-import os
-
 from migen import *
 
 from litex_boards.platforms import redpitaya
@@ -18,7 +16,8 @@ from litex.soc.interconnect import wishbone
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
+from litex_boards.integration.downloads import fetch
 from litex.soc.cores.led import LedChaser
 
 # CRG ----------------------------------------------------------------------------------------------
@@ -62,9 +61,7 @@ class BaseSoC(SoCCore):
         # Zynq7000 Integration ---------------------------------------------------------------------
         if kwargs.get("cpu_type", None) == "zynq7000":
             # Get and set the pre-generated .xci FIXME: change location? add it to the repository?
-            os.system("wget https://kmf2.trabucayre.com/redpitaya_ps7.txt")
-            os.makedirs("xci", exist_ok=True)
-            os.system("cp redpitaya_ps7.txt xci/redpitaya_ps7.xci")
+            fetch("redpitaya_ps7.xci", "xci/redpitaya_ps7.xci")
             self.cpu.set_ps7_xci("xci/redpitaya_ps7.xci")
 
             # Connect AXI GP0 to the SoC with base address of 0x43c00000 (default one)
@@ -18,12 +18,9 @@ from migen.genlib.resetsync import AsyncResetSynchronizer
 from litex_boards.platforms import saanlima_pipistrello
 
 from litex.soc.integration.soc_core import *
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
 from litex.soc.cores.led import LedChaser
 
-from litedram.modules import MT46H32M16
-from litedram.phy import s6ddrphy
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(Module):
@@ -163,6 +160,8 @@ class BaseSoC(SoCCore):
 
         # LPDDR SDRAM ------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import MT46H32M16
+            from litedram.phy import s6ddrphy
             self.submodules.ddrphy = s6ddrphy.S6HalfRateDDRPHY(platform.request("ddram"),
                 memtype           = "LPDDR",
                 rd_bitslip        = 1,
@@ -14,7 +14,7 @@ from migen import *
 from litex.build.io import CRG
 
 from litex.soc.integration.soc_core import *
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
 
 from litex.soc.cores.led import LedChaser
 
@@ -19,18 +19,13 @@ from litex_boards.platforms import sqrl_fk33
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
+from litex_boards.integration.downloads import fetch
 from litex.soc.integration.soc import SoCRegion
 from litex.soc.interconnect.axi import *
 from litex.soc.cores.ram.xilinx_usp_hbm2 import USPHBM2
 from litex.soc.cores.led import LedChaser
 
-from litepcie.phy.usppciephy import USPHBMPCIEPHY
-from litepcie.core import LitePCIeEndpoint, LitePCIeMSI
-from litepcie.frontend.dma import LitePCIeDMA
-from litepcie.frontend.wishbone import LitePCIeWishboneBridge
-from litepcie.software import generate_litepcie_software
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(Module):
@@ -78,9 +73,7 @@ class BaseSoC(SoCCore):
             self.submodules.hbm = hbm = ClockDomainsRenamer({"axi": "sys"})(USPHBM2(platform))
 
             # Get HBM .xci.
-            os.system("wget https://github.com/litex-hub/litex-boards/files/8178874/hbm_0.xci.txt")
-            os.makedirs("ip/hbm", exist_ok=True)
-            os.system("mv hbm_0.xci.txt ip/hbm/hbm_0.xci")
+            fetch("fk33_hbm_0.xci", "ip/hbm/hbm_0.xci")
 
             # Connect four of the HBM's AXI interfaces to the main bus of the SoC.
             for i in range(4):
@@ -93,6 +86,10 @@ class BaseSoC(SoCCore):
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            from litepcie.phy.usppciephy import USPHBMPCIEPHY
+            from litepcie.core import LitePCIeEndpoint, LitePCIeMSI
+            from litepcie.frontend.dma import LitePCIeDMA
+            from litepcie.frontend.wishbone import LitePCIeWishboneBridge
             assert self.csr_data_width == 32
             # PHY
             self.submodules.pcie_phy = USPHBMPCIEPHY(platform, platform.request("pcie_x4"),
@@ -158,6 +155,7 @@ def main():
         builder.build()
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
 
     if args.load:
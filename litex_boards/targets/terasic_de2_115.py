@@ -15,10 +15,7 @@ from litex_boards.platforms import terasic_de2_115
 
 from litex.soc.cores.clock import CycloneIVPLL
 from litex.soc.integration.soc_core import *
-from litex.soc.integration.builder import *
-
-from litedram.modules import IS42S16320
-from litedram.phy import GENSDRPHY
+from litex_boards.integration.builder import *
 
 # CRG ----------------------------------------------------------------------------------------------
 
@@ -57,6 +54,8 @@ class BaseSoC(SoCCore):
 
         # SDR SDRAM --------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import IS42S16320
+            from litedram.phy import GENSDRPHY
             self.submodules.sdrphy = GENSDRPHY(platform.request("sdram"), sys_clk_freq)
             self.add_sdram("sdram",
                 phy           = self.sdrphy,
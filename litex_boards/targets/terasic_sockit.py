@@ -10,15 +10,12 @@ from litex_boards.platforms import terasic_sockit
 
 from litex.soc.cores.clock import CycloneVPLL
 from litex.soc.integration.soc_core  import *
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
 from litex.soc.cores.led import LedChaser
 from litex.soc.cores.video import VideoVGAPHY
 
 from litex.build.io import DDROutput
 
-from litedram.modules import W9825G6KH6, AS4C32M16
-from litedram.phy import HalfRateGENSDRPHY, GENSDRPHY
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(Module):
@@ -80,6 +77,8 @@ class BaseSoC(SoCCore):
 
         # SDR SDRAM --------------------------------------------------------------------------------
         if mister_sdram is not None:
+            from litedram.modules import W9825G6KH6, AS4C32M16
+            from litedram.phy import HalfRateGENSDRPHY, GENSDRPHY
             sdrphy_cls = HalfRateGENSDRPHY if sdram_rate == "1:2" else GENSDRPHY
             sdrphy_mod = {"xs_v22": W9825G6KH6, "xs_v24": AS4C32M16}[mister_sdram]
             self.submodules.sdrphy = sdrphy_cls(platform.request("sdram"), sys_clk_freq)
@@ -17,12 +17,9 @@ from litex.build.io import DDROutput
 from litex.soc.cores.clock.gowin_gw1n import  GW1NPLL
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.soc import SoCRegion
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
 from litex.soc.cores.led import LedChaser
 
-from litedram.modules import MT48LC4M16  # FIXME: use EtronTech reference.
-from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
-
 kB = 1024
 mB = 1024*kB
 
@@ -83,6 +80,8 @@ class BaseSoC(SoCCore):
 
         # SDR SDRAM --------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import MT48LC4M16  # FIXME: use EtronTech reference.
+            from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
             class SDRAMPads:
                 def __init__(self):
                     self.clk   = platform.request("O_sdram_clk")
@@ -15,20 +15,9 @@ from litex_boards.platforms import xilinx_ac701
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
 from litex.soc.cores.led import LedChaser
 
-from litedram.common import PHYPadsReducer
-from litedram.modules import MT8JTF12864
-from litedram.phy import s7ddrphy
-
-from liteeth.phy.a7_gtp import QPLLSettings, QPLL
-from liteeth.phy.a7_1000basex import A7_1000BASEX
-from liteeth.phy.s7rgmii import LiteEthPHYRGMII
-
-from litepcie.phy.s7pciephy import S7PCIEPHY
-from litepcie.software import generate_litepcie_software
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(Module):
@@ -67,6 +56,9 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.common import PHYPadsReducer
+            from litedram.modules import MT8JTF12864
+            from litedram.phy import s7ddrphy
             self.submodules.ddrphy = s7ddrphy.A7DDRPHY(
                 pads         = PHYPadsReducer(platform.request("ddram"), [0, 1, 2, 3]),
                 memtype      = "DDR3",
@@ -83,6 +75,7 @@ class BaseSoC(SoCCore):
             # RGMII Ethernet PHY -------------------------------------------------------------------
             if eth_phy == "rgmii":
                 # phy
+                from liteeth.phy.s7rgmii import LiteEthPHYRGMII
                 self.submodules.ethphy = LiteEthPHYRGMII(
                     clock_pads = self.platform.request("eth_clocks"),
                     pads       = self.platform.request("eth"))
@@ -90,6 +83,8 @@ class BaseSoC(SoCCore):
             # 1000BaseX Ethernet PHY ---------------------------------------------------------------
             if eth_phy == "1000basex":
                 # phy
+                from liteeth.phy.a7_gtp import QPLLSettings, QPLL
+                from liteeth.phy.a7_1000basex import A7_1000BASEX
                 self.comb += self.platform.request("sfp_mgt_clk_sel0", 0).eq(0)
                 self.comb += self.platform.request("sfp_mgt_clk_sel1", 0).eq(0)
                 self.comb += self.platform.request("sfp_tx_disable_n", 0).eq(0)
@@ -123,6 +118,7 @@ class BaseSoC(SoCCore):
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            from litepcie.phy.s7pciephy import S7PCIEPHY
             self.submodules.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x4"),
                 data_width = 128,
                 bar0_size  = 0x20000)
@@ -164,6 +160,7 @@ def main():
         builder.build()
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
 
     if args.load:
@@ -30,7 +30,8 @@ from litex.soc.interconnect import wishbone
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.soc import SoCRegion
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
+from litex_boards.integration.downloads import fetch
 
 # CRG ----------------------------------------------------------------------------------------------
 
@@ -153,7 +154,7 @@ class BaseSoC(SoCCore):
         os.makedirs(os.path.realpath(libxil_path), exist_ok=True)
         lib = os.path.join(libxil_path, 'embeddedsw')
         if not os.path.exists(lib):
-            os.system("git clone --depth 1 https://github.com/Xilinx/embeddedsw {}".format(lib))
+            fetch("embeddedsw", lib)
 
         os.makedirs(os.path.realpath(self.builder.include_dir), exist_ok=True)
 
@@ -13,7 +13,7 @@ from litex_boards.platforms import xilinx_zcu102
 from litex.build.io import CRG
 
 from litex.soc.integration.soc_core import *
-from litex.soc.integration.builder import *
+from litex_boards.integration.builder import *
 
 from litex.soc.cores.led import LedChaser
 
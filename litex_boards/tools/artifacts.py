@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Artifact Store tool.
+#
+# Serve a directory as an HTTP artifact store shared by the build machines, fetch the outputs of a
+# build (bitstreams, reports, generated software) from a store, or evict a local store to its size.
+#
+# $ python3 -m litex_boards.tools.artifacts serve /srv/artifacts --port=8000 --max-size=100G
+# $ export LITEX_BOARDS_BITSTREAM_CACHE=http://buildserver:8000
+# $ python3 -m litex_boards.tools.artifacts fetch <key> --output-dir=build/digilent_arty
+# $ python3 -m litex_boards.tools.artifacts evict ~/.cache/litex-boards/bitstreams --max-size=20G
+
+import os
+import sys
+import argparse
+
+from litex_boards.integration.artifacts import LocalArtifactStore, ArtifactHTTPServer
+from litex_boards.integration.bitstream_cache import default_bitstream_cache
+
+# Run ----------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="LiteX-Boards Artifact Store tool.")
+    subparsers = parser.add_subparsers(dest="command")
+
+    serve_parser = subparsers.add_parser("serve", help="Serve a directory as an HTTP artifact store.")
+    serve_parser.add_argument("directory",                                help="Store directory.")
+    serve_parser.add_argument("--host",     default="",                   help="Host/address to listen on.")
+    serve_parser.add_argument("--port",     default=8000, type=int,       help="Port to listen on.")
+    serve_parser.add_argument("--max-size", default=None,                 help="Maximum store size, least recently used artifacts are evicted (ex: 100G).")
+    serve_parser.add_argument("--verbose",  action="store_true",          help="Log requests.")
+
+    fetch_parser = subparsers.add_parser("fetch", help="Fetch the outputs of a build.")
+    fetch_parser.add_argument("key",                                      help="Build key (Bitstream cache hash).")
+    fetch_parser.add_argument("--store",      default=None,               help="Artifact store: directory or http(s):// URL (default: LITEX_BOARDS_BITSTREAM_CACHE or ~/.cache/litex-boards/bitstreams).")
+    fetch_parser.add_argument("--output-dir", default=".",                help="Output directory.")
+
+    evict_parser = subparsers.add_parser("evict", help="Evict least recently used artifacts of a local store.")
+    evict_parser.add_argument("directory",                                help="Store directory.")
+    evict_parser.add_argument("--max-size", required=True,                help="Maximum store size (ex: 20G).")
+
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        os.makedirs(args.directory, exist_ok=True)
+        store  = LocalArtifactStore(args.directory, max_size=args.max_size)
+        server = ArtifactHTTPServer(store, (args.host, args.port), verbose=args.verbose)
+        print("Serving {} on {}.".format(args.directory, server.url))
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            server.server_close()
+    elif args.command == "fetch":
+        cache = default_bitstream_cache(args.store)
+        restored = None if cache is None else cache.restore(args.key, args.output_dir)
+        if restored is None:
+            print("{} not found.".format(args.key))
+            sys.exit(1)
+        for filename in restored:
+            print(os.path.join(args.output_dir, filename))
+    elif args.command == "evict":
+        store = LocalArtifactStore(args.directory, max_size=args.max_size)
+        evicted = store.evict()
+        print("{} artifacts evicted, store size: {} bytes.".format(len(evicted), store.get_size()))
+    else:
+        parser.print_help()
+
+if __name__ == "__main__":
+    main()
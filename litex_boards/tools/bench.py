@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Benchmark elaboration of LiteX-Boards targets.
+#
+# Each target is elaborated (SoC creation + Builder with Gateware/Software compilation disabled) in a
+# few canonical configurations, when supported by the target:
+# - help     : Startup only (--help: target module import and arguments parsing).
+# - minimal  : Minimal CPU, integrated Main RAM.
+# - dram     : Minimal CPU, DRAM (default configuration).
+# - ethernet : Minimal CPU, DRAM, Ethernet.
+# - pcie     : Minimal CPU, DRAM, PCIe.
+#
+# Wall time, CPU time and Peak RSS of each elaboration are appended to a JSON history file and compared
+# to the previous runs: the benchmark fails when a target regresses beyond a configurable threshold.
+#
+# $ python3 -m litex_boards.tools.bench digilent_arty xilinx_alveo_u280 --configs=minimal,dram
+# $ python3 -m litex_boards.tools.bench --threshold=0.25 --history=bench.json
+
+import os
+import sys
+import json
+import time
+import socket
+import argparse
+import statistics
+
+from litex_boards.tools import sweep
+
+# Configurations -----------------------------------------------------------------------------------
+
+bench_configs = {
+    # Name       : (Required in target source, Extra arguments).
+    "help"     : (None,              ["--help"]),
+    "minimal"  : (None,              ["--integrated-main-ram-size=0x1000"]),
+    "dram"     : ("add_sdram",       []),
+    "ethernet" : ("--with-ethernet", ["--with-ethernet"]),
+    "pcie"     : ("--with-pcie",     ["--with-pcie"]),
+}
+
+def get_target_configs(name, configs=list(bench_configs.keys())):
+    # Only keep configurations supported by the target (from its source).
+    with open(os.path.join(sweep.litex_boards_dir, "targets", name + ".py")) as f:
+        source = f.read()
+    supported = []
+    for config in configs:
+        required, _ = bench_configs[config]
+        if (required is None) or (required in source):
+            supported.append(config)
+    return supported
+
+def bench_job(name, config):
+    job = sweep.target_job(name, args=bench_configs[config][1], build=True)
+    job.name = "{}/{}".format(name, config)
+    return job
+
+# Metrics ------------------------------------------------------------------------------------------
+
+bench_metrics = {
+    # Name    : (Unit,  Minimal absolute regression, to filter out noise).
+    "wall"    : ("s",   0.5),
+    "cpu"     : ("s",   0.5),
+    "max_rss" : ("MiB", 16),
+}
+
+def get_result_metrics(result):
+    return {
+        "wall"    : result.duration,
+        "cpu"     : result.cpu_time,
+        "max_rss" : None if result.max_rss is None else result.max_rss/2**20,
+    }
+
+# History ------------------------------------------------------------------------------------------
+
+def load_history(filename):
+    if not os.path.exists(filename):
+        return {"version": 1, "runs": []}
+    with open(filename) as f:
+        return json.load(f)
+
+def save_history(filename, history):
+    tmp = filename + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(history, f, indent=1, sort_keys=True)
+    os.replace(tmp, filename)
+
+def get_baseline(history, name, metric, depth=5):
+    # Median of the last runs, more robust to noise than the last run alone.
+    values = []
+    for run in reversed(history["runs"]):
+        value = run["results"].get(name, {}).get(metric, None)
+        if value is not None:
+            values.append(value)
+        if len(values) >= depth:
+            break
+    return statistics.median(values) if values else None
+
+def check_regressions(history, results, threshold=0.2, metrics=list(bench_metrics.keys()), depth=5):
+    regressions = []
+    for name, values in sorted(results.items()):
+        for metric in metrics:
+            value    = values.get(metric, None)
+            baseline = get_baseline(history, name, metric, depth)
+            if value is None or baseline is None:
+                continue
+            unit, noise = bench_metrics[metric]
+            if (value > baseline*(1 + threshold)) and (value - baseline > noise):
+                regressions.append((name, metric, baseline, value))
+    return regressions
+
+# Run ----------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark elaboration of LiteX-Boards targets.")
+    parser.add_argument("targets",     nargs="*",                      help="Targets to benchmark (default: all).")
+    parser.add_argument("--configs",   default=",".join(bench_configs), help="Configurations to benchmark ({}).".format(", ".join(bench_configs)))
+    parser.add_argument("--jobs", "-j", default=1, type=int,           help="Number of parallel jobs (default: 1, for stable measurements).")
+    parser.add_argument("--work-dir",  default=os.path.join("build", "bench"), help="Base Work directory of the jobs.")
+    parser.add_argument("--history",   default="bench_history.json",   help="JSON history file.")
+    parser.add_argument("--threshold", default=0.2, type=float,        help="Relative regression threshold (0.2 = +20%%).")
+    parser.add_argument("--metrics",   default=",".join(bench_metrics), help="Gated metrics ({}).".format(", ".join(bench_metrics)))
+    parser.add_argument("--depth",     default=5, type=int,            help="Number of previous runs used as baseline (median).")
+    parser.add_argument("--no-record", action="store_true",            help="Do not record this run in the history.")
+    args = parser.parse_args()
+
+    configs = args.configs.split(",")
+    metrics = args.metrics.split(",")
+    for config in configs:
+        assert config in bench_configs, "Unknown configuration {}.".format(config)
+    for metric in metrics:
+        assert metric in bench_metrics, "Unknown metric {}.".format(metric)
+
+    # Run benchmarks (always elaborated, results cache not used).
+    jobs = []
+    for name in (args.targets or sweep.collect_targets()):
+        for config in get_target_configs(name, configs):
+            jobs.append(bench_job(name, config))
+    results  = {}
+    failures = []
+    for result in sweep.run_jobs(jobs, workers=args.jobs, work_dir=args.work_dir, engine="subprocess"):
+        if result.passed:
+            results[result.job.name] = get_result_metrics(result)
+        else:
+            failures.append(result.job.name)
+
+    # Check regressions against history.
+    history     = load_history(args.history)
+    regressions = check_regressions(history, results, args.threshold, metrics, args.depth)
+
+    # Record run.
+    if not args.no_record:
+        history["runs"].append({
+            "date"     : time.strftime("%Y-%m-%d %H:%M:%S"),
+            "host"     : socket.gethostname(),
+            "packages" : {package: sweep.get_package_version(package) for package in sweep.cached_packages},
+            "results"  : results,
+        })
+        save_history(args.history, history)
+
+    # Report.
+    print("{:<56} {:>9} {:>9} {:>11}".format("Target/Config", "Wall (s)", "CPU (s)", "RSS (MiB)"))
+    for name, values in sorted(results.items()):
+        print("{:<56} {:>9.2f} {:>9} {:>11}".format(name, values["wall"],
+            "-" if values["cpu"]     is None else "{:.2f}".format(values["cpu"]),
+            "-" if values["max_rss"] is None else "{:.1f}".format(values["max_rss"])))
+    for name in failures:
+        print("{} failed.".format(name))
+    for name, metric, baseline, value in regressions:
+        unit, _ = bench_metrics[metric]
+        print("{} {} regression: {:.2f}{} -> {:.2f}{} (+{:.0f}%).".format(
+            name, metric, baseline, unit, value, unit, 100*(value/baseline - 1)))
+    sys.exit(1 if (failures or regressions) else 0)
+
+if __name__ == "__main__":
+    main()
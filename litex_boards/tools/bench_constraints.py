@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Benchmark IO requests latency of LiteX-Boards platforms.
+#
+# For each platform, the IOs of the platform are extended with an increasing number of dummy
+# resources (add_extension) and the mean latency of request()/lookup_request() is measured with
+# LiteX's ConstraintManager (linear lookup) and LiteX-Boards' IndexedConstraintManager. With the
+# IndexedConstraintManager, latency is expected to stay flat: the benchmark fails when latency with
+# the largest extension exceeds --max-ratio times the latency without extension.
+#
+# $ python3 -m litex_boards.tools.bench_constraints
+# $ python3 -m litex_boards.tools.bench_constraints digilent_arty --extensions=0,1000,100000
+
+import sys
+import time
+import argparse
+
+from litex.build.generic_platform import ConstraintManager, Pins
+
+from litex_boards import platforms
+from litex_boards.integration.constraints import IndexedConstraintManager
+
+# Benchmark ----------------------------------------------------------------------------------------
+
+bench_platforms  = ["xilinx_vc707", "xilinx_kc705", "xilinx_kcu105", "adi_adrv2crr_fmc"]
+bench_extensions = [0, 100, 1000, 10000]
+bench_managers   = {
+    "litex"   : ConstraintManager,
+    "indexed" : IndexedConstraintManager,
+}
+
+def _bench_requests(io, manager_cls, extension, requests):
+    cm = manager_cls(io, [])
+    cm.add_extension([("bench_dummy", n, Pins("D{}".format(n))) for n in range(extension)])
+    # Requested resources are added last: worst case for a linear lookup.
+    cm.add_extension([("bench_io", n, Pins("IO{}".format(n))) for n in range(requests)])
+    t0 = time.perf_counter()
+    for n in range(requests):
+        cm.request("bench_io", n)
+    t1 = time.perf_counter()
+    for n in range(requests):
+        cm.lookup_request("bench_io", n)
+    t2 = time.perf_counter()
+    return (t1 - t0)/requests, (t2 - t1)/requests
+
+def bench_requests(io, manager_cls, extension=0, requests=256, repeat=3):
+    """Return mean request()/lookup_request() latencies (s) with extension dummy resources."""
+    # Best of repeat runs, to filter out warm-up/GC noise.
+    latencies = [_bench_requests(io, manager_cls, extension, requests) for _ in range(repeat)]
+    return min(l[0] for l in latencies), min(l[1] for l in latencies)
+
+# Run ----------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark IO requests latency of LiteX-Boards platforms.")
+    parser.add_argument("platforms",    nargs="*",                                   help="Platforms to benchmark (default: {}).".format(", ".join(bench_platforms)))
+    parser.add_argument("--extensions", default=",".join(map(str, bench_extensions)), help="Number of extension resources to benchmark.")
+    parser.add_argument("--requests",   default=256, type=int,                       help="Number of requests per measurement.")
+    parser.add_argument("--repeat",     default=3, type=int,                         help="Number of runs per measurement (best is kept).")
+    parser.add_argument("--max-ratio",  default=3.0, type=float,                     help="Maximum latency ratio (largest extension/no extension) of indexed lookups.")
+    args = parser.parse_args()
+
+    extensions = [int(extension) for extension in args.extensions.split(",")]
+    failures   = []
+    print("{:<24} {:>10} {:>8} {:>14} {:>14}".format("Platform", "Extension", "Manager", "request (us)", "lookup (us)"))
+    for name in (args.platforms or bench_platforms):
+        io = list(platforms.get(name).Platform().constraint_manager.available)
+        for manager, manager_cls in bench_managers.items():
+            latencies = []
+            for extension in extensions:
+                latency = bench_requests(io, manager_cls, extension, args.requests, args.repeat)
+                latencies.append(latency)
+                print("{:<24} {:>10} {:>8} {:>14.2f} {:>14.2f}".format(
+                    name, len(io) + extension, manager, latency[0]*1e6, latency[1]*1e6))
+            if manager == "indexed":
+                for i, kind in enumerate(["request", "lookup"]):
+                    if latencies[-1][i] > args.max_ratio*latencies[0][i]:
+                        failures.append((name, kind, latencies[0][i], latencies[-1][i]))
+    for name, kind, first, last in failures:
+        print("{} {} latency not flat: {:.2f}us -> {:.2f}us.".format(name, kind, first*1e6, last*1e6))
+    sys.exit(1 if failures else 0)
+
+if __name__ == "__main__":
+    main()
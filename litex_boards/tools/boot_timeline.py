@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Boot timeline tool.
+#
+# Read the boot timeline of a target built with --fast-boot (boot_timeline CSRs) through litex_server
+# (UART/Etherbone/JTAG bridge) and print the cycles/time since reset of each boot mark:
+#
+# $ litex_server --uart --uart-port=/dev/ttyUSB1
+# $ python3 -m litex_boards.tools.boot_timeline --csr-csv=build/digilent_arty/csr.csv
+# $ python3 -m litex_boards.tools.boot_timeline --csr-csv=build/digilent_arty/csr.csv --json
+
+import sys
+import json
+import argparse
+
+from litex_boards.integration.fast_boot import boot_timeline_marks
+
+# Boot Timeline ------------------------------------------------------------------------------------
+
+def get_boot_timeline(bus):
+    """Return the boot timeline entries [(mark id, mark name, cycles since reset)] of a target."""
+    timeline = []
+    for i in range(bus.regs.boot_timeline_count.read()):
+        bus.regs.boot_timeline_sel.write(i)
+        mark_id = bus.regs.boot_timeline_entry_id.read()
+        cycles  = bus.regs.boot_timeline_entry_cycles.read()
+        timeline.append((mark_id, boot_timeline_marks.get(mark_id, "mark-0x{:02x}".format(mark_id)), cycles))
+    return sorted(timeline, key=lambda entry: entry[2])
+
+# Run ----------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="LiteX-Boards boot timeline tool.")
+    parser.add_argument("--csr-csv", default="csr.csv",      help="CSR definition file of the target.")
+    parser.add_argument("--host",    default="localhost",    help="litex_server host.")
+    parser.add_argument("--port",    default=1234, type=int, help="litex_server port.")
+    parser.add_argument("--json",    action="store_true",    help="Print the timeline as JSON.")
+    args = parser.parse_args()
+
+    from litex import RemoteClient
+
+    bus = RemoteClient(host=args.host, port=args.port, csr_csv=args.csr_csv)
+    bus.open()
+    try:
+        if not hasattr(bus.regs, "boot_timeline_count"):
+            print("No boot timeline in {} (target built without --fast-boot?).".format(args.csr_csv))
+            sys.exit(1)
+        sys_clk_freq = bus.constants.config_clock_frequency
+        timeline     = get_boot_timeline(bus)
+    finally:
+        bus.close()
+
+    if args.json:
+        print(json.dumps({
+            "sys_clk_freq" : sys_clk_freq,
+            "timeline"     : [{"id": mark_id, "name": name, "cycles": cycles} for mark_id, name, cycles in timeline],
+        }, indent=1))
+        return
+    print("{:<20} {:>14} {:>12} {:>12}".format("Mark", "Cycles", "Time (ms)", "Delta (ms)"))
+    previous = 0
+    for mark_id, name, cycles in timeline:
+        print("{:<20} {:>14} {:>12.3f} {:>12.3f}".format(name, cycles,
+            cycles*1e3/sys_clk_freq,
+            (cycles - previous)*1e3/sys_clk_freq))
+        previous = cycles
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Targets Capabilities.
+#
+# Capabilities of the targets are extracted statically (from the sources, no import) and stored in a
+# cached index (litex_boards/targets/capabilities.json), regenerated incrementally on target/platform
+# file changes:
+# - dram     : DRAM modules, PHYs and data width (from the platform's ddram/sdram dq pins).
+# - ethernet : Ethernet PHYs.
+# - pcie     : PCIe PHYs, lanes and data width.
+# - sata     : SATA PHY generations.
+# - video    : Video PHYs and cores (terminal, framebuffer, colorbars).
+# - hbm      : HBM2 support.
+# - options  : Target's command line options (--with-ethernet, --with-pcie, etc...).
+#
+# $ python3 -m litex_boards.tools.capabilities update
+# $ python3 -m litex_boards.tools.capabilities query --dram-phy=DDR3 --ethernet=RGMII --pcie-lanes=4
+# $ python3 -m litex_boards.tools.capabilities query --sata --video --json
+# $ python3 -m litex_boards.tools.capabilities show xilinx_kc705
+
+import os
+import re
+import ast
+import sys
+import json
+import hashlib
+import argparse
+
+from litex_boards import platforms
+from litex_boards import targets
+
+# Index --------------------------------------------------------------------------------------------
+
+capabilities_version  = 1
+targets_dir           = os.path.dirname(targets.__file__)
+platforms_dir         = os.path.dirname(platforms.__file__)
+capabilities_filename = os.path.join(targets_dir, "capabilities.json")
+
+def _get_sha256(filename):
+    if not os.path.exists(filename):
+        return None
+    with open(filename, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def _get_platform_name(tree):
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and node.module == "litex_boards.platforms":
+            return node.names[0].name
+    return None
+
+def get_target_sources(name):
+    """Return (target file, platform file) of a target."""
+    target_file = os.path.join(targets_dir, name + ".py")
+    with open(target_file) as f:
+        platform = _get_platform_name(ast.parse(f.read()))
+    platform_file = None if platform is None else os.path.join(platforms_dir, platform + ".py")
+    return target_file, platform_file
+
+# Extraction ---------------------------------------------------------------------------------------
+
+_dram_phy_re  = re.compile(r"(DDR\d?PHY|SDRPHY|DDRPHY)$")
+_video_phy_re = re.compile(r"^Video\w*PHY$")
+
+def _get_name(node):
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+def _get_constant(node):
+    if isinstance(node, ast.Constant):
+        return node.value
+    return None
+
+def _append(l, value):
+    if (value is not None) and (value not in l):
+        l.append(value)
+
+def _get_imported(tree, prefix):
+    # Names imported from modules starting with prefix (anywhere in the file, imports can be lazy).
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and node.module and node.module.startswith(prefix):
+            for alias in node.names:
+                names.add(alias.asname or alias.name)
+    return names
+
+def _get_pcie_lanes(call):
+    for node in ast.walk(call):
+        if isinstance(node, ast.Call) and _get_name(node.func) == "request" and node.args:
+            m = re.match(r"pcie_x(\d+)", str(_get_constant(node.args[0])))
+            if m:
+                return int(m.group(1))
+    return None
+
+def get_dram_data_width(platform_file):
+    """Return the data width of the platform's DRAM (dq pins of ddram/sdram:0), None if unknown."""
+    if platform_file is None or not os.path.exists(platform_file):
+        return None
+    with open(platform_file) as f:
+        tree = ast.parse(f.read())
+    for node in ast.walk(tree):
+        if not (isinstance(node, ast.Tuple) and len(node.elts) >= 3):
+            continue
+        if _get_constant(node.elts[0]) not in ["ddram", "sdram"] or _get_constant(node.elts[1]) != 0:
+            continue
+        for element in node.elts[2:]:
+            if isinstance(element, ast.Call) and _get_name(element.func) == "Subsignal":
+                if element.args and _get_constant(element.args[0]) == "dq":
+                    for pins in element.args[1:]:
+                        if isinstance(pins, ast.Call) and _get_name(pins.func) == "Pins":
+                            identifiers = [_get_constant(arg) for arg in pins.args]
+                            if identifiers and all(isinstance(i, str) for i in identifiers):
+                                return len(" ".join(identifiers).split())
+    return None
+
+def get_target_capabilities(name):
+    """Extract capabilities of a target from its sources."""
+    target_file, platform_file = get_target_sources(name)
+    with open(target_file) as f:
+        tree = ast.parse(f.read())
+    dram_modules  = _get_imported(tree, "litedram.modules")
+    eth_phys      = _get_imported(tree, "liteeth.phy")
+    pcie_phys     = _get_imported(tree, "litepcie.phy")
+    caps = {
+        "sha256"          : _get_sha256(target_file),
+        "platform"        : _get_platform_name(tree),
+        "platform_sha256" : _get_sha256(platform_file) if platform_file else None,
+        "dram"            : {"modules": [], "phys": [], "data_width": None},
+        "ethernet"        : {"phys": [], "etherbone": False},
+        "pcie"            : [],
+        "sata"            : {"gens": []},
+        "video"           : {"phys": [], "cores": []},
+        "hbm"             : False,
+        "options"         : [],
+    }
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name):
+            if node.id in dram_modules:
+                _append(caps["dram"]["modules"], node.id)
+            if node.id in eth_phys and re.search(r"PHY|BASEX", node.id):
+                _append(caps["ethernet"]["phys"], node.id)
+            if node.id == "USPHBM2":
+                caps["hbm"] = True
+        if isinstance(node, (ast.Name, ast.Attribute)):
+            # PHYs can be selected before being instantiated (ex: sdrphy_cls = HalfRateGENSDRPHY).
+            if _dram_phy_re.search(_get_name(node)):
+                _append(caps["dram"]["phys"], _get_name(node))
+        if not isinstance(node, ast.Call):
+            continue
+        func   = _get_name(node.func)
+        kwargs = {kw.arg: _get_constant(kw.value) for kw in node.keywords if kw.arg}
+        if func is None:
+            continue
+        if _video_phy_re.match(func):
+            _append(caps["video"]["phys"], func)
+        elif func in pcie_phys:
+            pcie = {"phy": func, "lanes": _get_pcie_lanes(node), "data_width": kwargs.get("data_width", None)}
+            if pcie not in caps["pcie"]:
+                caps["pcie"].append(pcie)
+        elif func == "LiteSATAPHY":
+            _append(caps["sata"]["gens"], kwargs.get("gen", None) or "argument")
+        elif func.startswith("add_video_"):
+            _append(caps["video"]["cores"], func[len("add_video_"):])
+        elif func == "add_etherbone":
+            caps["ethernet"]["etherbone"] = True
+        elif func == "add_argument" and node.args:
+            option = _get_constant(node.args[0])
+            if isinstance(option, str) and option.startswith("--"):
+                _append(caps["options"], option)
+    if caps["dram"]["phys"]:
+        caps["dram"]["data_width"] = get_dram_data_width(platform_file)
+    for key in ["modules", "phys"]:
+        caps["dram"][key].sort()
+    caps["ethernet"]["phys"].sort()
+    caps["video"]["phys"].sort()
+    return caps
+
+# Load/Update --------------------------------------------------------------------------------------
+
+def _empty_capabilities():
+    return {"version": capabilities_version, "targets": {}}
+
+def load_capabilities(filename=capabilities_filename):
+    if not os.path.exists(filename):
+        return _empty_capabilities()
+    with open(filename) as f:
+        capabilities = json.load(f)
+    if capabilities.get("version", None) != capabilities_version:
+        return _empty_capabilities()
+    return capabilities
+
+def save_capabilities(capabilities, filename=capabilities_filename):
+    tmp = filename + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(capabilities, f, indent=1, sort_keys=True)
+        f.write("\n")
+    os.replace(tmp, filename)
+
+def get_stale_targets(capabilities):
+    """Return targets that are missing or whose target/platform file changed since indexed."""
+    stale = []
+    for name in targets.available():
+        caps = capabilities["targets"].get(name, None)
+        if caps is None:
+            stale.append(name)
+            continue
+        target_file, platform_file = get_target_sources(name)
+        if caps["sha256"] != _get_sha256(target_file):
+            stale.append(name)
+        elif platform_file and caps["platform_sha256"] != _get_sha256(platform_file):
+            stale.append(name)
+    return stale
+
+def update_capabilities(filename=capabilities_filename, force=False):
+    capabilities = _empty_capabilities() if force else load_capabilities(filename)
+    names = targets.available()
+    for name in list(capabilities["targets"].keys()):
+        if name not in names:
+            del capabilities["targets"][name]
+    stale = get_stale_targets(capabilities)
+    for name in stale:
+        capabilities["targets"][name] = get_target_capabilities(name)
+    if stale or not os.path.exists(filename):
+        save_capabilities(capabilities, filename)
+    return capabilities
+
+# Query --------------------------------------------------------------------------------------------
+
+def _match(values, pattern):
+    # Case insensitive substring match on any of the values (any value when pattern is "").
+    return any(pattern.lower() in str(value).lower() for value in values)
+
+def query(capabilities, dram=None, dram_phy=None, dram_width=None, ethernet=None, pcie=None,
+    pcie_lanes=None, sata=False, video=None, hbm=False, options=[]):
+    """Return the names of the targets matching all the criteria (substring matches)."""
+    names = []
+    for name, caps in sorted(capabilities["targets"].items()):
+        if (dram is not None) and not _match(caps["dram"]["modules"] or ([""] if caps["dram"]["phys"] else []), dram):
+            continue
+        if (dram_phy is not None) and not _match(caps["dram"]["phys"], dram_phy):
+            continue
+        if (dram_width is not None) and ((caps["dram"]["data_width"] or 0) < dram_width):
+            continue
+        if (ethernet is not None) and not _match(caps["ethernet"]["phys"], ethernet):
+            continue
+        if (pcie is not None) and not _match([p["phy"] for p in caps["pcie"]], pcie):
+            continue
+        if (pcie_lanes is not None) and not any((p["lanes"] or 0) >= pcie_lanes for p in caps["pcie"]):
+            continue
+        if sata and not caps["sata"]["gens"]:
+            continue
+        if (video is not None) and not _match(caps["video"]["phys"], video):
+            continue
+        if hbm and not caps["hbm"]:
+            continue
+        if not all(option in caps["options"] for option in options):
+            continue
+        names.append(name)
+    return names
+
+def _format_capabilities(caps):
+    dram = "-"
+    if caps["dram"]["phys"]:
+        dram = "{} {}{}".format("/".join(caps["dram"]["modules"]) or "?", "/".join(caps["dram"]["phys"]),
+            "" if caps["dram"]["data_width"] is None else " x{}".format(caps["dram"]["data_width"]))
+    pcie = "/".join("{}{}".format(p["phy"], "" if p["lanes"] is None else " x{}".format(p["lanes"])) for p in caps["pcie"])
+    return [dram, "/".join(caps["ethernet"]["phys"]) or "-", pcie or "-",
+        "/".join(caps["sata"]["gens"]) or "-", "/".join(caps["video"]["phys"]) or "-", "yes" if caps["hbm"] else "-"]
+
+# Run ----------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="LiteX-Boards Targets Capabilities.")
+    parser.add_argument("--capabilities", default=capabilities_filename, help="Capabilities index file.")
+    subparsers = parser.add_subparsers(dest="command")
+
+    update_parser = subparsers.add_parser("update", help="Regenerate stale entries of the index.")
+    update_parser.add_argument("--force", action="store_true", help="Regenerate all entries.")
+    update_parser.add_argument("--check", action="store_true", help="Only check that the index is up to date.")
+
+    query_parser = subparsers.add_parser("query", help="Query targets.")
+    query_parser.add_argument("--dram",       nargs="?", const="", default=None, help="DRAM support (optionally matching module, ex: MT41K).")
+    query_parser.add_argument("--dram-phy",   default=None,                      help="DRAM PHY (ex: A7DDRPHY, ECP5, DDR4).")
+    query_parser.add_argument("--dram-width", default=None, type=int,            help="Minimal DRAM data width.")
+    query_parser.add_argument("--ethernet",   nargs="?", const="", default=None, help="Ethernet support (optionally matching PHY, ex: RGMII).")
+    query_parser.add_argument("--pcie",       nargs="?", const="", default=None, help="PCIe support (optionally matching PHY, ex: USPPCIEPHY).")
+    query_parser.add_argument("--pcie-lanes", default=None, type=int,            help="Minimal number of PCIe lanes.")
+    query_parser.add_argument("--sata",       action="store_true",               help="SATA support.")
+    query_parser.add_argument("--video",      nargs="?", const="", default=None, help="Video support (optionally matching PHY, ex: HDMI).")
+    query_parser.add_argument("--hbm",        action="store_true",               help="HBM2 support.")
+    query_parser.add_argument("--option",     default=[], action="append",       help="Target command line option (ex: --with-sdcard), can be repeated.")
+    query_parser.add_argument("--json",       action="store_true",               help="Output matching entries as JSON.")
+
+    show_parser = subparsers.add_parser("show", help="Show capabilities of a target.")
+    show_parser.add_argument("target", help="Target name.")
+
+    args = parser.parse_args()
+
+    if args.command == "update":
+        if args.check:
+            stale = get_stale_targets(load_capabilities(args.capabilities))
+            for name in stale:
+                print("{} is not up to date.".format(name))
+            sys.exit(1 if stale else 0)
+        capabilities = update_capabilities(args.capabilities, force=args.force)
+        print("{} targets indexed.".format(len(capabilities["targets"])))
+    elif args.command == "query":
+        capabilities = load_capabilities(args.capabilities)
+        names = query(capabilities,
+            dram       = args.dram,
+            dram_phy   = args.dram_phy,
+            dram_width = args.dram_width,
+            ethernet   = args.ethernet,
+            pcie       = args.pcie,
+            pcie_lanes = args.pcie_lanes,
+            sata       = args.sata,
+            video      = args.video,
+            hbm        = args.hbm,
+            options    = args.option)
+        if args.json:
+            print(json.dumps({name: capabilities["targets"][name] for name in names}, indent=1, sort_keys=True))
+        else:
+            line = "{:<40} {:<36} {:<28} {:<24} {:<8} {:<20} {:<4}"
+            print(line.format("Target", "DRAM", "Ethernet", "PCIe", "SATA", "Video", "HBM"))
+            for name in names:
+                print(line.format(name, *_format_capabilities(capabilities["targets"][name])))
+    elif args.command == "show":
+        print(json.dumps(load_capabilities(args.capabilities)["targets"][args.target], indent=1, sort_keys=True))
+    else:
+        parser.print_help()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Static Constraints Checker.
+#
+# Checks the IOs/Connectors of the platforms (without elaborating any SoC) and reports findings that
+# would otherwise only be discovered by the vendor toolchain, minutes into a build:
+# - unresolved-pin      (error)  : Connector pin that can't be resolved (unknown connector/pin, None),
+#                                  warning for extension helpers (not compatible with all connectors).
+# - duplicate-resource  (error)  : Resource (name, number) declared more than once.
+# - duplicate-pin       (error)  : Package pin used twice in a resource or by single signal resources
+#                                  with the same name (ex: user_led:0/user_led:1).
+# - shared-pin          (warning): Package pin shared by other resources (alternatives, shared buses?).
+# - connector-pin-used  (warning): Connector pin also used by a fixed (non-connector) IO resource.
+# - iostandard-mismatch (warning): Single-ended IOStandards of different voltages in a resource.
+# - io-mutation         (warning): Platform creation modifies the module-level _io/_connectors.
+# - platform-error      (info)   : Platform can't be created, module-level _io/_connectors checked.
+#
+# Each platform is checked in its default configuration and with each of its with_* options enabled
+# (ex: with_daughterboard for QMTechDaughterboard), each extension helper (raw_pmod_io, usb_pmod_io,
+# etc...) being also checked on each compatible connector. Platforms are checked in parallel and
+# findings can be written as JSON.
+#
+# $ python3 -m litex_boards.tools.check_constraints
+# $ python3 -m litex_boards.tools.check_constraints digilent_arty qmtech_xc7a35t --json=findings.json
+
+import re
+import sys
+import json
+import inspect
+import argparse
+import multiprocessing
+
+from litex_boards import platforms
+
+# Findings -----------------------------------------------------------------------------------------
+
+severities = ["error", "warning", "info"]
+
+# Pins that are not constrained (ex: Zynq PS MIOs).
+placeholder_pins = ["X"]
+
+def finding(platform, variant, check, severity, message, resources=[], pins=[]):
+    return {
+        "platform"  : platform,
+        "variant"   : variant,
+        "check"     : check,
+        "severity"  : severity,
+        "message"   : message,
+        "resources" : ["{}:{}".format(*resource) for resource in resources],
+        "pins"      : list(pins),
+    }
+
+# Helpers ------------------------------------------------------------------------------------------
+
+def get_voltage(iostandard):
+    """Return the voltage of an IOStandard (None if unknown/not single-ended)."""
+    name = iostandard.upper()
+    m = re.match(r"(\d\.\d+)-V", name)
+    if m:
+        return float(m.group(1))
+    if name.startswith("DIFF_") or "LVDS" in name or "TMDS" in name or "MIPI" in name:
+        return None
+    if name == "LVTTL":
+        return 3.3
+    m = re.search(r"(LVCMOS|SSTL|HSTL|HSUL|POD|HSLVDCI|LVTTL)\D*?(\d)(\d{1,2})", name)
+    if m:
+        return float("{}.{}".format(m.group(2), m.group(3)))
+    return None
+
+def get_resource_elements(resource):
+    """Return (subsignal name, pins identifiers, iostandards) of a resource and its subsignals."""
+    from litex.build.generic_platform import Pins, IOStandard, Subsignal
+    top_pins, top_iostandards, subsignals = [], [], []
+    for element in resource[2:]:
+        if isinstance(element, Pins):
+            top_pins += element.identifiers
+        elif isinstance(element, IOStandard):
+            top_iostandards.append(element.name)
+        elif isinstance(element, Subsignal):
+            pins        = []
+            iostandards = []
+            for constraint in element.constraints:
+                if isinstance(constraint, Pins):
+                    pins += constraint.identifiers
+                elif isinstance(constraint, IOStandard):
+                    iostandards.append(constraint.name)
+            subsignals.append((element.name, pins, iostandards))
+    if not subsignals:
+        return [(None, top_pins, top_iostandards)]
+    return [(name, pins, iostandards or top_iostandards) for name, pins, iostandards in subsignals]
+
+def resolve_pin(connector_map, identifier):
+    """Resolve a pin identifier to a package pin, raise ValueError if not possible."""
+    if ":" not in identifier:
+        if identifier == "None":
+            raise ValueError("Unconnected pin")
+        return identifier
+    try:
+        pin = connector_map.resolve_identifiers([identifier])[0]
+    except Exception as e:
+        raise ValueError("{}".format(e) or type(e).__name__)
+    if pin is None:
+        raise ValueError("Unconnected connector pin")
+    return pin
+
+# Checks -------------------------------------------------------------------------------------------
+
+def check_resources(name, variant, io, connector_map, source=None):
+    """Check a list of IO resources (platform IOs or extension), return findings and used pins."""
+    findings  = []
+    declared  = set()
+    single    = set() # Resources without subsignals.
+    used      = {}    # Package pin -> [(Resource, via connector)].
+    prefix    = "" if source is None else "{}: ".format(source)
+    for resource in io:
+        key = (resource[0], resource[1])
+        if key in declared:
+            findings.append(finding(name, variant, "duplicate-resource", "error",
+                prefix + "Resource {}:{} declared more than once.".format(*key), [key]))
+        declared.add(key)
+        elements = get_resource_elements(resource)
+        if elements[0][0] is None:
+            single.add(key)
+        voltages = {}
+        pins     = []
+        for subsignal, identifiers, iostandards in elements:
+            for identifier in identifiers:
+                try:
+                    pin = resolve_pin(connector_map, identifier)
+                except ValueError as e:
+                    # Extension helpers are not necessarily compatible with all connectors.
+                    findings.append(finding(name, variant, "unresolved-pin", "error" if source is None else "warning",
+                        prefix + "Pin {} of {}:{} can't be resolved ({}).".format(identifier, *key, e), [key], [identifier]))
+                    continue
+                if pin in placeholder_pins:
+                    continue
+                if pin in pins:
+                    findings.append(finding(name, variant, "duplicate-pin", "error",
+                        prefix + "Pin {} used twice in {}:{}.".format(pin, *key), [key], [pin]))
+                pins.append(pin)
+                used.setdefault(pin, []).append((key, ":" in identifier))
+            for iostandard in iostandards:
+                voltage = get_voltage(iostandard)
+                if voltage is not None:
+                    voltages.setdefault(voltage, iostandard)
+        if len(voltages) > 1:
+            findings.append(finding(name, variant, "iostandard-mismatch", "warning",
+                prefix + "{}:{} mixes IOStandards of different voltages: {}.".format(*key,
+                ", ".join(sorted(voltages.values()))), [key]))
+    for pin, users in sorted(used.items()):
+        resources = []
+        for resource, _ in users:
+            if resource not in resources:
+                resources.append(resource)
+        if len(resources) < 2:
+            continue
+        # Same pin on instances of a single signal resource (ex: user_led:0/1) is an error, other
+        # cases can be intended (alternatives, shared buses like MDIO, etc...).
+        duplicate = False
+        for resource in resources:
+            others    = [r for r in resources if (r[0] == resource[0]) and (r != resource)]
+            duplicate |= (resource in single) and any(r in single for r in others)
+        findings.append(finding(name, variant,
+            "duplicate-pin" if duplicate else "shared-pin",
+            "error"         if duplicate else "warning",
+            prefix + "Pin {} used by {}.".format(pin, ", ".join("{}:{}".format(*r) for r in resources)),
+            resources, [pin]))
+    return findings, used
+
+def check_connectors(name, variant, connector_map, used):
+    """Check connectors pins against the pins used by fixed IO resources."""
+    findings = []
+    try:
+        pin_map = connector_map.get_map()
+    except Exception as e:
+        return [finding(name, variant, "unresolved-pin", "error", "Connectors: {}.".format(e))]
+    for identifier, pin in sorted(pin_map.items()):
+        fixed = [resource for resource, via_connector in used.get(pin, []) if not via_connector]
+        if fixed:
+            findings.append(finding(name, variant, "connector-pin-used", "warning",
+                "Connector pin {} ({}) also used by {}.".format(identifier, pin,
+                ", ".join("{}:{}".format(*r) for r in fixed)), fixed, [pin]))
+    return findings
+
+def get_extension_helpers(module):
+    """Return the extension helpers of a platform module with the connector prefix they apply to."""
+    helpers = []
+    for helper_name, helper in sorted(vars(module).items()):
+        if helper_name.startswith("_") or not inspect.isfunction(helper) or not helper_name.endswith("_io"):
+            continue
+        if helper.__module__ != module.__name__:
+            continue
+        params = list(inspect.signature(helper).parameters)
+        if params and params[0] in ["pmod", "syzygy"]:
+            helpers.append((helper_name, helper, params[0]))
+    return helpers
+
+def get_variants(module):
+    """Return the platform variants to check: default and each with_* option enabled."""
+    variants = [{}]
+    if hasattr(module, "Platform"):
+        for param in inspect.signature(module.Platform.__init__).parameters.values():
+            if param.name.startswith("with_") and param.default is False:
+                variants.append({param.name: True})
+    return variants
+
+def check_platform(name, variant={}):
+    """Check a platform variant, return its findings."""
+    import copy
+    from litex_boards.integration.constraints import ConnectorMap
+    module     = platforms.get(name)
+    variant_id = ",".join("{}={}".format(k, v) for k, v in sorted(variant.items())) or "default"
+    findings   = []
+
+    # Get IOs/Connectors from platform (or module when platform can't be created).
+    io         = list(getattr(module, "_io", []))
+    connectors = list(getattr(module, "_connectors", []))
+    snapshot   = (copy.copy(io), copy.copy(connectors))
+    try:
+        platform = module.Platform(**variant)
+        io       = list(platform.constraint_manager.available)
+        connector_map = ConnectorMap([])
+        connector_map.connector_table.update(platform.constraint_manager.connector_manager.connector_table)
+    except Exception as e:
+        if variant:
+            return [finding(name, variant_id, "platform-error", "info", "{}: {}".format(
+                type(e).__name__, (str(e).splitlines() or [""])[0]))]
+        if hasattr(module, "Platform"):
+            findings.append(finding(name, variant_id, "platform-error", "info", "{}: {}".format(
+                type(e).__name__, (str(e).splitlines() or [""])[0])))
+        try:
+            connector_map = ConnectorMap(connectors)
+        except Exception as e:
+            return findings + [finding(name, variant_id, "unresolved-pin", "error", "Connectors: {}.".format(e))]
+    if (len(getattr(module, "_io", [])), len(getattr(module, "_connectors", []))) != tuple(map(len, snapshot)):
+        findings.append(finding(name, variant_id, "io-mutation", "warning",
+            "Platform creation modifies module-level _io/_connectors."))
+
+    # Platform IOs / Connectors.
+    f, used = check_resources(name, variant_id, io, connector_map)
+    findings += f
+    findings += check_connectors(name, variant_id, connector_map, used)
+
+    # Extension helpers on compatible connectors (default variant only).
+    if not variant:
+        for helper_name, helper, kind in get_extension_helpers(module):
+            for conn in connector_map.connector_table:
+                if kind not in conn.lower():
+                    continue
+                source = "{}({})".format(helper_name, conn)
+                try:
+                    extension = helper(conn)
+                except Exception as e:
+                    findings.append(finding(name, variant_id, "unresolved-pin", "error",
+                        "{}: {}.".format(source, e)))
+                    continue
+                f, _ = check_resources(name, variant_id, extension, connector_map, source=source)
+                findings += f
+    return findings
+
+def _check_job(job):
+    name, variant = job
+    try:
+        return check_platform(name, variant)
+    except Exception as e:
+        return [finding(name, "default", "platform-error", "error", "Check failed: {}: {}".format(type(e).__name__, e))]
+
+def check_platforms(names=None, jobs=None):
+    """Check platforms (all by default) in parallel, return findings."""
+    names = platforms.available() if names is None else names
+    tasks = []
+    for name in names:
+        for variant in get_variants(platforms.get(name)):
+            tasks.append((name, variant))
+    # Platforms can modify module-level state: check each variant in its own (forked) process (LiteX
+    # and platforms modules already imported by get_variants).
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("fork" if "fork" in methods else None)
+    findings = []
+    with context.Pool(processes=jobs, maxtasksperchild=1) as pool:
+        for f in pool.imap(_check_job, tasks):
+            findings += f
+    return findings
+
+# Run ----------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="LiteX-Boards static Constraints Checker.")
+    parser.add_argument("platforms",    nargs="*",                   help="Platforms to check (default: all).")
+    parser.add_argument("--jobs", "-j", default=None, type=int,      help="Number of parallel jobs (default: number of CPUs).")
+    parser.add_argument("--json",       default=None,                help="Write findings to JSON file (- for stdout).")
+    parser.add_argument("--severity",   default="error", choices=severities, help="Minimal severity of the reported findings (default: error).")
+    parser.add_argument("--strict",     action="store_true",         help="Also fail on warnings (when reported).")
+    args = parser.parse_args()
+
+    findings = check_platforms(args.platforms or None, args.jobs)
+    findings = [f for f in findings if severities.index(f["severity"]) <= severities.index(args.severity)]
+
+    if args.json is not None:
+        content = json.dumps({"version": 1, "findings": findings}, indent=1)
+        if args.json == "-":
+            print(content)
+        else:
+            with open(args.json, "w") as f:
+                f.write(content + "\n")
+    if args.json != "-":
+        for f in findings:
+            print("{}[{}]: {}: {}: {}".format(f["platform"], f["variant"], f["severity"], f["check"], f["message"]))
+    counts = {severity: sum(f["severity"] == severity for f in findings) for severity in severities}
+    print("{} error(s), {} warning(s).".format(counts["error"], counts["warning"]), file=sys.stderr)
+    failed = counts["error"] or (args.strict and counts["warning"])
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
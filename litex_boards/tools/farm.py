@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Build farm: Build many target configurations.
+#
+# Jobs are described in a JSON file: each entry is a target with its options, or a matrix of options
+# (each matrix axis is a list of alternatives, "" for none) expanded to one job per combination:
+#
+# {
+#     "options" : ["--no-compile-software"],
+#     "jobs"    : [
+#         {"target": "digilent_arty", "matrix": [
+#             ["--variant=a7-35", "--variant=a7-100"],
+#             ["--with-ethernet", "--with-etherbone"],
+#             ["", "--with-spi-flash"]]},
+#         {"target": "xilinx_vcu118", "memory": "24G", "retries": 2},
+#         {"target": "icebreaker", "name": "icebreaker-serv", "options": "--cpu-type=serv"}
+#     ]
+# }
+#
+# Each job builds its target (--build) in its own work directory (<work-dir>/farm/<name>), jobs are run
+# on a pool of workers limited by the number of jobs (--jobs) and by the memory (--memory, default:
+# available memory): a job only starts when its memory estimate fits (heaviest jobs first, lighter
+# ones fill the remaining memory). Estimates come from the job ("memory"), else from the peak memory
+# of its previous builds (<work-dir>/memory.json), else from its platform's FPGA family/toolchain.
+#
+# Jobs failing on transient errors (killed, out of memory, license/network errors) are retried (up
+# to "retries"/--retries times, with a 1.5x memory estimate after an out of memory) and a summary with
+# duration, peak memory, utilization and WNS of each job is reported (and written to
+# <work-dir>/summary.json):
+#
+# $ python3 -m litex_boards.tools.farm jobs.json --jobs=8 --memory=64G
+# $ python3 -m litex_boards.tools.farm jobs.json --dry-run
+
+import os
+import re
+import ast
+import sys
+import glob
+import json
+import time
+import shlex
+import hashlib
+import argparse
+import itertools
+
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from litex_boards import platforms
+from litex_boards import targets
+from litex_boards.tools.sweep import SweepJob, run_job, get_job_dir, default_workers
+from litex_boards.tools.capabilities import load_capabilities
+from litex_boards.integration.artifacts import parse_size
+from litex_boards.integration.pnr_seeds import parse_nextpnr_fmax, parse_nextpnr_utilization
+from litex_boards.integration.vivado_strategies import get_available_memory, parse_vivado_timing, parse_vivado_utilization
+
+# Memory Estimates ---------------------------------------------------------------------------------
+
+GB = 10**9
+
+# Peak memory of a build from the FPGA device (first match) or platform class.
+device_memory_estimates = [
+    (r"^xc(vu|ku|zu|au|vc|vp|ve)", 16*GB), # UltraScale/UltraScale+/Versal.
+    (r"^xc7[vk]",                   8*GB), # Virtex7/Kintex7.
+    (r"^xc7",                       4*GB), # Artix7/Spartan7/Zynq7000.
+    (r"^xc6",                       2*GB), # Spartan6 (ISE).
+]
+
+platform_memory_estimates = {
+    "XilinxPlatform"     : 4*GB,
+    "AlteraPlatform"     : 4*GB,
+    "EfinixPlatform"     : 2*GB,
+    "MicrosemiPlatform"  : 4*GB,
+    "LatticePlatform"    : 1*GB,
+    "GowinPlatform"      : 1*GB,
+    "AnlogicPlatform"    : 1*GB,
+    "QuickLogicPlatform" : 1*GB,
+}
+
+default_memory_estimate = 2*GB
+
+def get_platform_memory_estimate(platform):
+    """Estimate the peak memory of a build on a platform (from its module's sources)."""
+    filename = os.path.join(os.path.dirname(platforms.__file__), platform + ".py")
+    if not os.path.exists(filename):
+        return default_memory_estimate
+    with open(filename) as f:
+        tree = ast.parse(f.read())
+    # Devices: Largest estimate of the device strings (platforms with variants).
+    devices = [node.value.lower() for node in ast.walk(tree)
+        if isinstance(node, ast.Constant) and isinstance(node.value, str)]
+    estimates = []
+    for device in devices:
+        for pattern, memory in device_memory_estimates:
+            if re.match(pattern, device):
+                estimates.append(memory)
+                break
+    if estimates:
+        return max(estimates)
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ClassDef):
+            for base in node.bases:
+                if getattr(base, "id", None) in platform_memory_estimates:
+                    return platform_memory_estimates[base.id]
+    return default_memory_estimate
+
+class FarmMemory:
+    """Peak memory (bytes) of the previous builds of the jobs."""
+    def __init__(self, filename):
+        self.filename = filename
+        self.memory   = {}
+        if os.path.exists(filename):
+            with open(filename) as f:
+                self.memory = json.load(f)
+
+    def get(self, job):
+        return self.memory.get(job.name, None)
+
+    def update(self, job, max_rss):
+        if max_rss:
+            self.memory[job.name] = max_rss
+
+    def save(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.filename)), exist_ok=True)
+        tmp = self.filename + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.memory, f, indent=1, sort_keys=True)
+        os.replace(tmp, self.filename)
+
+# Jobs ---------------------------------------------------------------------------------------------
+
+def _split_options(options):
+    return shlex.split(options) if isinstance(options, str) else list(options)
+
+def get_job_name(target, options):
+    name = "-".join([target] + [re.sub(r"[^\w.=+-]", "_", option.lstrip("-")) for option in options])
+    if len(name) > 100:
+        name = "{}-{}".format(target, hashlib.sha256(" ".join(options).encode()).hexdigest()[:16])
+    return name
+
+class FarmJob(SweepJob):
+    def __init__(self, name, target, options=[], memory=None, retries=None):
+        SweepJob.__init__(self, "farm", name,
+            module = "litex_boards.targets.{}".format(target),
+            args   = ["--build", "--output-dir=build"] + list(options))
+        self.target  = target
+        self.options = list(options)
+        self.memory  = memory
+        self.retries = retries
+
+def load_jobs(filename, options=[]):
+    """Load (and expand) the jobs of a JSON jobs file."""
+    with open(filename) as f:
+        content = json.load(f)
+    common = _split_options(content.get("options", [])) + list(options)
+    jobs   = []
+    for entry in content["jobs"]:
+        if entry["target"] not in targets.available():
+            raise ValueError("Unknown target {}.".format(entry["target"]))
+        base   = _split_options(entry.get("options", []))
+        matrix = [[_split_options(alternative) for alternative in axis] for axis in entry.get("matrix", [])]
+        for combination in itertools.product(*matrix):
+            job_options = base + [option for alternative in combination for option in alternative]
+            name = get_job_name(entry["target"], job_options)
+            if "name" in entry:
+                name = get_job_name(entry["name"], [option for alternative in combination for option in alternative])
+            jobs.append(FarmJob(name, entry["target"], common + job_options,
+                memory  = parse_size(entry.get("memory", None)),
+                retries = entry.get("retries", None)))
+    names = [job.name for job in jobs]
+    for name in names:
+        if names.count(name) > 1:
+            raise ValueError("Duplicate job {}.".format(name))
+    return jobs
+
+# Reports ------------------------------------------------------------------------------------------
+
+# Main resources (Vivado site types/nextpnr bel types).
+utilization_resources = {
+    "Slice LUTs"      : "LUT",
+    "CLB LUTs"        : "LUT",
+    "Slice Registers" : "FF",
+    "CLB Registers"   : "FF",
+    "Block RAM Tile"  : "BRAM",
+    "DSPs"            : "DSP",
+    "TRELLIS_COMB"    : "LUT",
+    "TRELLIS_FF"      : "FF",
+    "DP16KD"          : "BRAM",
+    "MULT18X18D"      : "DSP",
+    "ICESTORM_LC"     : "LUT",
+    "ICESTORM_RAM"    : "BRAM",
+    "ICESTORM_DSP"    : "DSP",
+    "OXIDE_COMB"      : "LUT",
+    "OXIDE_FF"        : "FF",
+    "OXIDE_EBR"       : "BRAM",
+    "MULT18_CORE"     : "DSP",
+}
+
+def get_build_reports(job_dir, output):
+    """Return utilization ({resource: (used, available)}) and WNS (ns) of a build."""
+    utilization, wns = {}, None
+    gateware_dir = os.path.join(job_dir, "build", "gateware")
+    # Vivado.
+    for report in glob.glob(os.path.join(gateware_dir, "*_utilization_place.rpt")):
+        with open(report, errors="replace") as f:
+            utilization = parse_vivado_utilization(f.read())
+    for report in glob.glob(os.path.join(gateware_dir, "*_timing.rpt")):
+        with open(report, errors="replace") as f:
+            timing = parse_vivado_timing(f.read())
+        if timing is not None:
+            wns = timing[0]
+    # nextpnr: WNS from the achieved/constrained frequencies of the clocks.
+    if not utilization:
+        utilization = parse_nextpnr_utilization(output)
+    fmax = parse_nextpnr_fmax(output)
+    if wns is None and fmax:
+        wns = min(1e3/constrained - 1e3/achieved for achieved, constrained in fmax.values())
+    utilization = {utilization_resources[name]: value for name, value in utilization.items()
+        if name in utilization_resources}
+    return utilization, wns
+
+# Farm ---------------------------------------------------------------------------------------------
+
+_transient_re = re.compile(r"(out of memory|cannot allocate memory|std::bad_alloc|memoryerror|"
+    r"license (checkout )?(failed|error|not available)|flexnet.*error|"
+    r"connection (refused|reset|timed out)|temporary failure|resource temporarily unavailable)", re.IGNORECASE)
+_oom_re       = re.compile(r"(out of memory|cannot allocate memory|std::bad_alloc|memoryerror)", re.IGNORECASE)
+
+def is_transient_failure(result):
+    return (result.returncode < 0) or bool(_transient_re.search(result.output))
+
+def is_oom_failure(result):
+    return (result.returncode == -9) or bool(_oom_re.search(result.output))
+
+class Farm:
+    def __init__(self, jobs, workers=None, memory=None, retries=1, work_dir="build/farm", log=sys.stderr):
+        self.jobs     = jobs
+        self.workers  = workers or default_workers()
+        self.memory   = memory or get_available_memory()
+        self.retries  = retries
+        self.work_dir = work_dir
+        self.log      = log
+        self.history  = FarmMemory(os.path.join(work_dir, "memory.json"))
+        self.capabilities = load_capabilities()
+
+    def get_estimate(self, job):
+        if job.memory is not None:
+            return job.memory
+        if self.history.get(job) is not None:
+            return self.history.get(job)
+        platform = self.capabilities["targets"].get(job.target, {}).get("platform", None)
+        return default_memory_estimate if platform is None else get_platform_memory_estimate(platform)
+
+    def run_job(self, job, attempt):
+        result  = run_job(job, self.work_dir)
+        job_dir = get_job_dir(job, self.work_dir)
+        with open(os.path.join(job_dir, "farm.log"), "w" if attempt == 1 else "a") as f:
+            f.write("# Attempt {} (returncode {})\n".format(attempt, result.returncode))
+            f.write(result.output)
+        return result
+
+    def summarize(self, job, result, attempts, estimate):
+        utilization, wns = get_build_reports(get_job_dir(job, self.work_dir), result.output)
+        return {
+            "name"        : job.name,
+            "target"      : job.target,
+            "options"     : job.options,
+            "returncode"  : result.returncode,
+            "attempts"    : attempts,
+            "duration"    : result.duration,
+            "max_rss"     : result.max_rss,
+            "estimate"    : estimate,
+            "utilization" : utilization,
+            "wns"         : wns,
+        }
+
+    def run(self):
+        """Run the jobs, return the summaries."""
+        estimates = {job.name: self.get_estimate(job) for job in self.jobs}
+        attempts  = {job.name: 0 for job in self.jobs}
+        # Heaviest jobs first, ties broken on declaration order.
+        pending   = sorted(self.jobs, key=lambda job: -estimates[job.name])
+        running   = {}
+        summaries = {}
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            while pending or running:
+                # Start the jobs fitting in the remaining memory (at least one job runs).
+                used = sum(estimates[job.name] for job in running.values())
+                for job in list(pending):
+                    if len(running) >= self.workers:
+                        break
+                    if running and self.memory is not None and used + estimates[job.name] > self.memory:
+                        continue
+                    pending.remove(job)
+                    attempts[job.name] += 1
+                    running[executor.submit(self.run_job, job, attempts[job.name])] = job
+                    used += estimates[job.name]
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job    = running.pop(future)
+                    result = future.result()
+                    self.history.update(job, result.max_rss)
+                    retries = self.retries if job.retries is None else job.retries
+                    if result.returncode != 0 and is_transient_failure(result) and attempts[job.name] <= retries:
+                        if is_oom_failure(result):
+                            estimates[job.name] = int(1.5*estimates[job.name])
+                        self.log.write("{:<60} RETRY (returncode {}, attempt {})\n".format(job.name, result.returncode, attempts[job.name]))
+                        pending.insert(0, job)
+                        continue
+                    summaries[job.name] = self.summarize(job, result, attempts[job.name], estimates[job.name])
+                    self.log.write("{:<60} {} ({:.1f}s)\n".format(job.name, "PASS" if result.returncode == 0 else "FAIL", result.duration))
+                    self.log.flush()
+        self.history.save()
+        return [summaries[job.name] for job in self.jobs]
+
+def format_size(size):
+    return "-" if size is None else "{:.1f}G".format(size/GB)
+
+def format_summary(summaries):
+    lines = ["{:<60} {:<6} {:>3} {:>9} {:>7} {:>9} {}".format("Job", "Status", "Try", "Duration", "Memory", "WNS", "Utilization")]
+    for s in summaries:
+        utilization = ", ".join("{} {}/{}".format(name, used, available) for name, (used, available) in s["utilization"].items())
+        lines.append("{:<60} {:<6} {:>3} {:>8.1f}s {:>7} {:>9} {}".format(
+            s["name"],
+            "PASS" if s["returncode"] == 0 else "FAIL",
+            s["attempts"],
+            s["duration"],
+            format_size(s["max_rss"]),
+            "-" if s["wns"] is None else "{:.3f}ns".format(s["wns"]),
+            utilization or "-"))
+    passed = sum(s["returncode"] == 0 for s in summaries)
+    lines.append("{}/{} jobs passed.".format(passed, len(summaries)))
+    return "\n".join(lines)
+
+# Run ----------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Build many LiteX-Boards target configurations.",
+        epilog="Extra arguments are passed to all jobs.")
+    parser.add_argument("jobs_file",                                 help="JSON jobs file.")
+    parser.add_argument("--jobs",     default=None, type=int,        help="Maximum number of parallel jobs (default: LITEX_BOARDS_JOBS or number of cores).")
+    parser.add_argument("--memory",   default=None,                  help="Memory available to the jobs (ex: 64G, default: available memory).")
+    parser.add_argument("--retries",  default=1,    type=int,        help="Retries of jobs failing on transient errors.")
+    parser.add_argument("--work-dir", default=os.path.join("build", "farm"), help="Work directory.")
+    parser.add_argument("--summary",  default=None,                  help="Summary JSON file (default: <work-dir>/summary.json).")
+    parser.add_argument("--dry-run",  action="store_true",           help="List jobs and memory estimates only.")
+    args, options = parser.parse_known_args()
+
+    jobs = load_jobs(args.jobs_file, options)
+    farm = Farm(jobs,
+        workers  = args.jobs,
+        memory   = parse_size(args.memory),
+        retries  = args.retries,
+        work_dir = args.work_dir)
+    if args.dry_run:
+        for job in jobs:
+            print("{:<60} {:>7} {}".format(job.name, format_size(farm.get_estimate(job)), " ".join(job.cmd[2:])))
+        return
+
+    start     = time.time()
+    summaries = farm.run()
+    print(format_summary(summaries))
+    print("Total: {:.1f}s.".format(time.time() - start))
+    summary = args.summary or os.path.join(args.work_dir, "summary.json")
+    with open(summary, "w") as f:
+        json.dump({"jobs": summaries}, f, indent=1)
+    sys.exit(0 if all(s["returncode"] == 0 for s in summaries) else 1)
+
+if __name__ == "__main__":
+    main()
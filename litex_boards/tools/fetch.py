@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Download cache tool.
+#
+# Prefetch (in parallel) the external assets (IPs, presets, sources) of targets, of the targets of a
+# build farm jobs file or of all targets to the download cache, so that builds can then run offline
+# (LITEX_BOARDS_OFFLINE=1):
+#
+# $ python3 -m litex_boards.tools.fetch prefetch xilinx_alveo_u280 digilent_zedboard
+# $ python3 -m litex_boards.tools.fetch prefetch --jobs-file=jobs.json
+# $ python3 -m litex_boards.tools.fetch prefetch --all --jobs=8
+# $ python3 -m litex_boards.tools.fetch list
+
+import os
+import sys
+import argparse
+from multiprocessing.pool import ThreadPool
+
+from litex_boards.integration.downloads import DownloadCache, assets, target_assets
+
+# Run ----------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="LiteX-Boards download cache tool.")
+    subparsers = parser.add_subparsers(dest="command")
+
+    prefetch_parser = subparsers.add_parser("prefetch", help="Download the assets of targets to the cache.")
+    prefetch_parser.add_argument("targets", nargs="*",                       help="Targets.")
+    prefetch_parser.add_argument("--jobs-file", default=None,                help="Build farm JSON jobs file (targets of the jobs).")
+    prefetch_parser.add_argument("--all",       action="store_true",         help="All assets.")
+    prefetch_parser.add_argument("--jobs",      default=4, type=int,         help="Number of parallel downloads.")
+
+    subparsers.add_parser("list", help="List assets, their pins and cache status.")
+
+    args = parser.parse_args()
+    cache = DownloadCache()
+
+    if args.command == "prefetch":
+        targets = list(args.targets)
+        if args.jobs_file is not None:
+            from litex_boards.tools.farm import load_jobs
+            targets += [job.target for job in load_jobs(args.jobs_file)]
+        names = list(assets) if args.all else []
+        for target in targets:
+            names += [name for name in target_assets.get(target, []) if name not in names]
+        def prefetch(name):
+            try:
+                return name, cache.prefetch(name), None
+            except Exception as e:
+                return name, None, e
+        errors = 0
+        with ThreadPool(max(1, min(args.jobs, len(names)))) as pool:
+            for name, path, error in pool.imap_unordered(prefetch, names):
+                if error is None:
+                    print("{:<24} {}".format(name, path))
+                else:
+                    print("{:<24} ERROR: {}".format(name, error))
+                    errors += 1
+        sys.exit(1 if errors else 0)
+    elif args.command == "list":
+        for name, asset in assets.items():
+            pin = getattr(asset, "sha256", None) or getattr(asset, "rev", None) or cache.get_pin(name)
+            print("{:<24} {:<8} {:<16} {}".format(name,
+                "cached" if os.path.exists(cache.get_path(name)) else "-",
+                "-" if pin is None else pin[:16],
+                asset.url))
+    else:
+        parser.print_help()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Maximum sys_clk_freq search.
+#
+# Searches the highest sys_clk_freq of a target (and options) that meets timing. Candidates are
+# taken on a grid (--min/--max/--step, default: from the target's default sys_clk_freq to twice it)
+# and the search is a parallel binary search: each round evaluates --jobs candidates evenly spaced
+# in the remaining interval and narrows it (timings are assumed to be met below a passing frequency
+# and not met above a failing one). For each candidate:
+# - PLL feasibility is first verified by elaborating the target (the _CRG's PLL raises when it can't
+#   generate the frequency): infeasible candidates are discarded without narrowing the interval.
+# - The target is then built (to build/fmax/<target>/<frequency>, with logs next to it) and timings
+#   are checked from Vivado's timing report (WNS/WHS >= 0) or nextpnr's Fmax (with --pnr-seeds > 1,
+#   nextpnr candidates are built with a multi-seed place and route). Builds without timing report
+#   (toolchains without parser here) are unknown: they neither narrow the interval nor are returned,
+#   and the search stops on a round with only unknown builds.
+# Builds go through the bitstream cache: candidates already evaluated are not rebuilt.
+#
+# $ python3 -m litex_boards.tools.fmax digilent_arty --jobs=4
+# $ python3 -m litex_boards.tools.fmax radiona_ulx3s --min=50e6 --max=100e6 --step=2e6 --pnr-seeds=4
+# $ python3 -m litex_boards.tools.fmax digilent_arty --check-pll -- --with-ethernet
+
+import os
+import ast
+import sys
+import glob
+import json
+import argparse
+import subprocess
+from multiprocessing.pool import ThreadPool
+
+from litex_boards import targets
+from litex_boards.integration.pnr_seeds import parse_nextpnr_fmax, get_critical_clock
+from litex_boards.integration.vivado_strategies import parse_vivado_timing
+
+# Target -------------------------------------------------------------------------------------------
+
+def get_default_sys_clk_freq(target):
+    """Return the default --sys-clk-freq of a target (from its sources), None if not found."""
+    with open(os.path.join(os.path.dirname(targets.__file__), target + ".py")) as f:
+        tree = ast.parse(f.read())
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call) and getattr(node.func, "attr", None) == "add_argument":
+            if node.args and isinstance(node.args[0], ast.Constant) and node.args[0].value == "--sys-clk-freq":
+                for keyword in node.keywords:
+                    if keyword.arg == "default":
+                        value = keyword.value
+                        if isinstance(value, ast.Call) and value.args:
+                            value = value.args[0] # int(100e6).
+                        try:
+                            return float(ast.literal_eval(value))
+                        except ValueError:
+                            return None
+    return None
+
+def get_grid(minimum, maximum, step):
+    n = int(round((maximum - minimum)/step))
+    return [minimum + i*step for i in range(n + 1)]
+
+# Candidates ---------------------------------------------------------------------------------------
+
+class FmaxSearch:
+    def __init__(self, target, args=[], work_dir="build/fmax", jobs=1, pnr_seeds=1, log=sys.stderr):
+        self.target    = target
+        self.args      = args
+        self.work_dir  = os.path.join(work_dir, target)
+        self.jobs      = jobs
+        self.pnr_seeds = pnr_seeds
+        self.log       = log
+        self.results   = {}
+
+    def get_output_dir(self, frequency):
+        return os.path.abspath(os.path.join(self.work_dir, "{:.0f}".format(frequency)))
+
+    def get_log(self, frequency, build):
+        # Next to the output directory (not part of the build's outputs).
+        return self.get_output_dir(frequency) + (".build.log" if build else ".check.log")
+
+    def get_gateware_dir(self, frequency):
+        return os.path.join(self.get_output_dir(frequency), "gateware")
+
+    def uses_nextpnr(self, frequency):
+        # Build script generated by the elaboration.
+        for script in glob.glob(os.path.join(self.get_gateware_dir(frequency), "build_*")):
+            with open(script, errors="replace") as f:
+                if "nextpnr" in f.read():
+                    return True
+        return False
+
+    def run_target(self, frequency, build):
+        output_dir = self.get_output_dir(frequency)
+        os.makedirs(output_dir, exist_ok=True)
+        cmd = [sys.executable, "-m", "litex_boards.targets." + self.target,
+            "--sys-clk-freq={:.0f}".format(frequency),
+            "--output-dir={}".format(output_dir),
+        ] + self.args
+        cmd += ["--build"] + ([] if build else ["--no-compile"]) # Elaboration/Finalization only.
+        if build and self.pnr_seeds > 1 and self.uses_nextpnr(frequency):
+            cmd += ["--pnr-seeds={}".format(self.pnr_seeds)]
+        with open(self.get_log(frequency, build), "w") as f:
+            return subprocess.call(cmd, stdout=f, stderr=subprocess.STDOUT, cwd=output_dir)
+
+    def check_pll(self, frequency):
+        """Return None if the target elaborates at this frequency (PLL can generate it), else the error."""
+        if self.run_target(frequency, build=False) == 0:
+            return None
+        with open(self.get_log(frequency, build=False), errors="replace") as f:
+            lines = f.read().strip().splitlines()
+        return lines[-1] if lines else "elaboration failed"
+
+    def get_timing(self, frequency):
+        """Return (timing met, details) of a build, timing met is None when not reported."""
+        gateware_dir = self.get_gateware_dir(frequency)
+        # Vivado.
+        for report in glob.glob(os.path.join(gateware_dir, "*_timing.rpt")):
+            with open(report, errors="replace") as f:
+                timing = parse_vivado_timing(f.read())
+            if timing is not None:
+                wns, tns, whs = timing
+                return (wns >= 0 and whs >= 0), "WNS {:.3f}ns, WHS {:.3f}ns".format(wns, whs)
+        # Yosys/nextpnr: Selected seed (--pnr-seeds) or nextpnr's report in build log.
+        fmax  = {}
+        seeds = os.path.join(gateware_dir, "seeds", "seeds.json")
+        if os.path.exists(seeds):
+            with open(seeds) as f:
+                seeds = json.load(f)
+            fmax = {r["seed"]: r["fmax"] for r in seeds["results"]}.get(seeds["selected"], {})
+        else:
+            with open(self.get_log(frequency, build=True), errors="replace") as f:
+                fmax = parse_nextpnr_fmax(f.read())
+        clock = get_critical_clock([{"fmax": fmax}])
+        if clock is not None:
+            achieved, constrained = fmax[clock]
+            return (achieved >= constrained), "{:.2f} MHz on {}".format(achieved, clock)
+        return None, "timing not reported"
+
+    def evaluate(self, frequency, build=True):
+        error = self.check_pll(frequency)
+        if error is not None:
+            result = {"status": "infeasible", "details": error}
+        elif not build:
+            result = {"status": "pass", "details": "PLL ok"}
+        elif self.run_target(frequency, build=True) != 0:
+            result = {"status": "fail", "details": "build failed"}
+        else:
+            met, details = self.get_timing(frequency)
+            result = {"status": {True: "pass", False: "fail", None: "unknown"}[met], "details": details}
+        self.results[frequency] = result
+        self.log.write("{:>10.3f} MHz: {:<10} ({})\n".format(frequency/1e6, result["status"].upper(), result["details"]))
+        self.log.flush()
+        return result
+
+    def search(self, grid, build=True):
+        """Return the highest frequency of the grid that meets timing, None if none."""
+        passed, failed = None, None
+        while True:
+            remaining = [f for f in grid
+                if (passed is None or f > passed) and
+                   (failed is None or f < failed) and
+                   f not in self.results]
+            if not remaining:
+                return passed
+            # Candidates evenly spaced in the remaining interval (upper bound first on first round).
+            n = min(self.jobs, len(remaining))
+            if passed is None and failed is None:
+                candidates = [remaining[round(i*(len(remaining) - 1)/max(n - 1, 1))] for i in range(n)]
+            else:
+                candidates = [remaining[(i + 1)*len(remaining)//(n + 1)] for i in range(n)]
+            candidates = sorted(set(candidates))
+            with ThreadPool(len(candidates)) as pool:
+                results = pool.map(lambda f: self.evaluate(f, build), candidates)
+            if all(result["status"] == "unknown" for result in results):
+                return passed # Timing not reported (toolchain without parser): stop building.
+            for frequency, result in zip(candidates, results):
+                if result["status"] == "pass":
+                    passed = frequency if passed is None else max(passed, frequency)
+                elif result["status"] == "fail":
+                    failed = frequency if failed is None else min(failed, frequency)
+            if (failed is not None) and (passed is not None) and (failed < passed):
+                failed = None # Non monotonic results: keep searching above the highest pass.
+
+# Run ----------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Search the maximum sys_clk_freq of a LiteX-Boards target.",
+        epilog="Extra arguments (after --) are passed to the target.")
+    parser.add_argument("target",                                    help="Target name (ex: digilent_arty).")
+    parser.add_argument("--min",       default=None, type=float,     help="Minimum frequency (default: target's default).")
+    parser.add_argument("--max",       default=None, type=float,     help="Maximum frequency (default: twice target's default).")
+    parser.add_argument("--step",      default=1e6,  type=float,     help="Frequency resolution.")
+    parser.add_argument("--jobs",      default=2,    type=int,       help="Number of candidates evaluated in parallel per round.")
+    parser.add_argument("--pnr-seeds", default=1,    type=int,       help="nextpnr seeds per candidate (Yosys/nextpnr toolchains).")
+    parser.add_argument("--work-dir",  default="build/fmax",         help="Work directory.")
+    parser.add_argument("--check-pll", action="store_true",          help="Only check PLL feasibility (no build).")
+    parser.add_argument("--json",      default=None,                 help="Write results to a JSON file.")
+    args, target_args = parser.parse_known_args()
+    target_args = [arg for arg in target_args if arg != "--"]
+
+    if args.target not in targets.available():
+        parser.error("Unknown target {}.".format(args.target))
+    default = get_default_sys_clk_freq(args.target)
+    minimum = args.min or default
+    maximum = args.max or (2*default if default else None)
+    if minimum is None or maximum is None:
+        parser.error("Unable to find target's default sys_clk_freq, use --min/--max.")
+
+    search = FmaxSearch(args.target, target_args,
+        work_dir  = args.work_dir,
+        jobs      = args.jobs,
+        pnr_seeds = args.pnr_seeds)
+    fmax = search.search(get_grid(minimum, maximum, args.step), build=not args.check_pll)
+    if fmax is None:
+        print("No frequency between {:.3f} MHz and {:.3f} MHz {}.".format(minimum/1e6, maximum/1e6,
+            "can be generated" if args.check_pll else "meets timing"))
+    else:
+        print("Max sys_clk_freq{}: {:.3f} MHz.".format(" (PLL)" if args.check_pll else "", fmax/1e6))
+    unknown = sorted(f for f, r in search.results.items() if r["status"] == "unknown")
+    if unknown:
+        print("Timing not reported for {}: not considered as meeting timing.".format(
+            ", ".join("{:.3f} MHz".format(f/1e6) for f in unknown)))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({
+                "target"  : args.target,
+                "args"    : target_args,
+                "fmax"    : fmax,
+                "results" : {"{:.0f}".format(f): r for f, r in sorted(search.results.items())},
+            }, f, indent=1)
+    sys.exit(0 if fmax is not None else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Static Platforms Index.
+#
+# Answering questions like "which boards have DDR3 + RGMII + PCIe x4" requires importing all the
+# platforms (and their vendor backends). The index stores, for each platform, the information that
+# can be extracted from its default instance:
+# - vendor     : LiteX vendor Platform class (XilinxPlatform, LatticePlatform, etc...).
+# - toolchain  : Default toolchain class.
+# - device     : Device string.
+# - clock      : Default clock name and period (ns).
+# - ios        : IO resources with their number of instances and subsignals.
+# - connectors : Connectors with their number of pins.
+# - programmer : Programmer class returned by create_programmer.
+# And is loaded (as JSON) in a few milliseconds. Each entry records the SHA256 of its platform file
+# so that the index is only regenerated incrementally, for the platforms that changed.
+#
+# $ python3 -m litex_boards.tools.index update
+# $ python3 -m litex_boards.tools.index query --io=ddram --io=eth:rx_ctl --io=pcie_x4
+# $ python3 -m litex_boards.tools.index query --vendor=LatticePlatform --connector=pmoda
+# $ python3 -m litex_boards.tools.index show digilent_arty
+
+import os
+import sys
+import json
+import hashlib
+import argparse
+
+from litex_boards import platforms
+
+# Index --------------------------------------------------------------------------------------------
+
+index_version  = 1
+platforms_dir  = os.path.dirname(platforms.__file__)
+index_filename = os.path.join(platforms_dir, "index.json")
+
+def get_platform_names():
+    return platforms.available()
+
+def get_platform_sha256(name):
+    with open(os.path.join(platforms_dir, name + ".py"), "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def get_litex_version():
+    try:
+        from importlib.metadata import version
+        return version("litex")
+    except Exception:
+        return None
+
+# Extraction ---------------------------------------------------------------------------------------
+
+def _get_vendor(platform_cls):
+    # First LiteX class in the MRO: the vendor Platform class.
+    for cls in platform_cls.__mro__:
+        if cls.__module__.startswith("litex.build."):
+            return cls.__name__
+    return None
+
+def _get_ios(io):
+    from litex.build.generic_platform import Subsignal
+    ios = {}
+    for name, number, *items in io:
+        entry = ios.setdefault(name, {"count": 0, "subsignals": []})
+        entry["count"] += 1
+        for item in items:
+            if isinstance(item, Subsignal) and item.name not in entry["subsignals"]:
+                entry["subsignals"].append(item.name)
+    for entry in ios.values():
+        entry["subsignals"].sort()
+    return ios
+
+def _get_connectors(connectors):
+    from litex.build.generic_platform import ConnectorManager
+    return {name: len(pins) for name, pins in ConnectorManager(connectors).connector_table.items()}
+
+def get_platform_entry(name):
+    """Extract index entry of a platform (from its default instance, when it can be created)."""
+    module = platforms.get(name)
+    entry  = {
+        "sha256"     : get_platform_sha256(name),
+        "vendor"     : None,
+        "toolchain"  : None,
+        "device"     : None,
+        "clock"      : None,
+        "ios"        : _get_ios(getattr(module, "_io", [])),
+        "connectors" : _get_connectors(getattr(module, "_connectors", [])),
+        "programmer" : None,
+        "error"      : None,
+    }
+    if not hasattr(module, "Platform"):
+        entry["error"] = "No Platform class."
+        return entry
+    entry["vendor"] = _get_vendor(module.Platform)
+    try:
+        platform = module.Platform()
+    except Exception as e:
+        # Keep module-level IOs/Connectors (ex: platforms requiring their toolchain to be installed).
+        entry["error"] = "{}: {}".format(type(e).__name__, str(e).splitlines()[0] if str(e) else "")
+        return entry
+    entry["toolchain"]  = type(getattr(platform, "toolchain", None)).__name__
+    entry["device"]     = platform.device
+    if hasattr(platform, "default_clk_name"):
+        entry["clock"] = {
+            "name"   : platform.default_clk_name,
+            "period" : getattr(platform, "default_clk_period", None),
+        }
+    entry["ios"]        = _get_ios(platform.constraint_manager.available)
+    entry["connectors"] = {name: len(pins) for name, pins in platform.constraint_manager.connector_manager.connector_table.items()}
+    try:
+        entry["programmer"] = type(platform.create_programmer()).__name__
+    except Exception:
+        pass
+    return entry
+
+# Load/Update --------------------------------------------------------------------------------------
+
+def _empty_index():
+    return {"version": index_version, "litex": get_litex_version(), "platforms": {}}
+
+def load_index(filename=index_filename):
+    if not os.path.exists(filename):
+        return _empty_index()
+    with open(filename) as f:
+        index = json.load(f)
+    if index.get("version", None) != index_version:
+        return _empty_index()
+    return index
+
+def save_index(index, filename=index_filename):
+    tmp = filename + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(index, f, indent=1, sort_keys=True)
+        f.write("\n")
+    os.replace(tmp, filename)
+
+def get_stale_platforms(index):
+    """Return platforms that are missing from the index or whose file changed since indexed."""
+    stale = []
+    for name in get_platform_names():
+        entry = index["platforms"].get(name, None)
+        if (entry is None) or (entry["sha256"] != get_platform_sha256(name)):
+            stale.append(name)
+    return stale
+
+def update_index(filename=index_filename, force=False, log=None):
+    """Regenerate the entries of the stale platforms (all of them with force) and save the index."""
+    index = load_index(filename)
+    if force or index["litex"] != get_litex_version():
+        index = _empty_index()
+    names = get_platform_names()
+    for name in list(index["platforms"].keys()):
+        if name not in names:
+            del index["platforms"][name]
+    stale = get_stale_platforms(index)
+    for name in stale:
+        if log is not None:
+            log.write("Indexing {}...\n".format(name))
+        index["platforms"][name] = get_platform_entry(name)
+    if stale or not os.path.exists(filename):
+        save_index(index, filename)
+    return index
+
+# Query --------------------------------------------------------------------------------------------
+
+def _match_io(entry, io):
+    # io: "name" or "name:subsignal".
+    name, _, subsignal = io.partition(":")
+    if name not in entry["ios"]:
+        return False
+    return (not subsignal) or (subsignal in entry["ios"][name]["subsignals"])
+
+def query(index, vendor=None, device=None, toolchain=None, programmer=None, ios=[], connectors=[]):
+    """Return the names of the platforms matching all the criteria (device is a substring match)."""
+    names = []
+    for name, entry in sorted(index["platforms"].items()):
+        if (vendor is not None) and (entry["vendor"] != vendor):
+            continue
+        if (device is not None) and (device.lower() not in (entry["device"] or "").lower()):
+            continue
+        if (toolchain is not None) and (entry["toolchain"] != toolchain):
+            continue
+        if (programmer is not None) and (entry["programmer"] != programmer):
+            continue
+        if not all(_match_io(entry, io) for io in ios):
+            continue
+        if not all(connector in entry["connectors"] for connector in connectors):
+            continue
+        names.append(name)
+    return names
+
+# Run ----------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="LiteX-Boards static Platforms Index.")
+    parser.add_argument("--index", default=index_filename, help="Index file.")
+    subparsers = parser.add_subparsers(dest="command")
+
+    update_parser = subparsers.add_parser("update", help="Regenerate stale entries of the index.")
+    update_parser.add_argument("--force", action="store_true", help="Regenerate all entries.")
+    update_parser.add_argument("--check", action="store_true", help="Only check that the index is up to date.")
+
+    query_parser = subparsers.add_parser("query", help="Query platforms.")
+    query_parser.add_argument("--vendor",     default=None,                      help="Vendor Platform class (ex: XilinxPlatform).")
+    query_parser.add_argument("--device",     default=None,                      help="Device (substring).")
+    query_parser.add_argument("--toolchain",  default=None,                      help="Toolchain class (ex: XilinxVivadoToolchain).")
+    query_parser.add_argument("--programmer", default=None,                      help="Programmer class (ex: OpenOCD).")
+    query_parser.add_argument("--io",         default=[], action="append",       help="IO resource (name or name:subsignal), can be repeated.")
+    query_parser.add_argument("--connector",  default=[], action="append",       help="Connector, can be repeated.")
+    query_parser.add_argument("--json",       action="store_true",               help="Output matching entries as JSON.")
+
+    show_parser = subparsers.add_parser("show", help="Show index entry of a platform.")
+    show_parser.add_argument("platform", help="Platform name.")
+
+    args = parser.parse_args()
+
+    if args.command == "update":
+        if args.check:
+            stale = get_stale_platforms(load_index(args.index))
+            for name in stale:
+                print("{} is not up to date.".format(name))
+            sys.exit(1 if stale else 0)
+        index = update_index(args.index, force=args.force, log=sys.stderr)
+        print("{} platforms indexed.".format(len(index["platforms"])))
+    elif args.command == "query":
+        index = load_index(args.index)
+        names = query(index,
+            vendor     = args.vendor,
+            device     = args.device,
+            toolchain  = args.toolchain,
+            programmer = args.programmer,
+            ios        = args.io,
+            connectors = args.connector)
+        if args.json:
+            print(json.dumps({name: index["platforms"][name] for name in names}, indent=1, sort_keys=True))
+        else:
+            for name in names:
+                print(name)
+    elif args.command == "show":
+        print(json.dumps(load_index(args.index)["platforms"][args.platform], indent=1, sort_keys=True))
+    else:
+        parser.print_help()
+
+if __name__ == "__main__":
+    main()
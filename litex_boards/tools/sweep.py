@@ -0,0 +1,751 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Elaborate LiteX-Boards platforms/targets in parallel.
+#
+# Each platform is elaborated with the simple target and each target with its default configuration
+# (with --no-compile), one subprocess per job, on a pool of workers (one per core by default). Results
+# are reported as soon as they complete:
+#
+# $ python3 -m litex_boards.tools.sweep --jobs=16 targets
+# $ python3 -m litex_boards.tools.sweep platforms digilent_arty xilinx_kc705
+#
+# Each job runs in its own work directory (<work-dir>/<kind>/<name>) and, with --build, generates its
+# outputs in its own unique output directory (--unique-output-dir), so jobs never share files and
+# outputs of previous sweeps are kept and reused.
+#
+# With --engine=fork, Migen/LiteX/LiteDRAM/LiteEth/LitePCIe/LiteSATA are imported once and each job
+# runs in a process forked from this pre-initialized interpreter, avoiding their import cost per job.
+#
+# Passing jobs are cached (<work-dir>/cache.json) on a hash of their inputs: target/platform modules,
+# LiteX-Boards integration modules, command line and versions of the LiteX packages; only jobs whose
+# inputs changed are elaborated again. Use --cold to force a full sweep or --no-cache to disable it.
+#
+# Jobs are scheduled longest first from their historical elaboration cost (<work-dir>/costs.json, or
+# --costs) and can be split across CI nodes with --shard=i/N (1 <= i <= N): shards are balanced on
+# costs and deterministic for a given costs file. Each node can write its results with --results and
+# results of all shards can then be merged:
+#
+# $ python3 -m litex_boards.tools.sweep targets --shard=2/4 --costs=costs.json --results=shard2.json
+# $ python3 -m litex_boards.tools.sweep merge shard1.json shard2.json shard3.json shard4.json --results=all.json
+#
+# With --golden=<file>, jobs generate their sources (without compiling them) and normalized hashes of
+# the generated csr.csv, soc.h/csr.h/mem.h and Verilog are compared to the golden file (or recorded
+# to it with --record-golden), catching CSR mapping/netlist changes without any vendor toolchain (jobs
+# not recorded in the golden file differ from it):
+#
+# $ python3 -m litex_boards.tools.sweep targets --golden=golden.json --record-golden
+# $ python3 -m litex_boards.tools.sweep targets --golden=golden.json
+
+import os
+import re
+import ast
+import sys
+import glob
+import json
+import time
+import hashlib
+import runpy
+import argparse
+import tempfile
+import importlib
+import traceback
+import subprocess
+import multiprocessing
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import litex_boards
+from litex_boards import platforms
+from litex_boards import targets
+
+# Exclusions ---------------------------------------------------------------------------------------
+
+excluded_platforms = [
+    "qmtech_daughterboard",              # Reason: Not a real platform.
+    "quicklogic_quickfeather",           # Reason: No default clock.
+    "efinix_titanium_ti60_f225_dev_kit", # Reason: Require Efinity toolchain.
+    "efinix_trion_t120_bga576_dev_kit",  # Reason: Require Efinity toolchain.
+    "efinix_trion_t20_bga256_dev_kit",   # Reason: Require Efinity toolchain.
+    "efinix_trion_t20_mipi_dev_kit",     # Reason: Require Efinity toolchain.
+    "efinix_xyloni_dev_kit",             # Reason: Require Efinity toolchain.
+    "sipeed_tang_primer",                # Reason: Require Anlogic toolchain.
+    "jungle_electronics_fireant",        # Reason: Require Efinity toolchain.
+    "efinix_t8f81_dev_kit",              # Reason: Require Efinity toolchain.
+    "adi_plutosdr",                      # Reason: No default clock.
+]
+
+excluded_targets = [
+    "simple",                            # Reason: Generic target.
+    "quicklogic_quickfeather",           # Reason: No default clock.
+    "efinix_titanium_ti60_f225_dev_kit", # Reason: Require Efinity toolchain.
+    "efinix_trion_t120_bga576_dev_kit",  # Reason: Require Efinity toolchain.
+    "efinix_trion_t20_bga256_dev_kit",   # Reason: Require Efinity toolchain.
+    "efinix_trion_t20_mipi_dev_kit",     # Reason: Require Efinity toolchain.
+    "efinix_xyloni_dev_kit",             # Reason: Require Efinity toolchain.
+    "sipeed_tang_primer",                # Reason: Require Anlogic toolchain.
+    "jungle_electronics_fireant",        # Reason: Require Efinity toolchain.
+    "efinix_t8f81_dev_kit",              # Reason: Require Efinity toolchain.
+]
+
+# Collection ---------------------------------------------------------------------------------------
+
+litex_boards_dir = os.path.dirname(os.path.abspath(litex_boards.__file__))
+
+def collect_platforms(excluded=excluded_platforms):
+    return [name for name in platforms.available() if name not in excluded]
+
+def collect_targets(excluded=excluded_targets):
+    return [name for name in targets.available() if name not in excluded]
+
+# Jobs ---------------------------------------------------------------------------------------------
+
+class SweepJob:
+    def __init__(self, kind, name, module, args=[]):
+        self.kind   = kind
+        self.name   = name
+        self.module = module
+        self.args   = list(args)
+
+    @property
+    def cmd(self):
+        return [sys.executable, "-m", self.module] + self.args
+
+    def __repr__(self):
+        return "{}({}/{})".format(self.__class__.__name__, self.kind, self.name)
+
+
+class SweepResult:
+    def __init__(self, job, returncode, duration, output="", cached=False, cpu_time=None, max_rss=None):
+        self.job        = job
+        self.returncode = returncode
+        self.duration   = duration # Wall time (s).
+        self.output     = output
+        self.cached     = cached
+        self.cpu_time   = cpu_time # User + System time (s), when available.
+        self.max_rss    = max_rss  # Peak Resident Set Size (bytes), when available.
+        self.golden     = []       # Differences with golden artifacts, when checked.
+
+    @property
+    def passed(self):
+        return (self.returncode == 0) and (not self.golden)
+
+
+def _build_args(build):
+    # Generate Gateware/Software sources (without compiling them) to a unique Output directory.
+    return ["--build", "--unique-output-dir"] if build else []
+
+def platform_job(name, args=[], build=False):
+    # Build simple design for the platform.
+    return SweepJob("platforms", name,
+        module = "litex_boards.targets.simple",
+        args   = ["litex_boards.platforms.{}".format(name),
+            "--no-compile",
+            "--uart-name=stub",
+        ] + _build_args(build) + list(args))
+
+def target_job(name, args=[], build=False):
+    # Build default configuration for the target.
+    return SweepJob("targets", name,
+        module = "litex_boards.targets.{}".format(name),
+        args   = [
+            "--cpu-type=vexriscv",
+            "--cpu-variant=minimal",
+            "--no-compile",
+        ] + _build_args(build) + list(args))
+
+# Runner -------------------------------------------------------------------------------------------
+
+def default_workers():
+    return int(os.environ.get("LITEX_BOARDS_JOBS", os.cpu_count() or 1))
+
+def default_build():
+    return os.environ.get("LITEX_BOARDS_BUILD", "0") not in ["", "0"]
+
+def default_engine():
+    return os.environ.get("LITEX_BOARDS_ENGINE", "subprocess")
+
+default_work_dir = os.path.join("build", "sweep")
+
+def get_job_dir(job, work_dir=default_work_dir):
+    return os.path.abspath(os.path.join(work_dir, job.kind, job.name))
+
+# Subprocess Engine: One Python interpreter per job.
+
+def _get_rusage_stats(rusage):
+    # ru_maxrss is in KiB on Linux, in bytes on macOS.
+    max_rss = rusage.ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+    return rusage.ru_utime + rusage.ru_stime, max_rss
+
+def run_job(job, work_dir=default_work_dir):
+    # Run job from its own work directory, with LiteX-Boards still importable from there.
+    cwd = get_job_dir(job, work_dir)
+    os.makedirs(cwd, exist_ok=True)
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([os.path.dirname(litex_boards_dir)] +
+        [path for path in env.get("PYTHONPATH", "").split(os.pathsep) if path])
+    cpu_time = None
+    max_rss  = None
+    start    = time.time()
+    with tempfile.TemporaryFile() as output:
+        p = subprocess.Popen(job.cmd,
+            cwd    = cwd,
+            env    = env,
+            stdout = output,
+            stderr = subprocess.STDOUT,
+        )
+        if hasattr(os, "wait4"):
+            # Wait with wait4 to also get CPU time/Peak RSS of the job.
+            _, status, rusage = os.wait4(p.pid, 0)
+            p.returncode      = -os.WTERMSIG(status) if os.WIFSIGNALED(status) else os.WEXITSTATUS(status)
+            cpu_time, max_rss = _get_rusage_stats(rusage)
+        else:
+            p.wait()
+        duration = time.time() - start
+        output.seek(0)
+        return SweepResult(job,
+            returncode = p.returncode,
+            duration   = duration,
+            output     = output.read().decode("utf-8", errors="replace"),
+            cpu_time   = cpu_time,
+            max_rss    = max_rss)
+
+def _run_jobs_subprocess(jobs, workers, work_dir):
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(run_job, job, work_dir) for job in jobs]
+        for future in as_completed(futures):
+            yield future.result()
+
+# Fork Engine: Heavy dependencies are imported once, then each job runs in a process forked from
+# this pre-initialized interpreter (so jobs still can't share any global state).
+
+preloaded_modules = [
+    "migen",
+    "litex.build.generic_platform",
+    "litex.build.xilinx",
+    "litex.build.lattice",
+    "litex.build.altera",
+    "litex.build.gowin",
+    "litex.soc.cores.clock",
+    "litex.soc.cores.led",
+    "litex.soc.integration.soc",
+    "litex.soc.integration.soc_core",
+    "litex.soc.integration.builder",
+    "litex_boards.integration.builder",
+    "litedram.modules",
+    "litedram.phy",
+    "litedram.core",
+    "liteeth.phy",
+    "liteeth.core",
+    "litepcie.phy.s7pciephy",
+    "litepcie.phy.uspciephy",
+    "litepcie.core",
+    "litesata.phy",
+    "litesata.core",
+    "litescope",
+]
+
+def preload_modules(modules=preloaded_modules):
+    for module in modules:
+        try:
+            importlib.import_module(module)
+        except Exception:
+            pass # Optional dependency, the job will report the error if it needs it.
+
+def run_job_in_process(job, work_dir=default_work_dir):
+    # Run the job's module as __main__ in the current process, capturing its output; the caller
+    # is expected to be a dedicated (forked) process.
+    import resource # Unix only (as fork).
+    cwd = get_job_dir(job, work_dir)
+    os.makedirs(cwd, exist_ok=True)
+    os.chdir(cwd)
+    start = time.time()
+    with tempfile.TemporaryFile() as output:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.dup2(output.fileno(), 1)
+        os.dup2(output.fileno(), 2)
+        sys.argv = [job.module] + job.args
+        try:
+            runpy.run_module(job.module, run_name="__main__", alter_sys=True)
+            returncode = 0
+        except SystemExit as e:
+            returncode = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        except BaseException:
+            traceback.print_exc()
+            returncode = 1
+        sys.stdout.flush()
+        sys.stderr.flush()
+        duration = time.time() - start
+        # Note: Peak RSS includes the memory inherited from the pre-initialized interpreter.
+        cpu_time, max_rss = _get_rusage_stats(resource.getrusage(resource.RUSAGE_SELF))
+        output.seek(0)
+        return SweepResult(job,
+            returncode = returncode,
+            duration   = duration,
+            output     = output.read().decode("utf-8", errors="replace"),
+            cpu_time   = cpu_time,
+            max_rss    = max_rss)
+
+def _run_job_in_process(args):
+    return run_job_in_process(*args)
+
+def _run_jobs_fork(jobs, workers, work_dir):
+    preload_modules()
+    context = multiprocessing.get_context("fork")
+    with context.Pool(processes=workers, maxtasksperchild=1) as pool:
+        for result in pool.imap_unordered(_run_job_in_process, [(job, work_dir) for job in jobs]):
+            yield result
+
+engines = {
+    "subprocess" : _run_jobs_subprocess,
+    "fork"       : _run_jobs_fork,
+}
+
+def _replay_and_run_jobs(jobs, workers, work_dir, engine, cache, costs, golden):
+    # Longest jobs first.
+    if costs is not None:
+        jobs = costs.schedule(jobs)
+    # Replay cached results, run the others.
+    pending = []
+    for job in jobs:
+        result = None if cache is None else cache.lookup(job)
+        if result is None:
+            pending.append(job)
+        else:
+            yield result
+    if pending:
+        for result in engines[engine](pending, workers, work_dir):
+            if golden is not None:
+                golden.process(result, work_dir)
+            if cache is not None:
+                cache.store(result)
+            if costs is not None:
+                costs.update(result)
+            yield result
+        if costs is not None:
+            costs.save()
+
+def run_jobs(jobs, workers=None, work_dir=default_work_dir, engine=None, cache=None, costs=None, golden=None, log=sys.stderr):
+    """Run jobs on a pool of workers and yield their results as they complete."""
+    if golden is not None:
+        jobs  = [golden.get_job(job) for job in jobs]
+        cache = None # Golden artifacts have to be generated.
+    jobs    = list(jobs)
+    workers = workers or default_workers()
+    engine  = engine  or default_engine()
+    if engine == "fork" and "fork" not in multiprocessing.get_all_start_methods():
+        engine = "subprocess"
+    for n, result in enumerate(_replay_and_run_jobs(jobs, workers, work_dir, engine, cache, costs, golden)):
+        if log is not None:
+            log.write("[{:>{w}}/{}] {} {}/{} ({:.1f}s{})\n".format(
+                n + 1, len(jobs),
+                "PASS" if result.passed else ("FAIL" if result.returncode else "DIFF"),
+                result.job.kind, result.job.name,
+                result.duration,
+                ", cached" if result.cached else "",
+                w = len(str(len(jobs)))))
+            log.flush()
+        yield result
+
+# Cache --------------------------------------------------------------------------------------------
+
+cached_packages = [
+    "migen",
+    "litex",
+    "litedram",
+    "liteeth",
+    "litepcie",
+    "litesata",
+    "litescope",
+]
+
+def get_package_version(package):
+    try:
+        from importlib.metadata import version
+        return version(package)
+    except Exception:
+        return None
+
+def _get_module_file(module):
+    name = module.split(".")
+    if name[0] != "litex_boards":
+        return None
+    filename = os.path.join(litex_boards_dir, *name[1:]) + ".py"
+    return filename if os.path.exists(filename) else None
+
+def _get_module_imports(filename):
+    # LiteX-Boards modules imported by a module (anywhere in the module, deferred imports included).
+    with open(filename) as f:
+        tree = ast.parse(f.read(), filename)
+    modules = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules += [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module is not None:
+            modules.append(node.module)
+            modules += [node.module + "." + alias.name for alias in node.names] # Submodules.
+    return [module for module in modules if module.split(".")[0] == "litex_boards"]
+
+def get_job_sources(job):
+    """Return the LiteX-Boards source files the job depends on."""
+    # Job's module (target) and Platform(s) passed as argument (simple target).
+    modules = [job.module] + [arg for arg in job.args if arg.startswith("litex_boards.platforms.")]
+    # Modules they import (recursively): Platforms, Platforms' daughterboards, etc...
+    sources = []
+    while modules:
+        source = _get_module_file(modules.pop(0))
+        if source is None or source in sources:
+            continue
+        sources.append(source)
+        modules += _get_module_imports(source)
+    # LiteX-Boards integration modules.
+    integration_dir = os.path.join(litex_boards_dir, "integration")
+    for file in sorted(os.listdir(integration_dir)):
+        source = os.path.join(integration_dir, file)
+        if file.endswith(".py") and source not in sources:
+            sources.append(source)
+    return sources
+
+def get_job_key(job):
+    """Return a hash of all the inputs of the job."""
+    h = hashlib.sha256()
+    for source in get_job_sources(job):
+        h.update(os.path.relpath(source, litex_boards_dir).encode("utf-8") + b"\0")
+        with open(source, "rb") as f:
+            h.update(hashlib.sha256(f.read()).digest())
+    h.update("\0".join([job.module] + job.args).encode("utf-8") + b"\0")
+    for package in cached_packages:
+        h.update("{}={}\0".format(package, get_package_version(package)).encode("utf-8"))
+    return h.hexdigest()
+
+
+class SweepCache:
+    def __init__(self, filename, cold=False):
+        self.filename = filename
+        self.cold     = cold
+        self.entries  = {}
+        if os.path.exists(filename):
+            try:
+                with open(filename) as f:
+                    self.entries = json.load(f)
+            except ValueError:
+                pass # Corrupted cache, start from an empty one.
+
+    def lookup(self, job):
+        if self.cold:
+            return None
+        entry = self.entries.get(get_job_key(job), None)
+        if entry is None:
+            return None
+        return SweepResult(job, returncode=entry["returncode"], duration=entry["duration"], cached=True)
+
+    def store(self, result):
+        # Only cache passing jobs: failures are always elaborated again.
+        if result.cached or not result.passed:
+            return
+        self.entries[get_job_key(result.job)] = {
+            "name"       : "{}/{}".format(result.job.kind, result.job.name),
+            "returncode" : result.returncode,
+            "duration"   : result.duration,
+        }
+        self.save()
+
+    def save(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.filename)), exist_ok=True)
+        tmp = self.filename + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.entries, f, indent=1, sort_keys=True)
+        os.replace(tmp, self.filename)
+
+
+def get_cache_filename(work_dir=default_work_dir):
+    return os.path.join(work_dir, "cache.json")
+
+def default_cache(work_dir=default_work_dir):
+    mode = os.environ.get("LITEX_BOARDS_CACHE", "1")
+    if mode in ["", "0"]:
+        return None
+    return SweepCache(get_cache_filename(work_dir), cold=(mode == "cold"))
+
+# Scheduling / Sharding ----------------------------------------------------------------------------
+
+def get_job_id(job):
+    return "{}/{}".format(job.kind, job.name)
+
+class SweepCosts:
+    """Historical elaboration cost (s) of the jobs."""
+    def __init__(self, filename):
+        self.filename = filename
+        self.costs    = {}
+        if os.path.exists(filename):
+            with open(filename) as f:
+                self.costs = json.load(f)
+
+    def get(self, job):
+        # Unknown jobs are estimated with the median cost of known ones.
+        default = sorted(self.costs.values())[len(self.costs)//2] if self.costs else 1.0
+        return self.costs.get(get_job_id(job), default)
+
+    def update(self, result):
+        # Smooth measurements to limit noise (cached results are not measurements).
+        if result.cached:
+            return
+        job_id = get_job_id(result.job)
+        if job_id in self.costs:
+            self.costs[job_id] = (self.costs[job_id] + result.duration)/2
+        else:
+            self.costs[job_id] = result.duration
+
+    def save(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.filename)), exist_ok=True)
+        tmp = self.filename + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.costs, f, indent=1, sort_keys=True)
+        os.replace(tmp, self.filename)
+
+    def schedule(self, jobs):
+        # Longest jobs first, ties broken on job ID for determinism.
+        return sorted(jobs, key=lambda job: (-self.get(job), get_job_id(job)))
+
+    def shard(self, jobs, index, count):
+        # Greedy Longest-Processing-Time assignment of the jobs to count shards, return the jobs
+        # of shard index (1 <= index <= count).
+        assert 1 <= index <= count
+        loads  = [0.0]*count
+        shards = [[] for _ in range(count)]
+        for job in self.schedule(jobs):
+            n = loads.index(min(loads))
+            loads[n] += self.get(job)
+            shards[n].append(job)
+        return shards[index - 1]
+
+
+def get_costs_filename(work_dir=default_work_dir):
+    return os.path.join(work_dir, "costs.json")
+
+def parse_shard(shard):
+    index, count = [int(n) for n in shard.split("/")]
+    if not (1 <= index <= count):
+        raise ValueError("Invalid shard {}, expected i/N with 1 <= i <= N.".format(shard))
+    return index, count
+
+def default_costs(work_dir=default_work_dir):
+    return SweepCosts(os.environ.get("LITEX_BOARDS_COSTS", get_costs_filename(work_dir)))
+
+def default_shard(jobs, costs):
+    shard = os.environ.get("LITEX_BOARDS_SHARD", None)
+    if shard is None:
+        return jobs
+    return costs.shard(jobs, *parse_shard(shard))
+
+# Results ------------------------------------------------------------------------------------------
+
+def load_results(filename):
+    if not os.path.exists(filename):
+        return {"version": 1, "results": {}}
+    with open(filename) as f:
+        return json.load(f)
+
+def write_results(filename, results):
+    """Write (merge) results to a JSON results file."""
+    content = load_results(filename)
+    for result in results:
+        content["results"][get_job_id(result.job)] = {
+            "returncode" : result.returncode,
+            "duration"   : result.duration,
+            "cached"     : result.cached,
+            "golden"     : result.golden,
+        }
+    tmp = filename + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(content, f, indent=1, sort_keys=True)
+    os.replace(tmp, filename)
+
+def merge_results(filenames):
+    merged = {"version": 1, "results": {}}
+    for filename in filenames:
+        merged["results"].update(load_results(filename)["results"])
+    return merged
+
+def default_results():
+    return os.environ.get("LITEX_BOARDS_RESULTS", None)
+
+# Golden Artifacts ---------------------------------------------------------------------------------
+
+golden_dir   = "golden"
+golden_files = [
+    "csr.csv",
+    "software/include/generated/soc.h",
+    "software/include/generated/csr.h",
+    "software/include/generated/mem.h",
+    "gateware/*.v",
+]
+
+# Build date/Migen's and LiteX's SHA1/Paths are not part of the design.
+_golden_normalizations = [
+    (re.compile(rb"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}"),                           b"<date>"),
+    (re.compile(rb"Auto-generated by (Migen \([^)]*\) & )?LiteX \([^)]*\)", re.I), b"Auto-generated by LiteX"),
+    (re.compile(rb"LiteX sha1 *: *\S+"),                                            b"LiteX sha1 : <sha1>"),
+]
+
+def normalize_golden(content, output_dir):
+    content = content.replace(os.path.abspath(output_dir).encode("utf-8"), b"<output-dir>")
+    for regexp, replacement in _golden_normalizations:
+        content = regexp.sub(replacement, content)
+    return content
+
+def get_golden_hashes(output_dir):
+    hashes = {}
+    for pattern in golden_files:
+        for filename in sorted(glob.glob(os.path.join(output_dir, pattern))):
+            with open(filename, "rb") as f:
+                content = normalize_golden(f.read(), output_dir)
+            hashes[os.path.relpath(filename, output_dir)] = hashlib.sha256(content).hexdigest()
+    return hashes
+
+
+class SweepGolden:
+    def __init__(self, filename, record=False):
+        self.filename = filename
+        self.record   = record
+        self.content  = {"version": 1, "packages": {}, "golden": {}}
+        if os.path.exists(filename):
+            with open(filename) as f:
+                self.content = json.load(f)
+
+    def get_job(self, job):
+        # Generate sources (without compiling them) to the golden directory of the job.
+        args = [arg for arg in job.args if arg not in _build_args(True)]
+        return SweepJob(job.kind, job.name, job.module, args + [
+            "--build",
+            "--output-dir={}".format(golden_dir),
+            "--csr-csv={}".format(os.path.join(golden_dir, "csr.csv")),
+        ])
+
+    def process(self, result, work_dir=default_work_dir):
+        if result.returncode != 0:
+            return
+        job_id = get_job_id(result.job)
+        hashes = get_golden_hashes(os.path.join(get_job_dir(result.job, work_dir), golden_dir))
+        if self.record:
+            self.content["golden"][job_id] = hashes
+            self.save()
+        elif job_id not in self.content["golden"]:
+            result.golden.append("not recorded")
+        else:
+            golden = self.content["golden"][job_id]
+            for filename in sorted(set(golden) | set(hashes)):
+                if golden.get(filename, None) != hashes.get(filename, None):
+                    result.golden.append(filename)
+
+    def get_package_changes(self):
+        # Packages whose version differs from the ones used to record the golden file.
+        changes = []
+        for package in cached_packages:
+            version = get_package_version(package)
+            if self.content["packages"].get(package, version) != version:
+                changes.append((package, self.content["packages"][package], version))
+        return changes
+
+    def save(self):
+        self.content["packages"] = {package: get_package_version(package) for package in cached_packages}
+        tmp = self.filename + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.content, f, indent=1, sort_keys=True)
+        os.replace(tmp, self.filename)
+
+
+def default_golden():
+    filename = os.environ.get("LITEX_BOARDS_GOLDEN", None)
+    if filename is None:
+        return None
+    return SweepGolden(filename, record=os.environ.get("LITEX_BOARDS_GOLDEN_RECORD", "0") not in ["", "0"])
+
+# Run ----------------------------------------------------------------------------------------------
+
+def _merge_main(args):
+    merged = merge_results(args.names)
+    if args.results is not None:
+        with open(args.results, "w") as f:
+            json.dump(merged, f, indent=1, sort_keys=True)
+    if args.costs is not None:
+        costs = SweepCosts(args.costs)
+        for job_id, result in merged["results"].items():
+            kind, name = job_id.split("/", 1)
+            costs.update(SweepResult(SweepJob(kind, name, module=None),
+                returncode = result["returncode"],
+                duration   = result["duration"],
+                cached     = result["cached"]))
+        costs.save()
+    failures = [(job_id, result) for job_id, result in sorted(merged["results"].items())
+        if result["returncode"] != 0 or result.get("golden", [])]
+    print("{}/{} jobs passed.".format(len(merged["results"]) - len(failures), len(merged["results"])))
+    for job_id, result in failures:
+        if result["returncode"]:
+            print(" - {} failed (exit code {}).".format(job_id, result["returncode"]))
+        else:
+            print(" - {} differs from golden: {}.".format(job_id, ", ".join(result["golden"])))
+    sys.exit(1 if failures else 0)
+
+def main():
+    parser = argparse.ArgumentParser(description="Elaborate LiteX-Boards platforms/targets in parallel.")
+    parser.add_argument("kind",            choices=["platforms", "targets", "merge"], help="Sweep platforms (with simple target) or targets, or merge results files.")
+    parser.add_argument("names",           nargs="*",                        help="Platforms/Targets to elaborate (default: all) or results files to merge.")
+    parser.add_argument("--jobs", "-j",    default=None, type=int,           help="Number of parallel jobs (default: number of cores).")
+    parser.add_argument("--work-dir",      default=default_work_dir,         help="Base Work directory of the jobs.")
+    parser.add_argument("--build",         action="store_true",              help="Also generate Gateware/Software sources (without compiling them).")
+    parser.add_argument("--engine",        default=None, choices=list(engines), help="Jobs engine: one interpreter per job (subprocess) or forked from a pre-initialized one (fork).")
+    parser.add_argument("--cold",          action="store_true",              help="Ignore cached results (cache is still updated).")
+    parser.add_argument("--no-cache",      action="store_true",              help="Disable results cache.")
+    parser.add_argument("--costs",         default=None,                     help="Jobs costs file (default: <work-dir>/costs.json).")
+    parser.add_argument("--shard",         default=None,                     help="Only run shard i/N of the jobs (1 <= i <= N), balanced on jobs costs.")
+    parser.add_argument("--results",       default=None,                     help="Write/Merge results to the specified JSON file.")
+    parser.add_argument("--golden",        default=None,                     help="Check generated artifacts against the specified golden JSON file.")
+    parser.add_argument("--record-golden", action="store_true",              help="Record generated artifacts to the golden file instead of checking them.")
+    parser.add_argument("--verbose", "-v", action="store_true",              help="Dump output of failing jobs.")
+    args = parser.parse_args()
+
+    if args.kind == "merge":
+        return _merge_main(args)
+
+    collect = {"platforms": collect_platforms, "targets": collect_targets}[args.kind]
+    job     = {"platforms": platform_job,      "targets": target_job}[args.kind]
+    names   = args.names or collect()
+
+    jobs  = [job(name, build=args.build) for name in names]
+    cache = None if args.no_cache else SweepCache(get_cache_filename(args.work_dir), cold=args.cold)
+    costs = SweepCosts(args.costs or get_costs_filename(args.work_dir))
+    if args.shard is not None:
+        jobs = costs.shard(jobs, *parse_shard(args.shard))
+    golden = None
+    if args.golden is not None:
+        golden = SweepGolden(args.golden, record=args.record_golden)
+        for package, old, new in golden.get_package_changes():
+            print("Warning: {} {} used for golden file, {} installed.".format(package, old, new))
+
+    results  = []
+    failures = []
+    for result in run_jobs(jobs, workers=args.jobs, work_dir=args.work_dir, engine=args.engine, cache=cache, costs=costs, golden=golden):
+        results.append(result)
+        if not result.passed:
+            failures.append(result)
+            if args.verbose:
+                sys.stderr.write(result.output)
+    if args.results is not None:
+        write_results(args.results, results)
+
+    print("{}/{} {} passed.".format(len(jobs) - len(failures), len(jobs), args.kind))
+    for result in failures:
+        if result.returncode:
+            print(" - {} failed (exit code {}).".format(result.job.name, result.returncode))
+        else:
+            print(" - {} differs from golden: {}.".format(result.job.name, ", ".join(result.golden)))
+    sys.exit(1 if failures else 0)
+
+if __name__ == "__main__":
+    main()
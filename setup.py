@@ -15,5 +15,10 @@ setup(
     license="BSD",
     python_requires="~=3.6",
     include_package_data=True,
+    package_data={
+        "litex_boards.platforms": ["index.json"],
+        "litex_boards.targets":   ["capabilities.json"],
+        "litex_boards":           ["software/liblitedram/*"],
+    },
     packages=find_packages(exclude=['test*']),
 )
@@ -0,0 +1,82 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import time
+import tempfile
+import unittest
+import threading
+from unittest import mock
+
+from litex_boards.integration.artifacts import LocalArtifactStore, HTTPArtifactStore, ArtifactHTTPServer
+from litex_boards.integration.artifacts import parse_size
+from litex_boards.integration.bitstream_cache import BitstreamCache
+
+class TestArtifacts(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.directory = os.path.join(self.tmp.name, "store")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_parse_size(self):
+        self.assertEqual(parse_size("20G"), 20*10**9)
+        self.assertEqual(parse_size("1.5MB"), 1500000)
+        self.assertEqual(parse_size(None), None)
+        with self.assertRaises(ValueError):
+            parse_size("big")
+
+    def test_local_store(self):
+        store = LocalArtifactStore(self.directory, max_size=250)
+        self.assertIsNone(store.get("objects/00/a"))
+        with self.assertRaises(ValueError):
+            store.get("../a")
+        for name in ["a", "b", "c"]:
+            store.put("objects/00/" + name, b"x"*100)
+            time.sleep(0.01)
+        # LRU: a is used, b is evicted first.
+        self.assertEqual(store.get("objects/00/a"), b"x"*100)
+        self.assertEqual(len(store.evict()), 1)
+        self.assertIsNone(store.get("objects/00/b"))
+        self.assertIsNotNone(store.get("objects/00/a"))
+        self.assertEqual(store.get_size(), 200)
+
+    def test_local_store_shared(self):
+        store = LocalArtifactStore(self.directory)
+        umask = os.umask(0o022)
+        try:
+            store.put("objects/00/a", b"a")
+        finally:
+            os.umask(umask)
+        # Readable by the other users.
+        self.assertEqual(os.stat(store.get_filename("objects/00/a")).st_mode & 0o777, 0o644)
+        # Read-only store: artifacts are still returned.
+        with mock.patch("os.utime", side_effect=PermissionError):
+            self.assertEqual(store.get("objects/00/a"), b"a")
+
+    def test_http_store(self):
+        server = ArtifactHTTPServer(LocalArtifactStore(self.directory), ("localhost", 0))
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            store = HTTPArtifactStore(server.url)
+            self.assertIsNone(store.get("entries/0.json"))
+            store.put("entries/0.json", b"{}")
+            self.assertEqual(store.get("entries/0.json"), b"{}")
+            # Bitstream Cache publication/restoration through HTTP.
+            output_dir = os.path.join(self.tmp.name, "build")
+            os.makedirs(os.path.join(output_dir, "gateware"))
+            with open(os.path.join(output_dir, "gateware", "top.bit"), "wb") as f:
+                f.write(b"bitstream")
+            cache = BitstreamCache(store)
+            cache.publish("1234", ["gateware/top.bit"], output_dir)
+            self.assertIsNone(cache.restore("5678", output_dir))
+            self.assertEqual(cache.restore("1234", os.path.join(self.tmp.name, "restore")), ["gateware/top.bit"])
+            with open(os.path.join(self.tmp.name, "restore", "gateware", "top.bit"), "rb") as f:
+                self.assertEqual(f.read(), b"bitstream")
+        finally:
+            server.shutdown()
+            server.server_close()
@@ -0,0 +1,101 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import sys
+import json
+import tempfile
+import unittest
+import subprocess
+from types import SimpleNamespace
+from unittest import mock
+
+from litex_boards.integration.artifacts import LocalArtifactStore, HTTPArtifactStore
+from litex_boards.integration.bitstream_cache import BitstreamCache, default_bitstream_cache
+
+_build_script = """
+import os, sys, json
+from litex.soc.integration.soc_core import get_mem_data
+from litex_boards.integration.builder import Builder
+from litex_boards.integration.bitstream_cache import get_build_key
+from litex_boards.targets.digilent_arty import BaseSoC
+bios_file, output_dir, cache_dir, compile_gateware = sys.argv[1:]
+soc = BaseSoC(
+    integrated_rom_init      = get_mem_data(bios_file, endianness="little"),
+    integrated_rom_size      = 0x8000,
+    integrated_main_ram_size = 0x1000,
+    ident_version            = True)
+soc.platform.toolchain.run_script = lambda script: None # No Vivado.
+builder = Builder(soc, output_dir=output_dir, compile_software=False, compile_gateware=compile_gateware == "1",
+    build_trace=False, bitstream_cache_store=cache_dir)
+builder.build()
+toolchain = soc.platform.toolchain
+key = get_build_key(toolchain, "build_" + toolchain._build_name + ".sh", builder.gateware_dir)
+print(json.dumps({"constants": list(soc.constants.keys()), "key": key}))
+"""
+
+class TestBitstreamCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def build(self, name, bios, compile_gateware=False):
+        # Generate the Gateware (with the ROM initialized from a BIOS image) of a target in a new
+        # interpreter (as a build would), return its SoC constants and Bitstream Cache key.
+        bios_file = os.path.join(self.tmp.name, name + ".bin")
+        with open(bios_file, "wb") as f:
+            f.write(bios)
+        build = subprocess.run([sys.executable, "-c", _build_script, bios_file,
+            os.path.join(self.tmp.name, name),
+            os.path.join(self.tmp.name, "cache"),
+            "1" if compile_gateware else "0"],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=True)
+        result = json.loads(build.stdout.decode().splitlines()[-1])
+        return result["constants"], result["key"]
+
+    def test_rom_key(self):
+        bios = b"\x13\x00\x00\x00"*16 + b" BIOS built on Oct 18 2026 12:34:56\n\0"
+        constants, key = self.build("a", bios)
+        # BIOS compiled without build time only when the Gateware is built (with the cache).
+        self.assertNotIn("CONFIG_BIOS_NO_BUILD_TIME", constants)
+        self.assertIn("CONFIG_BIOS_NO_BUILD_TIME", self.build("d", bios, compile_gateware=True)[0])
+        # Same ROM in another build directory: same key.
+        self.assertEqual(self.build("b", bios)[1], key)
+        # Different ROM (ex: BIOS build time): different key.
+        self.assertNotEqual(self.build("c", bios.replace(b"12:34:56", b"12:35:02"))[1], key)
+
+    def test_store_errors(self):
+        # Unreachable server and unusable directory: builds run the toolchain and succeed.
+        filename = os.path.join(self.tmp.name, "file")
+        with open(filename, "w") as f:
+            f.write("not a directory")
+        cwd = os.getcwd()
+        os.chdir(self.tmp.name)
+        try:
+            with open("build_top.sh", "w") as f:
+                f.write("true\n")
+            toolchain = SimpleNamespace(platform=SimpleNamespace(sources=[]), _build_name="top")
+            for store in [HTTPArtifactStore("http://127.0.0.1:1", timeout=5), LocalArtifactStore(filename)]:
+                runs = []
+                def run_script(script):
+                    runs.append(script)
+                    with open("top.bit", "wb") as f:
+                        f.write(b"bitstream")
+                with self.assertLogs("BitstreamCache", "WARNING") as logs:
+                    BitstreamCache(store).run_script(toolchain, run_script, "build_top.sh", self.tmp.name)
+                self.assertEqual(runs, ["build_top.sh"])
+                self.assertIn("restoration failed", logs.output[0])
+                self.assertIn("publication failed",  logs.output[1])
+        finally:
+            os.chdir(cwd)
+
+    def test_default_size(self):
+        # Bounded by default.
+        with mock.patch.dict(os.environ, {}, clear=True):
+            self.assertEqual(default_bitstream_cache(self.tmp.name).store.max_size, 20*10**9)
+        with mock.patch.dict(os.environ, {"LITEX_BOARDS_BITSTREAM_CACHE_SIZE": "1G"}):
+            self.assertEqual(default_bitstream_cache(self.tmp.name).store.max_size, 10**9)
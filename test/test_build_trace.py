@@ -0,0 +1,66 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import json
+import tempfile
+import unittest
+import subprocess
+from unittest import mock
+
+from litex_boards.integration import build_trace
+from litex_boards.integration.build_trace import BuildTrace, write_traced_script
+
+class TestBuildTrace(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.tmp.name)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def test_traced_script(self):
+        # Build script with shell compound commands (ex: Quartus with create_rbf).
+        with open("build_top.sh", "w") as f:
+            f.write("#!/usr/bin/env bash\n")
+            f.write("set -e -u -x -o pipefail\n")
+            f.write("\n")
+            f.write("touch top.sof\n")
+            f.write("if [ -f \"top.sof\" ]\n")
+            f.write("then\n")
+            f.write("    cp top.sof \\\n")
+            f.write("        top.rbf\n")
+            f.write("fi\n")
+            f.write("for f in top.rbf; do test -f $f; done\n")
+        script = write_traced_script("build_top.sh", "trace.jsonl")
+        subprocess.run(["bash", script], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        self.assertTrue(os.path.exists("top.rbf"))
+        with open("trace.jsonl") as f:
+            commands = [json.loads(line) for line in f]
+        self.assertEqual([command["command"] for command in commands], ["touch", "cp"])
+        self.assertEqual([command["returncode"] for command in commands], [0, 0])
+
+    def test_no_peak_memory(self):
+        # No resource module (Windows): stages without peak memory.
+        with mock.patch.object(build_trace, "resource", None):
+            trace = BuildTrace()
+            trace.run("software", lambda: None)
+        self.assertIsNone(trace.stages[0]["peak"])
+        trace.add_stage("software", trace.start, 1, 1024)
+        self.assertEqual(trace.stages[0]["peak"], 1024)
+
+    @unittest.skipIf(build_trace.resource is None, "No peak memory.")
+    def test_stage_peak(self):
+        # Peak memory of a stage only when reached during it.
+        size  = build_trace._max_peak(build_trace.get_peak_memory(), build_trace.get_peak_memory(children=True))
+        trace = BuildTrace()
+        trace.run("gateware", lambda: len(b"x"*(size + 100*2**20)))
+        trace.run("software", lambda: None)
+        gateware, software = trace.stages
+        self.assertGreater(gateware["peak"], size + 100*2**20)
+        self.assertIsNone(software["peak"])
+        self.assertEqual(software["peak_so_far"], gateware["peak_so_far"])
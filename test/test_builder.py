@@ -0,0 +1,29 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import unittest
+
+from litex_boards.integration.builder import get_config_id
+
+class TestBuilder(unittest.TestCase):
+    def test_config_id(self):
+        target    = "litex_boards/targets/digilent_arty.py"
+        config_id = get_config_id([target, "--sys-clk-freq", "100e6"])
+        self.assertTrue(config_id.startswith("digilent_arty-"))
+        # Actions, caches and parallelism (with their values) do not change the ID.
+        for args in [
+            ["--build", "--load", "--unique-output-dir", "--profile-elaboration", "--no-build-trace"],
+            ["--bitstream-cache", "/tmp/cache", "--bitstream-cache-size=20G", "--no-bitstream-cache", "--no-software-cache"],
+            ["--pnr-jobs", "4", "--vivado-strategy-jobs=2", "--vivado-strategy-mem", "8G", "--software-jobs", "8"],
+        ]:
+            self.assertEqual(get_config_id([target] + args + ["--sys-clk-freq", "100e6"]), config_id)
+        # Configuration does.
+        for args in [
+            ["--sys-clk-freq", "50e6"],
+            ["--sys-clk-freq", "100e6", "--with-ethernet"],
+            ["--sys-clk-freq", "100e6", "--fast-boot"],
+            ["--sys-clk-freq", "100e6", "--pnr-seeds", "4"],
+        ]:
+            self.assertNotEqual(get_config_id([target] + args), config_id)
@@ -0,0 +1,74 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import json
+import tempfile
+import unittest
+
+from litex_boards.tools import capabilities
+from litex_boards.tools.capabilities import get_target_capabilities, query, update_capabilities
+
+def get_capabilities(dram=None, ethernet=[], pcie=[], sata=[], video=[], hbm=False, options=[]):
+    modules, phys, data_width = dram or ([], [], None)
+    return {
+        "dram"     : {"modules": modules, "phys": phys, "data_width": data_width},
+        "ethernet" : {"phys": ethernet, "etherbone": False},
+        "pcie"     : [{"phy": phy, "lanes": lanes, "data_width": 64} for phy, lanes in pcie],
+        "sata"     : {"gens": sata},
+        "video"    : {"phys": video, "cores": []},
+        "hbm"      : hbm,
+        "options"  : options,
+    }
+
+_capabilities = {"version": 1, "targets": {
+    "a" : get_capabilities(dram=(["MT41K128M16"], ["A7DDRPHY"], 16), ethernet=["LiteEthPHYMII"], options=["--with-ethernet"]),
+    "b" : get_capabilities(dram=(["MT8JTF12864"], ["K7DDRPHY"], 64), pcie=[("S7PCIEPHY", 4)], sata=["gen2"]),
+    "c" : get_capabilities(dram=([], ["GENSDRPHY"], 16), video=["VideoHDMIPHY"]),
+    "d" : get_capabilities(pcie=[("USPPCIEPHY", 8)], hbm=True),
+}}
+
+class TestCapabilities(unittest.TestCase):
+    def test_extraction(self):
+        caps = get_target_capabilities("xilinx_kc705")
+        self.assertEqual(caps["platform"], "xilinx_kc705")
+        self.assertEqual(caps["dram"], {"modules": ["MT8JTF12864"], "phys": ["K7DDRPHY"], "data_width": 64})
+        self.assertEqual(caps["pcie"], [{"phy": "S7PCIEPHY", "lanes": 4, "data_width": 128}])
+        self.assertEqual(caps["sata"]["gens"], ["gen2"])
+        self.assertIn("--with-pcie", caps["options"])
+
+    def test_query(self):
+        for kwargs, names in [
+            ({},                                      ["a", "b", "c", "d"]),
+            ({"dram": ""},                            ["a", "b", "c"]),
+            ({"dram": "mt41k"},                       ["a"]),
+            ({"dram_phy": "DDRPHY"},                  ["a", "b"]),
+            ({"dram_width": 32},                      ["b"]),
+            ({"ethernet": "MII"},                     ["a"]),
+            ({"pcie": ""},                            ["b", "d"]),
+            ({"pcie_lanes": 8},                       ["d"]),
+            ({"sata": True},                          ["b"]),
+            ({"video": "hdmi"},                       ["c"]),
+            ({"hbm": True},                           ["d"]),
+            ({"options": ["--with-ethernet"]},        ["a"]),
+            ({"dram": "", "pcie": "", "sata": True},  ["b"]),
+        ]:
+            self.assertEqual(query(_capabilities, **kwargs), names, kwargs)
+
+    def test_update(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, "capabilities.json")
+            # Incremental: only stale (changed/missing) targets are regenerated, removed ones dropped.
+            with open(capabilities.capabilities_filename) as f:
+                content = json.load(f)
+            content["targets"]["removed"] = {}
+            content["targets"]["digilent_arty"]["sha256"] = "0"
+            content["targets"]["digilent_arty"]["dram"]   = {}
+            with open(filename, "w") as f:
+                json.dump(content, f)
+            updated = update_capabilities(filename)
+            self.assertNotIn("removed", updated["targets"])
+            self.assertEqual(updated["targets"]["digilent_arty"], get_target_capabilities("digilent_arty"))
+            self.assertEqual(capabilities.get_stale_targets(capabilities.load_capabilities(filename)), [])
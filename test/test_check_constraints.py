@@ -0,0 +1,90 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import sys
+import json
+import tempfile
+import unittest
+from unittest import mock
+
+from litex.build.generic_platform import *
+
+from litex_boards.integration.constraints import ConnectorMap
+from litex_boards.tools import check_constraints
+from litex_boards.tools.check_constraints import check_resources, check_connectors, get_voltage
+
+_io = [
+    ("user_led", 0, Pins("A1"), IOStandard("LVCMOS33")),
+    ("user_led", 1, Pins("A1"), IOStandard("LVCMOS33")),
+    ("serial", 0,
+        Subsignal("tx", Pins("B1"), IOStandard("LVCMOS33")),
+        Subsignal("rx", Pins("B2"), IOStandard("LVCMOS18")),
+    ),
+    # Shared MDIO bus.
+    ("eth", 0, Subsignal("mdio", Pins("C1")), Subsignal("rst_n", Pins("C2")), IOStandard("LVCMOS33")),
+    ("eth", 1, Subsignal("mdio", Pins("C1")), Subsignal("rst_n", Pins("C3")), IOStandard("LVCMOS33")),
+    ("spi", 0, Subsignal("cs_n", Pins("D1 D1")), IOStandard("LVCMOS33")),
+    ("clk", 0, Pins("E1"), IOStandard("LVCMOS33")),
+    ("clk", 0, Pins("E2"), IOStandard("LVCMOS33")),
+]
+
+_connectors = [
+    ("pmoda", "F1 F2 A1 None"),
+]
+
+def get_findings(findings):
+    return sorted((f["check"], f["severity"], tuple(f["resources"]), tuple(f["pins"])) for f in findings)
+
+class TestCheckConstraints(unittest.TestCase):
+    def test_voltage(self):
+        self.assertEqual(get_voltage("LVCMOS33"), 3.3)
+        self.assertEqual(get_voltage("SSTL15_R"), 1.5)
+        self.assertEqual(get_voltage("LVCMOS18"), 1.8)
+        self.assertEqual(get_voltage("DIFF_SSTL15"), None)
+
+    def test_resources(self):
+        connector_map = ConnectorMap(_connectors)
+        findings, used = check_resources("test", "default", _io, connector_map)
+        self.assertEqual(get_findings(findings), [
+            ("duplicate-pin",       "error",   ("spi:0",), ("D1",)),
+            ("duplicate-pin",       "error",   ("user_led:0", "user_led:1"), ("A1",)),
+            ("duplicate-resource",  "error",   ("clk:0",), ()),
+            ("iostandard-mismatch", "warning", ("serial:0",), ()),
+            ("shared-pin",          "warning", ("eth:0", "eth:1"), ("C1",)),
+        ])
+        # Connector pin also used by a fixed IO.
+        self.assertEqual(get_findings(check_connectors("test", "default", connector_map, used)), [
+            ("connector-pin-used", "warning", ("user_led:0", "user_led:1"), ("A1",)),
+        ])
+        # Extension on unconnected connector pin: warning.
+        extension = [("pmod_led", 0, Pins("pmoda:0 pmoda:3"))]
+        findings, _ = check_resources("test", "default", extension, connector_map, source="led_pmod_io(pmoda)")
+        self.assertEqual(get_findings(findings), [
+            ("unresolved-pin", "warning", ("pmod_led:0",), ("pmoda:3",)),
+        ])
+        self.assertTrue(findings[0]["message"].startswith("led_pmod_io(pmoda): "))
+
+    def test_platform(self):
+        findings = check_constraints.check_platform("digilent_arty")
+        self.assertEqual([f for f in findings if f["severity"] == "error"], [])
+
+    def test_json(self):
+        findings = check_resources("test", "default", _io, ConnectorMap(_connectors))[0]
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, "findings.json")
+            argv     = ["check_constraints", "test", "--severity=warning", "--json=" + filename]
+            with mock.patch.object(check_constraints, "check_platforms", return_value=findings), \
+                 mock.patch.object(sys, "argv", argv), \
+                 mock.patch("sys.stdout"), mock.patch("sys.stderr"), \
+                 self.assertRaises(SystemExit) as e:
+                check_constraints.main()
+            self.assertEqual(e.exception.code, 1)
+            with open(filename) as f:
+                content = json.load(f)
+        self.assertEqual(content["version"], 1)
+        self.assertEqual(len(content["findings"]), len(findings))
+        for f in content["findings"]:
+            self.assertEqual(set(f), {"platform", "variant", "check", "severity", "message", "resources", "pins"})
@@ -0,0 +1,100 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import copy
+import unittest
+
+from litex.build.generic_platform import *
+
+from litex_boards.integration.constraints import IndexedConstraintManager, ConnectorMap, PinConflictError
+
+_io = [
+    ("user_led", 0, Pins("A1")),
+    ("user_led", 1, Pins("A2")),
+    ("serial", 0,
+        Subsignal("tx", Pins("B1")),
+        Subsignal("rx", Pins("B2")),
+    ),
+    ("user_led", 2, Pins("A3")),
+]
+
+_connectors = [
+    ("pmoda", "C1 C2 None C4"),
+    ("ck_io", {"ck_io0": "D1", "ck_io1": "pmoda:1"}),
+    ("J1",    "ck_io:ck_io1 pmoda:0"),
+    ("J2",    {7: "F1", 8: "J1:0"}),
+]
+
+class TestConstraints(unittest.TestCase):
+    def check_requests(self, requests):
+        # IndexedConstraintManager must behave like LiteX's ConstraintManager.
+        cm  = ConstraintManager(_io, [])
+        icm = IndexedConstraintManager(_io, [])
+        extension = [("user_led", 3, Pins("A4")), ("user_led", 1, Pins("A5"))]
+        cm.add_extension(extension)
+        icm.add_extension(extension)
+        for name, number in requests:
+            r  = cm.request(name, number, loose=True)
+            ir = icm.request(name, number, loose=True)
+            self.assertEqual(r is None, ir is None)
+        self.assertEqual(list(cm.available), list(icm.available))
+        self.assertEqual([r for r, _ in cm.matched], [r for r, _ in icm.matched])
+        for name, number in requests:
+            self.assertEqual(cm.lookup_request(name, number, loose=True) is None,
+                            icm.lookup_request(name, number, loose=True) is None)
+
+    def test_requests(self):
+        self.check_requests([("user_led", None), ("user_led", 2), ("serial", None), ("user_led", 1)])
+        self.check_requests([("user_led", 1), ("user_led", 1), ("user_led", 1), ("user_led", None)])
+        self.check_requests([("user_led", 5), ("clk", None), ("user_led", 3)])
+
+    def test_request_errors(self):
+        icm = IndexedConstraintManager(_io, [])
+        with self.assertRaises(ConstraintError):
+            icm.request("clk")
+        icm.request("serial")
+        self.assertIsNotNone(icm.lookup_request("serial:tx"))
+        with self.assertRaises(ConstraintError):
+            icm.lookup_request("user_led", 0)
+
+    def test_copy(self):
+        icm = copy.deepcopy(IndexedConstraintManager(_io, []))
+        icm.request("user_led", 1)
+        self.assertEqual(len(icm.available), len(_io) - 1)
+
+    def test_connector_map(self):
+        cm  = ConnectorManager(_connectors)
+        cmm = ConnectorMap(_connectors)
+        identifiers = ["pmoda:0", "pmoda:3", "ck_io:ck_io0", "ck_io:ck_io1", "J1:0", "J1:1", "J2:7", "J2:8", "E1"]
+        self.assertEqual(cm.resolve_identifiers(identifiers), cmm.resolve_identifiers(identifiers))
+        self.assertEqual(cmm.get_map()["J1:0"], "C2")
+        self.assertEqual(cmm.get_map()["pmoda:2"], None)
+        with self.assertRaises(ConstraintError):
+            ConnectorMap([("J2", "J3:0")]).get_map()
+
+    def test_pin_conflicts(self):
+        extension = [("pmod_led", 0, Pins("J1:1")), ("pmod_led", 1, Pins("pmoda:0"))]
+        # Shared pins: warning.
+        icm = IndexedConstraintManager(_io, _connectors)
+        icm.add_extension(extension)
+        icm.request("pmod_led", 0)
+        with self.assertLogs("IndexedConstraintManager", level="WARNING"):
+            self.assertIsNotNone(icm.request("pmod_led", 1))
+        # Strict: error (warning with loose requests).
+        icm = IndexedConstraintManager(_io, _connectors, strict=True)
+        icm.add_extension(extension)
+        icm.request("pmod_led", 0)
+        with self.assertRaises(PinConflictError):
+            icm.request("pmod_led", 1)
+        with self.assertLogs("IndexedConstraintManager", level="WARNING"):
+            self.assertIsNotNone(icm.request("pmod_led", 1, loose=True))
+
+    def test_request_all_pin_conflict(self):
+        # A pin conflict must not be taken by request_all as the end of the resources.
+        icm = IndexedConstraintManager(_io, [], strict=True)
+        icm.add_extension([("debug", 0, Pins("A2"))])
+        icm.request("debug")
+        with self.assertRaises(PinConflictError):
+            icm.request_all("user_led")
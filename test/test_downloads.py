@@ -0,0 +1,68 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import hashlib
+import tempfile
+import unittest
+import subprocess
+from unittest import mock
+
+from litex_boards.integration import downloads
+from litex_boards.integration.downloads import DownloadCache, FileAsset, GitAsset
+
+class TestDownloads(unittest.TestCase):
+    def setUp(self):
+        self.tmp   = tempfile.TemporaryDirectory()
+        self.cache = os.path.join(self.tmp.name, "cache")
+        # File asset.
+        self.file = os.path.join(self.tmp.name, "asset.txt")
+        with open(self.file, "wb") as f:
+            f.write(b"asset")
+        # Git asset.
+        self.repo = os.path.join(self.tmp.name, "repo")
+        env = dict(os.environ, GIT_AUTHOR_NAME="a", GIT_AUTHOR_EMAIL="a@a", GIT_COMMITTER_NAME="a", GIT_COMMITTER_EMAIL="a@a")
+        subprocess.check_call(["git", "init", "-q", self.repo])
+        with open(os.path.join(self.repo, "README"), "w") as f:
+            f.write("repo")
+        subprocess.check_call(["git", "-C", self.repo, "add", "README"])
+        subprocess.check_call(["git", "-C", self.repo, "commit", "-q", "-m", "init"], env=env)
+        self.assets = mock.patch.dict(downloads.assets, {
+            "asset.txt" : FileAsset("file://" + self.file),
+            "repo"      : GitAsset("file://" + self.repo),
+        })
+        self.assets.start()
+
+    def tearDown(self):
+        self.assets.stop()
+        self.tmp.cleanup()
+
+    def test_file(self):
+        cache = DownloadCache(self.cache, offline=False)
+        dst   = cache.fetch("asset.txt", os.path.join(self.tmp.name, "build", "asset.txt"))
+        with open(dst, "rb") as f:
+            self.assertEqual(f.read(), b"asset")
+        # Pinned on first download.
+        self.assertEqual(cache.get_pin("asset.txt"), hashlib.sha256(b"asset").hexdigest())
+        # Cached file modified: SHA-256 mismatch.
+        with open(cache.get_path("asset.txt"), "wb") as f:
+            f.write(b"modified")
+        with self.assertRaises(OSError):
+            cache.fetch("asset.txt", dst)
+        # Offline: missing asset is an error.
+        with self.assertRaises(OSError):
+            DownloadCache(os.path.join(self.tmp.name, "empty"), offline=True).fetch("asset.txt", dst)
+
+    def test_git_concurrent(self):
+        # Two processes filling a cold cache: the last clone is discarded and the first one kept.
+        first  = DownloadCache(self.cache, offline=False)
+        second = DownloadCache(self.cache, offline=False)
+        first._download_git("repo")
+        second._download_git("repo")
+        git_dir = os.path.dirname(first.get_path("repo"))
+        self.assertEqual(os.listdir(git_dir), ["repo"])
+        dst = second.fetch("repo", os.path.join(self.tmp.name, "build", "repo"))
+        with open(os.path.join(dst, "README")) as f:
+            self.assertEqual(f.read(), "repo")
@@ -0,0 +1,103 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import io
+import os
+import json
+import time
+import tempfile
+import threading
+import unittest
+
+from litex_boards.tools.sweep import SweepResult
+from litex_boards.tools.farm import Farm, FarmJob, load_jobs, is_transient_failure
+
+GB = 10**9
+
+class _Farm(Farm):
+    # Jobs are not built: outputs/return codes of their attempts are given.
+    def __init__(self, jobs, outputs, **kwargs):
+        Farm.__init__(self, jobs, log=io.StringIO(), **kwargs)
+        self.outputs  = outputs
+        self.lock     = threading.Lock()
+        self.running  = []
+        self.started  = []
+        self.max_used = 0
+
+    def run_job(self, job, attempt):
+        with self.lock:
+            self.running.append(job)
+            self.started.append(job.name)
+            if len(self.running) > 1:
+                self.max_used = max(self.max_used, sum(job.memory for job in self.running))
+        time.sleep(0.05)
+        with self.lock:
+            self.running.remove(job)
+        returncode, output = self.outputs.get(job.name, [(0, "")])[attempt - 1]
+        return SweepResult(job, returncode, duration=0.05, output=output, max_rss=job.memory//2)
+
+class TestFarm(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_load_jobs(self):
+        filename = os.path.join(self.tmp.name, "jobs.json")
+        with open(filename, "w") as f:
+            json.dump({"options": ["--no-compile-software"], "jobs": [
+                {"target": "digilent_arty", "matrix": [["--variant=a7-35", "--variant=a7-100"], ["", "--with-ethernet"]]},
+                {"target": "xilinx_vcu118", "memory": "24G", "retries": 2},
+            ]}, f)
+        jobs = load_jobs(filename)
+        self.assertEqual([job.name for job in jobs], [
+            "digilent_arty-variant=a7-35",
+            "digilent_arty-variant=a7-35-with-ethernet",
+            "digilent_arty-variant=a7-100",
+            "digilent_arty-variant=a7-100-with-ethernet",
+            "xilinx_vcu118",
+        ])
+        self.assertEqual(jobs[1].args, ["--build", "--output-dir=build", "--no-compile-software", "--variant=a7-35", "--with-ethernet"])
+        self.assertEqual((jobs[4].memory, jobs[4].retries), (24*GB, 2))
+
+    def test_run(self):
+        jobs = [FarmJob(name, "digilent_arty", memory=memory*GB) for name, memory in
+            [("a", 6), ("b", 5), ("c", 3), ("d", 2), ("e", 1)]]
+        farm = _Farm(jobs, workers=4, memory=8*GB, retries=1, work_dir=self.tmp.name, outputs={
+            "b": [(1, "ERROR: out of memory"), (0, "")], # Transient: retried.
+            "c": [(1, "ERROR: syntax error")],           # Not retried.
+        })
+        summaries = farm.run()
+        # Heaviest jobs first, lighter ones filling the remaining memory.
+        self.assertEqual(farm.started[:2], ["a", "d"])
+        self.assertLessEqual(farm.max_used, 8*GB)
+        # Summaries in declaration order, with attempts and estimates (1.5x after an out of memory).
+        self.assertEqual([s["name"] for s in summaries], ["a", "b", "c", "d", "e"])
+        self.assertEqual([s["returncode"] for s in summaries], [0, 0, 1, 0, 0])
+        self.assertEqual([s["attempts"] for s in summaries], [1, 2, 1, 1, 1])
+        self.assertEqual(summaries[1]["estimate"], int(7.5*GB))
+        # Peak memory of the builds recorded for the next runs.
+        with open(os.path.join(self.tmp.name, "memory.json")) as f:
+            self.assertEqual(json.load(f)["a"], 3*GB)
+
+    def test_transient_failure(self):
+        job = FarmJob("a", "digilent_arty")
+        # Vivado log of a failing build (licenses checked out on every run): not transient.
+        vivado_log = ("INFO: [Common 17-349] Got license for feature 'Implementation' and/or device 'xc7a35t'\n"
+            "ERROR: [DRC NSTD-1] Unspecified I/O Standard: 1 out of 42 logical ports use I/O standard\n")
+        for returncode, output, transient in [
+            (1,  vivado_log, False),
+            (1,  "ERROR: [Common 17-345] A valid license was not found for feature 'Synthesis'. License checkout failed\n", True),
+            (1,  "FLEXnet Licensing error:-15,570\n", True),
+            (1,  "ERROR: connection refused\n", True),
+            (-9, "", True),
+        ]:
+            result = SweepResult(job, returncode, duration=1.0, output=output)
+            self.assertEqual(is_transient_failure(result), transient)
+        # Not retried.
+        farm = _Farm([FarmJob("a", "digilent_arty", memory=GB)], workers=1, memory=8*GB, retries=2,
+            work_dir=self.tmp.name, outputs={"a": [(1, vivado_log)]*3})
+        self.assertEqual(farm.run()[0]["attempts"], 1)
@@ -0,0 +1,49 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import unittest
+
+from migen import *
+
+from litex_boards.integration.fast_boot import BootTimeline
+
+class TestBootTimeline(unittest.TestCase):
+    def test_timeline(self):
+        event = Signal()
+        dut   = BootTimeline(events={0x80: event}, depth=4)
+        entries = []
+
+        def mark(mark_id):
+            yield dut.mark.storage.eq(mark_id)
+            yield dut.mark.re.eq(1)
+            yield
+            yield dut.mark.re.eq(0)
+            yield
+
+        def generator():
+            for i in range(10):
+                yield
+            yield from mark(1)
+            # Hardware event and software mark on the same cycle: both recorded, event only once.
+            yield event.eq(1)
+            yield from mark(2)
+            for i in range(4):
+                yield
+            yield event.eq(0)
+            yield from mark(3)
+            # Timeline full: further marks dropped.
+            yield from mark(4)
+            self.assertEqual((yield dut.count.status), 4)
+            for i in range(4):
+                yield dut.sel.storage.eq(i)
+                yield
+                entries.append(((yield dut.entry_id.status), (yield dut.entry_cycles.status)))
+
+        run_simulation(dut, generator())
+        self.assertEqual([entry_id for entry_id, _ in entries], [1, 2, 0x80, 3])
+        cycles = [entry_cycles for _, entry_cycles in entries]
+        self.assertGreaterEqual(cycles[0], 10)
+        self.assertEqual(cycles[1], cycles[2])
+        self.assertLess(cycles[2], cycles[3])
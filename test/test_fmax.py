@@ -0,0 +1,56 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import io
+import unittest
+
+from litex_boards.tools.fmax import FmaxSearch, get_grid, get_default_sys_clk_freq
+
+class _FmaxSearch(FmaxSearch):
+    # Timing met up to fmax, PLL unable to generate the infeasible frequencies, timing not reported
+    # for the unknown ones.
+    def __init__(self, fmax, infeasible=[], unknown=[], **kwargs):
+        FmaxSearch.__init__(self, "digilent_arty", log=io.StringIO(), **kwargs)
+        self.fmax       = fmax
+        self.infeasible = infeasible
+        self.unknown    = unknown
+
+    def check_pll(self, frequency):
+        return "PLL error" if frequency in self.infeasible else None
+
+    def run_target(self, frequency, build):
+        return 0
+
+    def get_timing(self, frequency):
+        if self.unknown is True or frequency in self.unknown:
+            return None, "timing not reported"
+        return (frequency <= self.fmax), ""
+
+class TestFmax(unittest.TestCase):
+    def test_helpers(self):
+        self.assertEqual(get_default_sys_clk_freq("digilent_arty"), 100e6)
+        self.assertEqual(get_grid(50e6, 60e6, 2e6), [50e6, 52e6, 54e6, 56e6, 58e6, 60e6])
+
+    def test_search(self):
+        grid = get_grid(50e6, 200e6, 1e6)
+        for jobs in [1, 3, 8]:
+            search = _FmaxSearch(fmax=137.5e6, jobs=jobs)
+            self.assertEqual(search.search(grid), 137e6)
+            # Binary search: a fraction of the grid is evaluated.
+            self.assertLess(len(search.results), len(grid)//4)
+        # Infeasible candidates do not narrow the interval.
+        search = _FmaxSearch(fmax=137.5e6, infeasible=[137e6, 150e6])
+        self.assertEqual(search.search(grid), 136e6)
+        self.assertEqual(search.results[137e6]["status"], "infeasible")
+        # No passing frequency.
+        self.assertIsNone(_FmaxSearch(fmax=10e6, jobs=2).search(grid))
+        # Timing not reported: not a pass.
+        search = _FmaxSearch(fmax=137.5e6, unknown=[200e6, 137e6], jobs=2)
+        self.assertEqual(search.search(grid), 136e6)
+        self.assertEqual(search.results[200e6]["status"], "unknown")
+        # Timing never reported: search stopped after first round.
+        search = _FmaxSearch(fmax=137.5e6, unknown=True, jobs=2)
+        self.assertIsNone(search.search(grid))
+        self.assertEqual(len(search.results), 2)
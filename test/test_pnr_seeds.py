@@ -0,0 +1,54 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import unittest
+
+from litex_boards.integration.pnr_seeds import PnRSeedSweep
+from litex_boards.integration.pnr_seeds import parse_nextpnr_fmax, parse_nextpnr_utilization, get_critical_clock
+
+# nextpnr-ecp5 log (placement and routing reports).
+nextpnr_log = """\
+Info: Device utilisation:
+Info: 	          TRELLIS_IO:    18/  365     4%
+Info: 	                DCCA:     3/   56     5%
+Info: 	           TRELLIS_SLICE:  2311/12144    19%
+Info: Max frequency for clock '$glbnet$crg_clkout': 61.35 MHz (PASS at 50.00 MHz)
+Info: Max frequency for clock '$glbnet$eth_rx_clk': 118.20 MHz (PASS at 125.00 MHz)
+Info: Device utilisation:
+Info: 	          TRELLIS_IO:    18/  365     4%
+Info: 	                DCCA:     3/   56     5%
+Info: 	           TRELLIS_SLICE:  2402/12144    19%
+Info: Max frequency for clock '$glbnet$crg_clkout': 58.02 MHz (PASS at 50.00 MHz)
+Info: Max frequency for clock '$glbnet$eth_rx_clk': 126.70 MHz (PASS at 125.00 MHz)
+"""
+
+class TestPnRSeeds(unittest.TestCase):
+    def test_parse_nextpnr(self):
+        # Last reports (after routing).
+        self.assertEqual(parse_nextpnr_fmax(nextpnr_log), {
+            "$glbnet$crg_clkout"  : (58.02,  50.0),
+            "$glbnet$eth_rx_clk" : (126.70, 125.0),
+        })
+        self.assertEqual(parse_nextpnr_utilization(nextpnr_log), {
+            "TRELLIS_IO"    : (18,   365),
+            "DCCA"          : (3,    56),
+            "TRELLIS_SLICE" : (2402, 12144),
+        })
+        self.assertEqual(parse_nextpnr_fmax(""), {})
+
+    def test_select(self):
+        results = [
+            {"seed": 1, "returncode": 0, "fmax": {"sys": (52.0, 50.0), "eth": (130.0, 125.0)}},
+            {"seed": 2, "returncode": 0, "fmax": {"sys": (61.0, 50.0), "eth": (120.0, 125.0)}},
+            {"seed": 3, "returncode": 0, "fmax": {"sys": (57.0, 50.0), "eth": (127.0, 125.0)}},
+            {"seed": 4, "returncode": 1, "fmax": {"sys": (99.0, 50.0), "eth": (200.0, 125.0)}},
+        ]
+        sweep = PnRSeedSweep(seeds=4)
+        # Critical clock: lowest achieved/constrained ratio (eth on seed 2), failing runs discarded.
+        self.assertEqual(get_critical_clock(results[:3]), "eth")
+        clock, best = sweep.select(results)
+        self.assertEqual((clock, best["seed"]), ("eth", 1))
+        self.assertIn("* seed    1", sweep.report(results, clock, best))
+        self.assertEqual(sweep.select(results[3:]), (None, None))
@@ -0,0 +1,44 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import sys
+import unittest
+import subprocess
+
+from litex_boards import platforms, targets
+
+class TestRegistries(unittest.TestCase):
+    def test_available(self):
+        for registry in [platforms, targets]:
+            names = registry.available()
+            files = [f[:-3] for f in os.listdir(os.path.dirname(registry.__file__))
+                if f.endswith(".py") and not f.startswith("_")]
+            self.assertEqual(names, sorted(files))
+            self.assertNotIn("__init__", names)
+            # Copy returned.
+            names.append("test")
+            self.assertNotIn("test", registry.available())
+
+    def test_get(self):
+        self.assertEqual(platforms.get("digilent_arty").__name__, "litex_boards.platforms.digilent_arty")
+        self.assertIs(platforms.digilent_arty, platforms.get("digilent_arty"))
+        self.assertIs(targets.digilent_arty, targets.get("digilent_arty"))
+        self.assertIn("digilent_arty", dir(platforms))
+        with self.assertRaises(ValueError):
+            platforms.get("unknown")
+        with self.assertRaises(AttributeError):
+            targets.unknown
+
+    def test_lazy(self):
+        # Listing does not import platforms/targets.
+        script = "\n".join([
+            "import sys",
+            "from litex_boards import platforms, targets",
+            "platforms.available(), targets.available()",
+            "print(any(m.startswith(('litex_boards.platforms.', 'litex_boards.targets.')) for m in sys.modules))",
+        ])
+        output = subprocess.check_output([sys.executable, "-c", script])
+        self.assertEqual(output.decode().strip(), "False")
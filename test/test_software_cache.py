@@ -0,0 +1,61 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from litex_boards.integration.software_cache import run_compiler, default_software_cache_size
+
+class TestSoftwareCacheSize(unittest.TestCase):
+    def test_default_size(self):
+        # Bounded by default.
+        with mock.patch.dict(os.environ, {}, clear=True):
+            self.assertEqual(default_software_cache_size(), "2G")
+        with mock.patch.dict(os.environ, {"LITEX_BOARDS_SOFTWARE_CACHE_SIZE": "500M"}):
+            self.assertEqual(default_software_cache_size(), "500M")
+            self.assertEqual(default_software_cache_size("1G"), "1G")
+
+@unittest.skipIf(shutil.which("cc") is None, "No C compiler.")
+class TestSoftwareCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp   = tempfile.TemporaryDirectory()
+        self.cache = os.path.join(self.tmp.name, "cache")
+        self.log   = os.path.join(self.tmp.name, "log")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def compile(self, build, flags=[], cache=None, header="#define VALUE 1\n"):
+        # Compile a source including a header in a build directory, return the cache status.
+        build = os.path.join(self.tmp.name, build)
+        os.makedirs(os.path.join(build, "include"), exist_ok=True)
+        with open(os.path.join(build, "include", "value.h"), "w") as f:
+            f.write(header)
+        with open(os.path.join(build, "main.c"), "w") as f:
+            f.write("#include <value.h>\nint value(void) { return VALUE; }\n")
+        output = os.path.join(build, "main.o")
+        args   = ["cc", "-c", "-MD", "-I" + os.path.join(build, "include")] + flags + [os.path.join(build, "main.c"), "-o", output]
+        self.assertEqual(run_compiler(args, cache or self.cache, self.log), 0)
+        self.assertTrue(os.path.exists(output))
+        self.assertTrue(os.path.exists(os.path.join(build, "main.d")))
+        with open(self.log) as f:
+            return f.read().splitlines()[-1].split()[0]
+
+    def test_key(self):
+        self.assertEqual(self.compile("a"), "miss")
+        # Same source/header/flags from another build directory.
+        self.assertEqual(self.compile("b"), "hit")
+        # Different flags or header.
+        self.assertEqual(self.compile("c", flags=["-O2"]), "miss")
+        self.assertEqual(self.compile("d", header="#define VALUE 2\n"), "miss")
+
+    def test_unwritable_cache(self):
+        cache = os.path.join(self.tmp.name, "file")
+        with open(cache, "w") as f:
+            f.write("not a directory")
+        self.assertEqual(self.compile("a", cache=cache), "miss")
@@ -0,0 +1,105 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import io
+import os
+import json
+import argparse
+import tempfile
+import unittest
+import contextlib
+
+from litex_boards.tools import sweep
+
+class TestSweep(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def get_sources(self, job):
+        return [os.path.relpath(source, sweep.litex_boards_dir) for source in sweep.get_job_sources(job)]
+
+    def test_job_sources(self):
+        # Target: Target, its Platform and the modules the Platform imports (daughterboard).
+        sources = self.get_sources(sweep.target_job("qmtech_10cl006"))
+        for source in ["targets/qmtech_10cl006.py", "platforms/qmtech_10cl006.py",
+            "platforms/qmtech_daughterboard.py", "integration/builder.py"]:
+            self.assertIn(source, sources)
+        self.assertEqual(len(sources), len(set(sources)))
+        # Platform: Simple target and the Platform.
+        sources = self.get_sources(sweep.platform_job("digilent_arty"))
+        self.assertIn("targets/simple.py",         sources)
+        self.assertIn("platforms/digilent_arty.py", sources)
+        self.assertNotIn("platforms/qmtech_daughterboard.py", sources)
+
+    def test_job_key(self):
+        key = sweep.get_job_key(sweep.target_job("digilent_arty"))
+        self.assertEqual(sweep.get_job_key(sweep.target_job("digilent_arty")), key)
+        self.assertNotEqual(sweep.get_job_key(sweep.target_job("digilent_arty", ["--with-ethernet"])), key)
+        self.assertNotEqual(sweep.get_job_key(sweep.platform_job("digilent_arty")), key)
+
+    def test_shard(self):
+        filename = os.path.join(self.tmp.name, "costs.json")
+        with open(filename, "w") as f:
+            json.dump({"targets/a": 10, "targets/b": 6, "targets/c": 5, "targets/d": 4, "targets/e": 1}, f)
+        costs = sweep.SweepCosts(filename)
+        jobs  = [sweep.SweepJob("targets", name, module=None) for name in "abcdef"]
+        # Longest first, unknown jobs (f) estimated with the median cost.
+        self.assertEqual(costs.get(jobs[5]), 5)
+        self.assertEqual([job.name for job in costs.schedule(jobs)], ["a", "b", "c", "f", "d", "e"])
+        # Longest-Processing-Time: balanced shards, each job in one shard.
+        shards = [[job.name for job in costs.shard(jobs, i, 2)] for i in [1, 2]]
+        self.assertEqual(shards, [["a", "f", "e"], ["b", "c", "d"]])
+        with self.assertRaises(ValueError):
+            sweep.parse_shard("3/2")
+
+    def test_golden_normalization(self):
+        headers = [
+            b"// Auto-generated by Migen (9a0be7a) & LiteX (60b3345) on 2022-12-07 10:12:33\n",
+            b"// Auto-generated by Migen (0000000) & LiteX (--------) on 2023-01-01 00:00:00\n",
+            b"// Auto-generated by LiteX (60b3345) on 2022-12-07 10:12:33\n",
+        ]
+        for header in headers:
+            self.assertEqual(sweep.normalize_golden(header, self.tmp.name), b"// Auto-generated by LiteX on <date>\n")
+
+    def test_golden(self):
+        work_dir = os.path.join(self.tmp.name, "work")
+        filename = os.path.join(self.tmp.name, "golden.json")
+        def result(name, csr):
+            job = sweep.SweepJob("targets", name, module=None)
+            golden_dir = os.path.join(sweep.get_job_dir(job, work_dir), sweep.golden_dir)
+            os.makedirs(golden_dir, exist_ok=True)
+            with open(os.path.join(golden_dir, "csr.csv"), "w") as f:
+                f.write(csr)
+            return sweep.SweepResult(job, returncode=0, duration=1.0)
+        sweep.SweepGolden(filename, record=True).process(result("a", "csr_base,uart,0xf0001000\n"), work_dir)
+        golden = sweep.SweepGolden(filename)
+        for name, csr, differences in [
+            ("a", "csr_base,uart,0xf0001000\n", []),
+            ("a", "csr_base,uart,0xf0002000\n", ["csr.csv"]),
+            ("b", "csr_base,uart,0xf0001000\n", ["not recorded"]),
+        ]:
+            r = result(name, csr)
+            golden.process(r, work_dir)
+            self.assertEqual(r.golden, differences)
+            self.assertEqual(r.passed, not differences)
+
+    def test_merge(self):
+        # Shards results with golden differences: merge fails.
+        shards = []
+        for i, (name, golden) in enumerate([("a", []), ("b", ["csr.csv"])]):
+            result = sweep.SweepResult(sweep.SweepJob("targets", name, module=None), returncode=0, duration=1.0)
+            result.golden = golden
+            shards.append(os.path.join(self.tmp.name, "results{}.json".format(i)))
+            sweep.write_results(shards[-1], [result])
+        args   = argparse.Namespace(names=shards, results=None, costs=None)
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output), self.assertRaises(SystemExit) as e:
+            sweep._merge_main(args)
+        self.assertEqual(e.exception.code, 1)
+        self.assertIn("1/2 jobs passed.", output.getvalue())
+        self.assertIn("targets/b differs from golden: csr.csv.", output.getvalue())
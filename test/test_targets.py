@@ -5,80 +5,75 @@
 # This file is Copyright (c) 2019 Tim 'mithro' Ansell <me@mith.ro>
 # SPDX-License-Identifier: BSD-2-Clause
 
-import subprocess
 import unittest
-import os
 
 from migen import *
 
 from litex.soc.integration.builder import *
 
+from litex_boards.tools import sweep
+from litex_boards.tools import index
+from litex_boards.tools import capabilities
+
+# Note: Jobs are elaborated in parallel on a pool of workers (one per core by default), the number
+# of workers can be set with the LITEX_BOARDS_JOBS environment variable. Each job runs in its own
+# work directory (build/sweep/<kind>/<name>); with LITEX_BOARDS_BUILD=1, jobs also generate their
+# Gateware/Software sources there, to a unique output directory per configuration. With
+# LITEX_BOARDS_ENGINE=fork, jobs are forked from an interpreter with heavy dependencies pre-imported.
+# Passing jobs are cached on a hash of their inputs and replayed when unchanged; use
+# LITEX_BOARDS_CACHE=cold to force a full run or LITEX_BOARDS_CACHE=0 to disable the cache.
+# Jobs are run longest first from their historical cost (LITEX_BOARDS_COSTS, default:
+# build/sweep/costs.json); with LITEX_BOARDS_SHARD=i/N only shard i of N balanced shards is run and
+# with LITEX_BOARDS_RESULTS=<file>, results are written to a file that can be merged with others:
+# python3 -m litex_boards.tools.sweep merge <files>.
+# With LITEX_BOARDS_GOLDEN=<file>, generated CSR map/headers/Verilog are checked against golden
+# hashes (recorded with LITEX_BOARDS_GOLDEN_RECORD=1).
+
 class TestTargets(unittest.TestCase):
-    excluded_platforms = [
-        "qmtech_daughterboard",              # Reason: Not a real platform.
-        "quicklogic_quickfeather",           # Reason: No default clock.
-        "efinix_titanium_ti60_f225_dev_kit", # Reason: Require Efinity toolchain.
-        "efinix_trion_t120_bga576_dev_kit",  # Reason: Require Efinity toolchain.
-        "efinix_trion_t20_bga256_dev_kit",   # Reason: Require Efinity toolchain.
-        "efinix_trion_t20_mipi_dev_kit",     # Reason: Require Efinity toolchain.
-        "efinix_xyloni_dev_kit",             # Reason: Require Efinity toolchain.
-        "sipeed_tang_primer",                # Reason: Require Anlogic toolchain.
-        "jungle_electronics_fireant",        # Reason: Require Efinity toolchain.
-        "efinix_t8f81_dev_kit",              # Reason: Require Efinity toolchain.
-        "adi_plutosdr",                      # Reason: No default clock.
-    ]
-    excluded_targets   = [
-        "simple",                            # Reason: Generic target.
-        "quicklogic_quickfeather",           # Reason: No default clock.
-        "efinix_titanium_ti60_f225_dev_kit", # Reason: Require Efinity toolchain.
-        "efinix_trion_t120_bga576_dev_kit",  # Reason: Require Efinity toolchain.
-        "efinix_trion_t20_bga256_dev_kit",   # Reason: Require Efinity toolchain.
-        "efinix_trion_t20_mipi_dev_kit",     # Reason: Require Efinity toolchain.
-        "efinix_xyloni_dev_kit",             # Reason: Require Efinity toolchain.
-        "sipeed_tang_primer",                # Reason: Require Anlogic toolchain.
-        "jungle_electronics_fireant",        # Reason: Require Efinity toolchain.
-        "efinix_t8f81_dev_kit",              # Reason: Require Efinity toolchain.
-    ]
+    excluded_platforms = sweep.excluded_platforms
+    excluded_targets   = sweep.excluded_targets
+
+    def run_jobs(self, jobs):
+        # Run jobs with sweep settings from environment.
+        costs   = sweep.default_costs()
+        jobs    = sweep.default_shard(jobs, costs)
+        results = []
+        for result in sweep.run_jobs(jobs, cache=sweep.default_cache(), costs=costs, golden=sweep.default_golden()):
+            results.append(result)
+            yield result
+        if sweep.default_results() is not None:
+            sweep.write_results(sweep.default_results(), results)
+
+    # Check that the static platforms index is up to date.
+    def test_platforms_index(self):
+        stale = index.get_stale_platforms(index.load_index())
+        self.assertEqual(stale, [], msg="Run: python3 -m litex_boards.tools.index update")
+
+    # Check that the static targets capabilities index is up to date.
+    def test_targets_capabilities(self):
+        stale = capabilities.get_stale_targets(capabilities.load_capabilities())
+        self.assertEqual(stale, [], msg="Run: python3 -m litex_boards.tools.capabilities update")
 
     # Build simple design for all platforms.
     def test_platforms(self):
         # Collect platforms.
-        platforms = []
-        for file in os.listdir("./litex_boards/platforms/"):
-            if file.endswith(".py"):
-                file = file.replace(".py", "")
-                if file not in ["__init__"] + self.excluded_platforms:
-                    platforms.append(file)
+        platforms = sweep.collect_platforms(excluded=self.excluded_platforms)
 
         # Test platforms with simple design.
-        for name in platforms:
-            with self.subTest(platform=name):
-                os.system("rm -rf build")
-                cmd = """\
-python3 -m litex_boards.targets.simple litex_boards.platforms.{} \
-    --no-compile       \
-    --uart-name="stub" \
-""".format(name)
-                subprocess.check_call(cmd, shell=True)
+        jobs = [sweep.platform_job(name, build=sweep.default_build()) for name in platforms]
+        for result in self.run_jobs(jobs):
+            with self.subTest(platform=result.job.name):
+                self.assertEqual(result.returncode, 0, msg=result.output)
+                self.assertEqual(result.golden, [], msg="Differs from golden artifacts.")
 
     # Build default configuration for all targets.
     def test_targets(self):
         # Collect targets.
-        targets = []
-        for file in os.listdir("./litex_boards/targets/"):
-            if file.endswith(".py"):
-                file = file.replace(".py", "")
-                if file not in ["__init__"] + self.excluded_targets:
-                    targets.append(file)
+        targets = sweep.collect_targets(excluded=self.excluded_targets)
 
         # Test targets.
-        for name in targets:
-            with self.subTest(target=name):
-                os.system("rm -rf build")
-                cmd = """\
-python3 -m litex_boards.targets.{} \
-    --cpu-type=vexriscv     \
-    --cpu-variant=minimal   \
-    --no-compile            \
-""".format(name)
-                subprocess.check_call(cmd, shell=True)
+        jobs = [sweep.target_job(name, build=sweep.default_build()) for name in targets]
+        for result in self.run_jobs(jobs):
+            with self.subTest(target=result.job.name):
+                self.assertEqual(result.returncode, 0, msg=result.output)
+                self.assertEqual(result.golden, [], msg="Differs from golden artifacts.")
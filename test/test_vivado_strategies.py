@@ -0,0 +1,134 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import sys
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+from litex_boards.integration.vivado_strategies import VivadoStrategySweep, parse_strategies, vivado_strategies, run_command
+from litex_boards.integration.vivado_strategies import parse_vivado_timing, parse_vivado_clocks, parse_vivado_utilization
+
+# Vivado report_timing_summary report (excerpt).
+timing_report = """\
+------------------------------------------------------------------------------------------------
+| Design Timing Summary
+| ---------------------
+------------------------------------------------------------------------------------------------
+
+    WNS(ns)      TNS(ns)  TNS Failing Endpoints  TNS Total Endpoints      WHS(ns)      THS(ns)  THS Failing Endpoints  THS Total Endpoints     WPWS(ns)     TPWS(ns)  TPWS Failing Endpoints  TPWS Total Endpoints
+    -------      -------  ---------------------  -------------------      -------      -------  ---------------------  -------------------     --------     --------  ----------------------  --------------------
+     -0.412       -3.150                     12                 9512        0.051        0.000                      0                 9512        3.750        0.000                       0                  3780
+
+
+Timing constraints are not met.
+
+
+------------------------------------------------------------------------------------------------
+| Clock Summary
+| -------------
+------------------------------------------------------------------------------------------------
+
+Clock               Waveform(ns)       Period(ns)      Frequency(MHz)
+-----               ------------       ----------      --------------
+clk100              {0.000 5.000}      10.000          100.000
+  builder_mmcm_fb   {0.000 5.000}      10.000          100.000
+  main_crg_clkout0  {0.000 4.000}      8.000           125.000
+eth_rx_clk          {0.000 20.000}     40.000          25.000
+
+
+------------------------------------------------------------------------------------------------
+| Intra Clock Table
+| -----------------
+------------------------------------------------------------------------------------------------
+
+Clock               WNS(ns)      TNS(ns)  TNS Failing Endpoints  TNS Total Endpoints      WHS(ns)      THS(ns)  THS Failing Endpoints  THS Total Endpoints     WPWS(ns)     TPWS(ns)  TPWS Failing Endpoints  TPWS Total Endpoints
+-----               -------      -------  ---------------------  -------------------      -------      -------  ---------------------  -------------------     --------     --------  ----------------------  --------------------
+clk100                                                                                                                                                            3.000        0.000                       0                     1
+  builder_mmcm_fb                                                                                                                                                 8.751        0.000                       0                     2
+  main_crg_clkout0       -0.412       -3.150                     12                 9412        0.051        0.000                      0                 9412        3.750        0.000                       0                  3740
+eth_rx_clk              30.000        0.000                      0                  100        0.120        0.000                      0                  100       19.500        0.000                       0                    40
+"""
+
+# Vivado report_utilization report (excerpt).
+utilization_report = """\
+1. Slice Logic
+--------------
+
++----------------------------+------+-------+-----------+-------+
+|          Site Type         | Used | Fixed | Available | Util% |
++----------------------------+------+-------+-----------+-------+
+| Slice LUTs*                | 2711 |     0 |     20800 | 13.03 |
+|   LUT as Logic             | 2539 |     0 |     20800 | 12.21 |
+| Slice Registers            | 2642 |     0 |     41600 |  6.35 |
++----------------------------+------+-------+-----------+-------+
+
+3. Memory
+---------
+
++-------------------+------+-------+-----------+-------+
+|     Site Type     | Used | Fixed | Available | Util% |
++-------------------+------+-------+-----------+-------+
+| Block RAM Tile    |  7.5 |     0 |        50 | 15.00 |
+|   RAMB18          |    1 |     0 |       100 |  1.00 |
++-------------------+------+-------+-----------+-------+
+"""
+
+class TestVivadoStrategies(unittest.TestCase):
+    def test_parse_strategies(self):
+        self.assertEqual(parse_strategies("default, explore"), ["default", "explore"])
+        self.assertEqual(parse_strategies("all"), list(vivado_strategies.keys()))
+        with self.assertRaises(ValueError):
+            parse_strategies("fastest")
+
+    def test_parse_vivado_timing(self):
+        self.assertEqual(parse_vivado_timing(timing_report), (-0.412, -3.150, 0.051))
+        self.assertIsNone(parse_vivado_timing(""))
+
+    def test_parse_vivado_clocks(self):
+        clocks = parse_vivado_clocks(timing_report)
+        # Clocks with setup paths only (not clk100/builder_mmcm_fb).
+        self.assertEqual(sorted(clocks.keys()), ["eth_rx_clk", "main_crg_clkout0"])
+        self.assertAlmostEqual(clocks["main_crg_clkout0"][0], 1e3/8.412)
+        self.assertAlmostEqual(clocks["main_crg_clkout0"][1], 125.0)
+        self.assertAlmostEqual(clocks["eth_rx_clk"][0], 100.0)
+
+    def test_parse_vivado_utilization(self):
+        utilization = parse_vivado_utilization(utilization_report)
+        self.assertEqual(utilization["Slice LUTs"],      (2711, 20800))
+        self.assertEqual(utilization["Slice Registers"], (2642, 41600))
+        self.assertEqual(utilization["Block RAM Tile"],  (7.5, 50))
+        self.assertEqual(utilization["RAMB18"],          (1, 100))
+        self.assertNotIn("Site Type", utilization)
+
+    def test_write_strategy_error(self):
+        # Toolchain's directives restored when the project generation fails.
+        def build_project():
+            raise OSError("build_project")
+        toolchain = SimpleNamespace(_build_name="top", build_project=build_project,
+            opt_directive                        = "default",
+            vivado_place_directive               = "default",
+            vivado_post_place_phys_opt_directive = None,
+            vivado_route_directive               = "default",
+            vivado_post_route_phys_opt_directive = "default")
+        directives = dict(vars(toolchain))
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp:
+            os.chdir(tmp)
+            try:
+                with self.assertRaises(OSError):
+                    VivadoStrategySweep(["explore"]).write_strategy(toolchain, "build_top.sh", "explore", 1)
+            finally:
+                os.chdir(cwd)
+        self.assertEqual(vars(toolchain), directives)
+
+    @unittest.skipIf(not hasattr(os, "wait4"), "No peak memory.")
+    def test_run_command_peak(self):
+        # Peak memory of the command only (not of previous children).
+        self.assertEqual(run_command([sys.executable, "-c", "b = bytearray(300*2**20)"])[0], 0)
+        returncode, peak = run_command([sys.executable, "-c", "import sys; sys.exit(3)"])
+        self.assertEqual(returncode, 3)
+        self.assertLess(peak, 200*2**20)